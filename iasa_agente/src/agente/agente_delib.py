@@ -31,12 +31,16 @@ class AgenteDelib(Agente):
     - O código comportamental foi implementado a partir do já existente AgenteReact,
     adaptando-o para um agente deliberativo
     """
-    def __init__(self):
+    def __init__(self, planeador = None):
         """
         Inicializa o agente com arquitetura deliberativa básica:
         - Controlo deliberativo com planeador baseado em PEE
         - Capacidades de perceção e atuação herdadas de Agente
 
+        Parâmetros:
+        - planeador: planeador a utilizar, por omissão PlaneadorPee; pode ser um
+        PlaneadorDLite, que reutiliza o planeamento anterior ao replanear
+
         Funcionamento:
         1. Inicializa componente base (Agente)
         2. Configura o ciclo deliberativo com:
@@ -44,7 +48,8 @@ class AgenteDelib(Agente):
            - ControloDelib para gestão do processo
         """
         super().__init__()  # Inicializa a classe base Agente
-        self.__controlo = ControloDelib(PlaneadorPee())  # Mecanismo de deliberação
+        planeador = planeador if planeador is not None else PlaneadorPee()
+        self.__controlo = ControloDelib(planeador)  # Mecanismo de deliberação
 
     def executar(self):
         """
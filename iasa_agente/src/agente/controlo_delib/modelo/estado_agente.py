@@ -1,3 +1,5 @@
+import weakref
+
 from mod.estado import Estado
 
 class EstadoAgente(Estado):
@@ -12,16 +14,42 @@ class EstadoAgente(Estado):
     a ControloDelib e a ModeloMundo
     - P4-iasa-proj.pdf, página 4: este diagrama mostra que EstadoAgente herda de Estado e
     que está diretamente associado a Posicao, presente na package sae
+
+    Existe uma única instância por posição (flyweight): EstadoAgente(posicao) devolve o estado
+    já criado para essa posição, pelo que o modelo do mundo, os operadores, as procuras e os
+    PDM partilham os mesmos objetos; cada estado guarda o hash da posição, calculado uma vez,
+    e a igualdade entre estados é normalmente uma comparação de identidade
+
+    A tabela de estados canónicos tem referências fracas, pelo que um estado deixa de ocupar
+    memória quando já nenhum modelo o usa, e cada subclasse tem a sua própria tabela
     """
-    def __init__(self, posicao):
+    __slots__ = ("__posicao", "__hash", "__weakref__")
+
+    __estados = weakref.WeakValueDictionary() #estado canónico de cada posição
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__estados = weakref.WeakValueDictionary()
+
+    def __new__(cls, posicao):
         """
-        Inicializa um novo estado do agente com uma posição específica
+        Obtém o estado do agente com uma posição específica, criando-o se ainda não existir
         
         Parâmetros:
         - posicao - par coordenado (x,y) representando a posição no ambiente
         """
-        self.__posicao = posicao
-    
+        estado = cls.__estados.get(posicao)
+        if estado is None:
+            estado = super().__new__(cls)
+            estado.__posicao = posicao
+            estado.__hash = hash(posicao)
+            cls.__estados[posicao] = estado
+        return estado
+
+    def __getnewargs__(self):
+        #permite copiar e serializar (pickle) o estado, obtendo a instância canónica da posição
+        return (self.__posicao,)
+
     def id_valor(self):
         """
         Implementa o contrato da classe base Estado, gerando um identificador único para o estado
@@ -29,7 +57,22 @@ class EstadoAgente(Estado):
         Retorno:
         - int - valor hash calculado a partir da posição do agente
         """
-        return hash(self.__posicao)
+        return self.__hash
+
+    def __hash__(self):
+        return self.__hash
+
+    def __eq__(self, other):
+        """
+        Igualdade entre estados: como existe uma instância por posição, a comparação de
+        identidade resolve quase todos os casos; caso contrário, compara as posições (e não
+        os hash, que podem colidir)
+        """
+        if self is other:
+            return True
+        if isinstance(other, EstadoAgente):
+            return self.__posicao == other.__posicao
+        return NotImplemented
     
     @property
     def posicao(self):
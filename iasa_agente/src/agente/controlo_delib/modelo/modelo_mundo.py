@@ -13,6 +13,8 @@ class ModeloMundo(ModeloPlan):
         Atributos:
         - __estado_agente: representa o estado atual do agente, contendo a sua posição
         - __estados: lista de todos os estados válidos no ambiente
+        - __indice: map de posições (x,y) livres para o estado válido correspondente, usado
+        nas consultas de pertença e de vizinhos em tempo constante
         - __elementos: map de posições (x,y) para os elementos do ambiente
         - __operadores: lista de operadores de movimento disponíveis (um para cada direção)
         - __alterado: flag que indica se o modelo foi alterado desde a última atualização
@@ -33,6 +35,7 @@ class ModeloMundo(ModeloPlan):
         """
         self.__estado_agente = None
         self.__estados = []
+        self.__indice = {}
         self.__elementos = {}
         self.__operadores = [OperadorMover(self, direccao) for direccao in Direccao]
         #self - está a passar a própria instância do modelo de mundo, ou seja, os operadores
@@ -100,7 +103,7 @@ class ModeloMundo(ModeloPlan):
         2. Compara os elementos percebidos com os atuais para detetar mudanças
         3. Se houve mudanças:
             - Atualiza o map de elementos
-            - Reconstrói a lista de estados válidos
+            - Reconstrói a lista de estados válidos e o índice de posições livres
             - Marca o modelo como alterado
         
         Exercício da aula de 03/06:
@@ -111,11 +114,37 @@ class ModeloMundo(ModeloPlan):
         self.__estado_agente = EstadoAgente(percepcao.posicao)
         if self.estado_inicial is None:
             self.estado_inicial = EstadoAgente(percepcao.posicao)
-        self.__alterado = self.__elementos != percepcao.elementos
+        #os elementos percebidos são o mesmo objeto enquanto não mudarem (ver MapaPercepcao),
+        #pelo que a comparação dos dicionários só é feita quando o mapa percebido muda
+        elementos = percepcao.elementos
+        self.__alterado = elementos is not self.__elementos and self.__elementos != elementos
         if self.__alterado:
-            self.__elementos = percepcao.elementos
+            self.__elementos = elementos
             self.__estados = [EstadoAgente(posicao)
                               for posicao in percepcao.posicoes]
+            self.__indice = {estado.posicao: estado for estado in self.__estados}
+
+    def vizinhos(self, estado):
+        """
+        Obtém os estados válidos adjacentes a um estado, alcançáveis por um operador
+
+        Parâmetros:
+        - estado - estado de origem
+
+        Retorno:
+        - lista de pares (operador, estado sucessor), pela ordem dos operadores, sendo o
+        sucessor a instância guardada em `obter_estados`
+
+        Funcionamento:
+        - A posição de destino de cada operador é procurada no índice de posições livres,
+        em tempo constante, em vez de percorrer a lista de estados
+        """
+        vizinhos = []
+        for operador in self.__operadores:
+            estado_suc = self.__indice.get(operador.destino(estado).posicao)
+            if estado_suc is not None:
+                vizinhos.append((operador, estado_suc))
+        return vizinhos
 
     def mostrar(self, vista):
         """
@@ -147,7 +176,9 @@ class ModeloMundo(ModeloPlan):
     def __contains__(self, estado): #implementação do operador in
         #retorna True or False, caso o estado passado como parâmetro
         #esteja contido na lista de estados
-        return estado in self.__estados
+        #a procura é feita no índice de posições livres (tempo constante), e não na lista,
+        #pois é invocado por OperadorMover.aplicar para cada sucessor gerado no planeamento
+        return estado.posicao in self.__indice
 
     @property
     def alterado(self):
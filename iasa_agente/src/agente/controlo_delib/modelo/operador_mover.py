@@ -1,9 +1,9 @@
 import math
 from agente.controlo_delib.modelo.estado_agente import EstadoAgente
-from mod.operador import Operador
+from mod.operador_reversivel import OperadorReversivel
 from sae.agente.accao import Accao
 
-class OperadorMover(Operador):
+class OperadorMover(OperadorReversivel):
     """
     Implementa um operador de movimento para agentes em ambientes discretos 2D (espaços cartesianos),
     especializando a interface Operador
@@ -18,6 +18,7 @@ class OperadorMover(Operador):
     e ModeloMundo, e ainda que OperadorMover realiza o contrato da interface Operador
     - P4-iasa-proj.pdf, página 5: a simulação do movimento é feita por translação
     geométrica
+    - O movimento é reversível: o movimento na direção oposta desfaz-o, com o mesmo custo
     - Os métodos foram implementados com oritentação do professor
     """
     def __init__(self, modelo_mundo, direccao):
@@ -33,27 +34,45 @@ class OperadorMover(Operador):
         - __direccao - direção do movimento
         - __ang - ângulo correspondente à direção
         - __accao - ação concreta associada ao operador
+        - __inverso - operador de movimento na direção oposta, criado quando necessário
         """
         self.__modelo_mundo = modelo_mundo
         self.__direccao = direccao
         self.__ang = self.__direccao.value
         self.__accao = Accao(self.__direccao)
+        self.__inverso = None
     
     def aplicar(self, estado):
         """
         Método para aplicar o operador, gerando o estado sucessor
         """
-        nova_posicao = self.__translacao(estado.posicao, self.__accao.passo, self.__ang)
-        novo_estado = EstadoAgente(nova_posicao)
+        novo_estado = self.destino(estado)
         if novo_estado in self.__modelo_mundo:
             return novo_estado
 
+    def destino(self, estado):
+        """
+        Método para obter o estado resultante do movimento (translação da posição), sem
+        verificar se é um estado válido do modelo do mundo
+        """
+        nova_posicao = self.__translacao(estado.posicao, self.__accao.passo, self.__ang)
+        return EstadoAgente(nova_posicao)
+
     def custo(self, estado, estado_suc):
         """
         Método para calcular custo de transição
         """
         return max(1, math.dist(estado.posicao, estado_suc.posicao))
 
+    def inverso(self):
+        """
+        Método para obter o operador de movimento na direção oposta
+        (rotação de 180º da direção deste operador)
+        """
+        if self.__inverso is None:
+            self.__inverso = OperadorMover(self.__modelo_mundo, self.__direccao.rodar(2))
+        return self.__inverso
+
     def __translacao(self, posicao, dist_desl, ang_desl):
         """
         Método para calcular a nova posição após uma translação
@@ -22,6 +22,7 @@ class Estado(ABC):
        - Contém mecanismos de identificação única
 
     """
+    __slots__ = () #permite que as subclasses que definem __slots__ não tenham __dict__
 
     #segundo o diagrama do slide 3 do P3-iasa-proj, este método é abstrato e retorna o valor do estado
     @abstractmethod
@@ -53,5 +54,7 @@ class Estado(ABC):
         - Comparação direta de configurações
         - Atualização da fronteira de procura
         """
+        if self is other: #o mesmo objeto (ex: estados partilhados) dispensa o cálculo do hash
+            return True
         if isinstance(other, Estado): #se o outro objeto for uma instância de estado
             return self.__hash__() == other.__hash__() #compara-se os hash de cada instância
\ No newline at end of file
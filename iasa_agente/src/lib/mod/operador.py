@@ -51,4 +51,23 @@ class Operador(ABC):
         esta classe ser abstrata, permitindo as diferentes implementações nas
         classes concretas
         """
-        pass
\ No newline at end of file
+        pass
+
+    def destino(self, estado):
+        """
+        Obtém o estado que resultaria da aplicação do operador, sem verificar se é um estado
+        válido do modelo (por exemplo, se a posição resultante está livre)
+
+        Parâmetros:
+        - estado - estado atual ao qual o operador seria aplicado
+
+        Retorno:
+        - Estado - estado resultante, ou None se não for possível determiná-lo
+
+        Funcionamento:
+        - Por omissão, corresponde a aplicar(); os operadores cuja aplicação consiste em
+        calcular o estado resultante e verificar se é válido no modelo podem redefinir este
+        método, permitindo que a validação seja feita de uma só vez para vários estados (ex:
+        TransicoesPlan, com um dicionário dos estados válidos)
+        """
+        return self.aplicar(estado)
\ No newline at end of file
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from mod.operador import Operador
+
+class OperadorReversivel(Operador, ABC):
+    """
+    Interface para operadores cujo efeito pode ser desfeito por um operador inverso
+
+    Para qualquer estado s em que o operador é aplicável, com s' = aplicar(s), o operador
+    inverso é aplicável em s' e inverso().aplicar(s') == s, com o mesmo custo de transição
+
+    Os operadores reversíveis permitem gerar os antecessores de um estado, sendo
+    necessários, por exemplo, na procura bidirecional, em que a procura também é
+    realizada a partir do estado objetivo em direção ao estado inicial
+
+    Fundamentação teórica:
+    - 10-pee-1.pdf, página 27: em problemas com ações reversíveis, os estados podem ser
+      alcançados nos dois sentidos
+    """
+    @abstractmethod
+    def inverso(self):
+        """
+        Obtém o operador inverso
+
+        Retorno:
+        - Operador - operador que desfaz o efeito deste operador
+        """
+        pass
\ No newline at end of file
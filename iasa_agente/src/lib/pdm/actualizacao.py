@@ -0,0 +1,28 @@
+from enum import Enum
+
+class Actualizacao(Enum):
+    """
+    Esquemas de atualização das utilidades na Iteração de Valor (MecUtil)
+
+    - JACOBI: em cada iteração, todos os estados são atualizados, pela ordem de S(), a partir
+      das utilidades da iteração anterior (atualização síncrona, algoritmo original)
+    - GAUSS_SEIDEL: em cada iteração, todos os estados são atualizados, pela ordem de S(),
+      usando de imediato as utilidades já atualizadas nessa iteração (atualização no local)
+    - PRIORIDADE: varrimento por prioridades; é atualizado sempre o estado com maior resíduo
+      de Bellman, |maxₐ Q(s,a) - U(s)|, sendo recalculados apenas os resíduos dos seus
+      antecessores, até nenhum resíduo exceder delta_max
+    - TOPOLOGICA: como GAUSS_SEIDEL, mas os estados são percorridos do objetivo para fora, por
+      ordem crescente do número de transições até um estado terminal (sem ações), de modo a que
+      cada estado seja atualizado depois dos sucessores mais próximos do objetivo
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 35: iteração de valor com critério de paragem baseado em delta
+    - Moore e Atkeson (1993), "Prioritized Sweeping: Reinforcement Learning with Less Data and
+      Less Time": atualização por ordem de prioridade, propagada aos antecessores
+    - Wingate e Seppi (2005), "Prioritization Methods for Accelerating MDP Solvers":
+      atualização no local (Gauss-Seidel), por prioridades e por ordenação dos estados
+    """
+    JACOBI = "jacobi"
+    GAUSS_SEIDEL = "gauss_seidel"
+    PRIORIDADE = "prioridade"
+    TOPOLOGICA = "topologica"
\ No newline at end of file
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+@dataclass
+class EstatisticasUtil:
+    """
+    Estatísticas do último cálculo de utilidades de um mecanismo de Iteração de Valor
+
+    Permitem comparar os esquemas de atualização (ver Actualizacao) num mesmo modelo: o custo
+    de cada iteração é dominado pelo número de atualizações de Bellman (maxₐ Q(s,a)) calculadas
+    """
+    iteracoes: int = 0 # Varrimentos completos dos estados (em PRIORIDADE, apenas o cálculo inicial dos resíduos)
+    actualizacoes: int = 0 # Atualizações de Bellman calculadas (incluindo cálculos de resíduos)
+    tempo_total: float = 0.0 # Tempo de cálculo das utilidades (segundos)
+    estados_podados: int = 0 # Estados excluídos do cálculo pela poda (ver Poda)
+    convergiu: bool = False # Critério de paragem satisfeito (False se o cálculo foi interrompido, ver PDM.resolver)
+    tempo_politica: float = 0.0 # Tempo de cálculo da política a partir das utilidades (segundos, ver PDM.politica)
\ No newline at end of file
@@ -0,0 +1,260 @@
+try:
+    import numpy as np
+except ImportError: #NumPy é opcional; sem NumPy a avaliação da política é iterativa, em Python
+    np = None
+try:
+    from scipy.sparse import csr_matrix, identity
+    from scipy.sparse.linalg import spsolve
+except ImportError: #SciPy é opcional; sem SciPy o sistema é resolvido como matriz densa (NumPy)
+    spsolve = None
+
+from time import perf_counter
+
+from pdm.estatisticas_util import EstatisticasUtil
+from pdm.mec_util_vect import MecUtilVect
+
+class MecPol(MecUtilVect):
+    """
+    Mecanismo de cálculo de utilidades por Iteração de Política, sobre um modelo compilado
+    (ModeloPDMComp), com a mesma interface de MecUtil
+
+    Em vez de iterar as utilidades até convergirem, alterna duas fases:
+    - Avaliação da política: cálculo da utilidade de cada estado seguindo a política atual π,
+      U(s) = Σ T(s,π(s),s')[R(s,π(s),s') + γU(s')]; como π está fixa, não há maximização e as
+      equações são lineares, (I - γT_π)U = R_π, sendo resolvidas de forma exata
+    - Melhoria da política: π(s) passa a ser a ação com maior utilidade esperada, dadas as
+      utilidades avaliadas; a ação atual só é substituída se outra for melhor
+
+    Termina quando a política não muda, o que acontece num número reduzido de iterações,
+    normalmente muito inferior ao número de iterações da Iteração de Valor
+
+    Com avaliacoes = k, realiza Iteração de Política Modificada: a avaliação é aproximada por k
+    iterações da equação de avaliação, a partir das utilidades anteriores, e o critério de paragem
+    é o da Iteração de Valor (delta_max); com k = 0 corresponde à Iteração de Valor
+
+    A avaliação exata usa a resolução de sistemas esparsos do SciPy, se disponível, ou a resolução
+    de sistemas densos do NumPy; sem NumPy, a política é avaliada por iterações sucessivas até as
+    utilidades variarem menos de PRECISAO
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 26: princípio da solução ótima e equações de Bellman
+    - 15-pds.pdf, página 35: iteração de valor, com critério de paragem baseado em delta
+    - Howard (1960), "Dynamic Programming and Markov Processes": iteração de política
+    - Puterman e Shin (1978), "Modified Policy Iteration Algorithms for Discounted Markov
+      Decision Problems": iteração de política modificada
+    """
+    PRECISAO = 1e-9 # Variação máxima das utilidades na avaliação iterativa (sem NumPy)
+
+    def __init__(self, modelo_comp, gama, delta_max, avaliacoes = None):
+        """
+        Inicializa o mecanismo
+
+        Parâmetros:
+        - modelo_comp: ModeloPDMComp, modelo do PDM compilado
+        - gama: fator de desconto para recompensas futuras (γ ∈ [0,1[; com γ = 1 a avaliação exata
+        requer que todas as políticas alcancem um estado terminal)
+        - delta_max: limiar de convergência da Iteração de Política Modificada
+        - avaliacoes: None para Iteração de Política (avaliação exata); número de iterações de
+        avaliação por melhoria da política, para Iteração de Política Modificada
+        """
+        super().__init__(modelo_comp, gama, delta_max)
+        self.__avaliacoes = avaliacoes
+
+    def iterar(self, U_inicial = None):
+        """
+        Calcula a utilidade ótima para todos os estados usando Iteração de Política, devolvendo o
+        controlo após cada melhoria da política (ver MecUtilVect.iterar); `utilidade` percorre
+        todas as iterações
+
+        Parâmetros:
+        - U_inicial: dicionário {estado: utilidade} com as utilidades iniciais da Iteração de
+        Política Modificada (ver MecUtil.utilidade); na Iteração de Política, a avaliação exata
+        não depende de utilidades iniciais, pelo que são ignoradas
+
+        Retorno:
+        - gerador de tuplos (iteração, delta, tempo), sendo delta a variação máxima das utilidades
+        nessa iteração; as utilidades (com avaliação exata, as da política atual) estão disponíveis
+        em `utilidade_actual`
+
+        Funcionamento:
+        - A política inicial leva cada estado a um estado terminal pelo menor número de transições
+        (ver __politica_inicial); os estados restantes recebem a política gananciosa para as
+        utilidades da política inicial
+        - Em `estatisticas`, as iterações são as melhorias da política e as atualizações incluem
+        as atualizações de Bellman da melhoria e as iterações de avaliação aproximada
+        """
+        self._estatisticas = EstatisticasUtil()
+        inicio = perf_counter()
+        self._U = self._utilidade_inicial(U_inicial)
+        self._guardar_q(None)
+        iteracoes = self.__iteracao_politica() if self.__avaliacoes is None else self.__iteracao_politica_mod()
+        for iteracao, (delta, convergiu) in enumerate(iteracoes, 1):
+            self._estatisticas.tempo_total = perf_counter() - inicio
+            self._estatisticas.convergiu = bool(convergiu)
+            yield iteracao, float(delta), self._estatisticas.tempo_total
+
+    def __iteracao_politica(self):
+        """
+        Iteração de Política: avaliação exata e melhoria, até a política não mudar; gerador que
+        devolve (delta, convergiu) após cada melhoria
+        """
+        politica = self.__politica_inicial() #índice do par (s, a) escolhido em cada estado
+        while True:
+            U_ant, self._U = self._U, self.__resolver(politica)
+            estavel = self.__melhorar(self._U, politica)[1]
+            yield max((abs(u - v) for u, v in zip(self._U, U_ant)), default=0), estavel
+            if estavel:
+                break
+
+    def __iteracao_politica_mod(self):
+        """
+        Iteração de Política Modificada: melhoria e avaliação aproximada, até delta não exceder
+        delta_max; gerador que devolve (delta, convergiu) após cada melhoria
+        """
+        n = self._modelo.num_estados
+        politica = self.__politica_inicial()
+        while True:
+            U_novo, _ = self.__melhorar(self._U, politica)
+            delta = max((abs(u - v) for u, v in zip(U_novo, self._U)), default=0)
+            self._U = np.asarray(U_novo) if np is not None else U_novo
+            yield delta, delta <= self.delta_max
+            if delta <= self.delta_max:
+                break
+            for _ in range(self.__avaliacoes):
+                self._U = self.__avaliar(politica, self._U)
+                self._estatisticas.actualizacoes += n
+
+    def __politica_inicial(self):
+        """
+        Política inicial, obtida por procura em largura a partir dos estados terminais (sem
+        ações), seguindo as transições com probabilidade não nula no sentido inverso; cada
+        estado alcançado fica com o primeiro par (s, a) encontrado que o leva a um estado já
+        alcançado
+
+        Retorno:
+        - list: par (s, a) de cada estado, ou None nos estados sem ações ou que não alcançam
+        nenhum estado terminal
+
+        Funcionamento:
+        - Num modelo determinista em que a recompensa é obtida ao alcançar um estado terminal,
+        como ModeloPDMPlan, esta é a política ótima (percurso mais curto), pelo que a Iteração
+        de Política termina após a primeira avaliação; partindo da política gananciosa para
+        utilidades nulas, cada iteração apenas estenderia a política ótima aos estados a mais
+        uma transição do objetivo
+        """
+        modelo = self._modelo
+        inicio_estado, inicio_par = modelo.inicio_estado, modelo.inicio_par
+        suc, prob = modelo.trans_suc, modelo.trans_prob
+        n = modelo.num_estados
+        antecessores = [[] for _ in range(n)]
+        for i in range(n):
+            for k in range(inicio_estado[i], inicio_estado[i + 1]):
+                for t in range(inicio_par[k], inicio_par[k + 1]):
+                    if prob[t] > 0:
+                        antecessores[suc[t]].append((i, k))
+        politica = [None] * n
+        fila = [i for i in range(n) if inicio_estado[i] == inicio_estado[i + 1]]
+        alcancados = [False] * n
+        for j in fila:
+            alcancados[j] = True
+        for j in fila: #a lista cresce durante o ciclo (fila da procura em largura)
+            for i, k in antecessores[j]:
+                if not alcancados[i]:
+                    alcancados[i] = True
+                    politica[i] = k
+                    fila.append(i)
+        return politica
+
+    def __melhorar(self, U, politica):
+        """
+        Melhoria da política, dadas as utilidades
+
+        Parâmetros:
+        - U: utilidades, indexadas por estado
+        - politica: par (s, a) escolhido em cada estado, alterado no local
+
+        Retorno:
+        - tuplo: (utilidades maxₐ Q(s,a) de cada estado, True se a política não mudou)
+
+        Funcionamento:
+        - A ação atual só é substituída se a nova ação tiver utilidade superior, com uma
+        tolerância relativa que evita alternar entre ações com a mesma utilidade devido a
+        erros de arredondamento
+        - Os valores Q calculados ficam guardados para a tabela Q (ver MecUtilVect.tabela_q)
+        """
+        Q = self._util_accoes(U)
+        self._guardar_q(Q)
+        inicio_estado = self._modelo.inicio_estado
+        U_max = []
+        estavel = True
+        for i, actual in enumerate(politica):
+            inicio, fim = inicio_estado[i], inicio_estado[i + 1]
+            if inicio == fim:
+                U_max.append(0)
+                continue
+            melhor = max(range(inicio, fim), key=Q.__getitem__)
+            U_max.append(Q[melhor])
+            if actual is None or Q[actual] < Q[melhor] - 1e-12 * (1 + abs(Q[melhor])):
+                politica[i] = melhor
+                estavel = False
+        self._estatisticas.iteracoes += 1
+        self._estatisticas.actualizacoes += len(politica)
+        return U_max, estavel
+
+    def __transicoes(self, politica):
+        """
+        Transições da política: para cada transição do par escolhido em cada estado, o estado
+        de origem, o estado sucessor e a probabilidade; e a recompensa esperada de cada estado
+
+        Retorno:
+        - tuplo: (origens, sucessores, probabilidades, recompensas), vetores NumPy
+        """
+        n = self._modelo.num_estados
+        estado_par = np.full(self._modelo.num_pares, -1, dtype=np.intp)
+        for i, par in enumerate(politica):
+            if par is not None:
+                estado_par[par] = i
+        origem = estado_par[self._par]
+        escolhida = origem >= 0
+        origem, prob = origem[escolhida], self._prob[escolhida]
+        recompensa = np.bincount(origem, weights=prob * self._rec[escolhida], minlength=n)
+        return origem, self._suc[escolhida], prob, recompensa
+
+    def __avaliar(self, politica, U):
+        """
+        Uma iteração da equação de avaliação da política, U(s) ← R_π(s) + γ Σ T_π(s,s')U(s')
+        """
+        if np is not None:
+            origem, sucessor, prob, recompensa = self.__transicoes(politica)
+            return recompensa + self.gama * np.bincount(origem, weights=prob * U[sucessor],
+                                                        minlength=self._modelo.num_estados)
+        modelo, gama = self._modelo, self.gama
+        inicio_par, suc, prob, rec = modelo.inicio_par, modelo.trans_suc, modelo.trans_prob, modelo.trans_rec
+        return [0 if par is None else
+                sum(prob[t] * (rec[t] + gama * U[suc[t]]) for t in range(inicio_par[par], inicio_par[par + 1]))
+                for par in politica]
+
+    def __resolver(self, politica):
+        """
+        Avaliação exata da política: resolve (I - γT_π)U = R_π
+        """
+        n = self._modelo.num_estados
+        if np is None:
+            U = [0] * n
+            while True:
+                U_novo = self.__avaliar(politica, U)
+                delta = max((abs(u - v) for u, v in zip(U_novo, U)), default=0)
+                U = U_novo
+                if delta <= self.PRECISAO:
+                    return U
+        origem, sucessor, prob, recompensa = self.__transicoes(politica)
+        if spsolve is not None:
+            T_pi = csr_matrix((prob, (origem, sucessor)), shape=(n, n))
+            return spsolve((identity(n, format="csr") - self.gama * T_pi).tocsc(), recompensa)
+        A = np.eye(n)
+        np.add.at(A, (origem, sucessor), -self.gama * prob)
+        return np.linalg.solve(A, recompensa)
+
+    @property
+    def avaliacoes(self):
+        return self.__avaliacoes
\ No newline at end of file
@@ -0,0 +1,229 @@
+import random
+from time import perf_counter
+
+from pdm.estatisticas_util import EstatisticasUtil
+
+class MecRTDP:
+    """
+    Mecanismo de cálculo de utilidades por Programação Dinâmica em Tempo Real com etiquetagem
+    (Labeled RTDP, LRTDP), que calcula a utilidade e a política apenas nos estados alcançáveis
+    a partir do estado do agente seguindo a política ótima
+
+    Em vez de atualizar todos os estados em cada iteração (Iteração de Valor), são realizadas
+    simulações (trials) a partir do estado do agente: em cada estado visitado é feita a
+    atualização de Bellman, é escolhida a ação com maior utilidade esperada e o estado seguinte
+    é amostrado de acordo com T(s, a, s'). As utilidades dos estados ainda não visitados são
+    dadas por uma heurística que não subestima a utilidade ótima (limite superior), pelo que a
+    ação escolhida só leva a estados pouco promissores enquanto a sua utilidade não for corrigida
+
+    No fim de cada simulação, os estados visitados são verificados pela ordem inversa: um estado
+    fica resolvido (etiquetado) quando o resíduo de Bellman de todos os estados alcançáveis pela
+    política atual é inferior a epsilon; os estados resolvidos não voltam a ser visitados. O
+    cálculo termina quando o estado inicial fica resolvido ou quando se esgota o orçamento (tempo
+    ou número de atualizações), podendo ser retomado em chamadas seguintes, pois as utilidades,
+    a política e as etiquetas são mantidas
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 26: princípio da solução ótima e equações de Bellman
+    - 15-pds.pdf, página 35: atualização de Bellman U(s) ← maxₐ Σ T(s,a,s')[R(s,a,s') + γU(s')]
+    - Barto, Bradtke e Singh (1995), "Learning to Act Using Real-Time Dynamic Programming"
+    - Bonet e Geffner (2003), "Labeled RTDP: Improving the Convergence of Real-Time Dynamic
+      Programming"
+    """
+    def __init__(self, modelo, gama, heuristica, epsilon = 1e-3, tempo_max = None,
+                 actualizacoes_max = None, profundidade_max = 1000, semente = None, U_inicial = None):
+        """
+        Inicializa o mecanismo
+
+        Parâmetros:
+        - modelo: ModeloPDM com A(s) e transicoes(s, a)
+        - gama: fator de desconto para recompensas futuras (γ ∈ [0,1])
+        - heuristica: função estado -> utilidade inicial, que não deve subestimar a utilidade
+        ótima; os estados sem ações têm sempre utilidade 0
+        - epsilon: resíduo de Bellman máximo para um estado ser considerado resolvido
+        - tempo_max: tempo máximo (segundos) de cada chamada a resolver, ou None (sem limite)
+        - actualizacoes_max: número máximo de atualizações de Bellman de cada chamada a
+        resolver, ou None (sem limite)
+        - profundidade_max: número máximo de estados visitados em cada simulação
+        - semente: semente do gerador de números aleatórios usado na amostragem dos sucessores
+        - U_inicial: dicionário {estado: utilidade} com utilidades iniciais (ex: de um planeamento
+        anterior), usadas em vez da heurística; tal como a heurística, não devem subestimar as
+        utilidades ótimas
+        """
+        self.__modelo = modelo
+        self.__gama = gama
+        self.__heuristica = heuristica
+        self.__epsilon = epsilon
+        self.__tempo_max = tempo_max
+        self.__actualizacoes_max = actualizacoes_max
+        self.__profundidade_max = profundidade_max
+        self.__aleatorio = random.Random(semente)
+        self.__utilidade = dict(U_inicial or {})
+        self.__politica = {}
+        self.__resolvidos = set()
+        self.__estatisticas = EstatisticasUtil()
+
+    def resolver(self, estado):
+        """
+        Realiza simulações a partir do estado até este ficar resolvido ou se esgotar o orçamento
+
+        Parâmetros:
+        - estado: estado inicial das simulações (estado do agente)
+
+        Retorno:
+        - True se o estado ficou resolvido (política ótima, a menos de epsilon, em todos os
+        estados alcançáveis a partir dele), False se o orçamento se esgotou antes
+
+        Funcionamento:
+        - Em `estatisticas`, as iterações são as simulações e as atualizações são as
+        atualizações de Bellman (incluindo as das verificações de resolução)
+        - A ação do estado na política é sempre atualizada, mesmo com o orçamento esgotado
+        """
+        self.__estatisticas = EstatisticasUtil()
+        inicio = perf_counter()
+        while estado not in self.__resolvidos and not self.__esgotado(inicio):
+            self.__simular(estado)
+            self.__estatisticas.iteracoes += 1
+        if estado not in self.__resolvidos:
+            self.__actualizar(estado)
+        self.__estatisticas.tempo_total = perf_counter() - inicio
+        return estado in self.__resolvidos
+
+    def __esgotado(self, inicio):
+        if self.__tempo_max is not None and perf_counter() - inicio >= self.__tempo_max:
+            return True
+        return self.__actualizacoes_max is not None and self.__estatisticas.actualizacoes >= self.__actualizacoes_max
+
+    def __simular(self, estado):
+        """
+        Simulação a partir do estado, seguida da verificação de resolução dos estados
+        visitados, pela ordem inversa
+        """
+        visitados = []
+        s = estado
+        while s is not None and s not in self.__resolvidos and len(visitados) < self.__profundidade_max:
+            visitados.append(s)
+            if not self.__modelo.A(s):
+                break
+            self.__actualizar(s)
+            s = self.__amostrar(s, self.__politica[s])
+        while visitados:
+            if not self.__verificar(visitados.pop()):
+                break
+
+    def __amostrar(self, s, a):
+        """
+        Estado seguinte amostrado de acordo com T(s, a, s'), ou None se a ação não tiver sucessores
+        """
+        transicoes = self.__modelo.transicoes(s, a)
+        x = self.__aleatorio.random()
+        for sn, prob, _ in transicoes:
+            x -= prob
+            if x < 0:
+                return sn
+        return transicoes[-1][0] if transicoes else None
+
+    def __verificar(self, estado):
+        """
+        Verifica se o estado está resolvido: percorre os estados alcançáveis pela política atual
+        que ainda não estão resolvidos; se todos tiverem resíduo inferior a epsilon, ficam
+        resolvidos, caso contrário são atualizados pela ordem inversa (CheckSolved, LRTDP)
+        """
+        if estado in self.__resolvidos:
+            return True
+        resolvido = True
+        abertos = [estado]
+        fechados = []
+        vistos = {estado}
+        while abertos:
+            s = abertos.pop()
+            fechados.append(s)
+            if not self.__modelo.A(s):
+                continue
+            if self.__residuo(s) > self.__epsilon:
+                resolvido = False
+                continue
+            for sn, prob, _ in self.__modelo.transicoes(s, self.__politica[s]):
+                if prob > 0 and sn not in self.__resolvidos and sn not in vistos:
+                    vistos.add(sn)
+                    abertos.append(sn)
+        if resolvido:
+            self.__resolvidos.update(fechados)
+        else:
+            while fechados:
+                s = fechados.pop()
+                if self.__modelo.A(s):
+                    self.__actualizar(s)
+        return resolvido
+
+    def __residuo(self, s):
+        """
+        Resíduo de Bellman do estado, atualizando a sua utilidade e a sua ação na política
+        """
+        u = self.__obter_utilidade(s)
+        return abs(self.__actualizar(s) - u)
+
+    def __actualizar(self, s):
+        """
+        Atualização de Bellman do estado: U(s) ← maxₐ Q(s,a), sendo π(s) a primeira ação
+        com utilidade máxima
+        """
+        accoes = self.__modelo.A(s)
+        self.__estatisticas.actualizacoes += 1
+        if not accoes:
+            self.__utilidade[s] = 0
+            return 0
+        melhor, u = None, None
+        for a in accoes:
+            q = self.util_accao(s, a)
+            if u is None or q > u:
+                melhor, u = a, q
+        self.__utilidade[s] = u
+        self.__politica[s] = melhor
+        return u
+
+    def __obter_utilidade(self, s):
+        u = self.__utilidade.get(s)
+        if u is None:
+            u = self.__utilidade[s] = self.__heuristica(s) if self.__modelo.A(s) else 0
+        return u
+
+    def util_accao(self, s, a):
+        """
+        Utilidade esperada da ação a no estado s, Σ T(s,a,s')[R(s,a,s') + γU(s')], com as
+        utilidades dos estados ainda não visitados dadas pela heurística
+        """
+        return sum(prob * (rec + self.__gama * self.__obter_utilidade(sn))
+                   for sn, prob, rec in self.__modelo.transicoes(s, a))
+
+    def resolvido(self, estado):
+        return estado in self.__resolvidos
+
+    @property
+    def utilidade(self):
+        """
+        Utilidades dos estados visitados (dicionário atualizado no local)
+        """
+        return self.__utilidade
+
+    @property
+    def politica(self):
+        """
+        Política parcial, nos estados atualizados (dicionário atualizado no local)
+        """
+        return self.__politica
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas da última chamada a resolver (EstatisticasUtil)
+        """
+        return self.__estatisticas
+
+    @property
+    def gama(self):
+        return self.__gama
+
+    @property
+    def epsilon(self):
+        return self.__epsilon
\ No newline at end of file
@@ -1,3 +1,11 @@
+from heapq import heappop, heappush
+from itertools import count
+from time import perf_counter
+
+from pdm.actualizacao import Actualizacao
+from pdm.estatisticas_util import EstatisticasUtil
+from pdm.tabela_q import TabelaQ
+
 class MecUtil:
     """
     Mecanismo de cálculo de utilidades para Processos de Decisão de Markov (PDM)
@@ -8,7 +16,7 @@ class MecUtil:
     - Página 28: mostra o cálculo iterativo da utilidade
     - Página 26: cálculo da utilidade máxima de um estado com base nas utilidades esperadas das ações possíveis
     """
-    def __init__(self, modelo, gama, delta_max):
+    def __init__(self, modelo, gama, delta_max, actualizacao = Actualizacao.JACOBI):
         """
         Inicializa o mecanismo de cálculo de utilidades
 
@@ -16,6 +24,8 @@ class MecUtil:
         - modelo: ModeloPDM contendo S(), A(s), T(s,a,s'), R(s,a,s') e suc(s,a)
         - gama: fator de desconto para recompensas futuras (γ ∈ [0,1])
         - delta_max: limiar de convergência para parada do algoritmo
+        - actualizacao: esquema de atualização das utilidades (ver Actualizacao); por omissão,
+        atualização síncrona (JACOBI), como no algoritmo original
 
         Fundamentação teórica (15-pds.pdf):
         - Página 16: o fator de desconto representa o impacto do decurso do tempo na 
@@ -27,8 +37,13 @@ class MecUtil:
         self.__gama = gama
         self.__delta_max = delta_max
         self.__modelo = modelo
+        self.__actualizacao = actualizacao
+        self.__estatisticas = EstatisticasUtil()
+        self.__antecessores = None #calculados apenas quando necessários (PRIORIDADE, TOPOLOGICA)
+        self.__U = {} #utilidades do último cálculo, atualizadas no local (ver iterar)
+        self.__tabela_q = None #valores Q da última iteração (JACOBI) ou das utilidades finais (ver tabela_q)
 
-    def utilidade(self):
+    def utilidade(self, U_inicial = None):
         """
         Calcula a utilidade ótima para todos os estados usando Iteração de Valor
 
@@ -43,6 +58,11 @@ class MecUtil:
         nas transições de estado
         - Serve de base para calcular a política ótima
 
+        Parâmetros:
+        - U_inicial: dicionário {estado: utilidade} com as utilidades iniciais (ex: utilidades
+        calculadas num planeamento anterior); os estados em falta começam com 0. Por omissão,
+        todos os estados começam com 0
+
         Retorno:
         - Dicionário {estado: utilidade} com os valores ótimos
 
@@ -58,18 +78,209 @@ class MecUtil:
         - Repete as atualizações de utilidade usando a equação de Bellman até que a 
         variação máxima entre iterações (delta) seja inferior ao limiar `delta_max` (15-pds.pdf, página 35)
         - Para cada estado, escolhe a ação com maior utilidade esperada e atualiza `U(s)` com esse valor máximo
+        - A ordem e o momento das atualizações dependem do esquema de atualização (ver Actualizacao);
+        o número de iterações, de atualizações e o tempo de cálculo ficam em `estatisticas`
+        - Com utilidades iniciais, o critério de paragem é o mesmo: a iteração de valor é uma
+        contração de fator γ, pelo que converge a partir de quaisquer utilidades iniciais e, quando
+        a variação máxima não excede delta_max, o erro em relação à utilidade ótima não excede
+        delta_max·γ/(1-γ), tal como partindo de 0
+        - Corresponde a percorrer todas as iterações de `iterar`
         """
-        S, A = self.__modelo.S, self.__modelo.A
-        U = {s: 0 for s in S()}
+        for _ in self.iterar(U_inicial):
+            pass
+        return self.__U
+
+    def iterar(self, U_inicial = None):
+        """
+        Calcula a utilidade iterativamente, como `utilidade`, devolvendo o controlo após cada iteração
+
+        Parâmetros:
+        - U_inicial: utilidades iniciais (ver utilidade)
+
+        Retorno:
+        - gerador de tuplos (iteração, delta, tempo), com o número da iteração (a partir de 1), a
+        variação máxima das utilidades nessa iteração e o tempo decorrido desde o início (segundos);
+        em PRIORIDADE, que não tem iterações sobre todos os estados, cada iteração corresponde a
+        |S| atualizações, sendo delta a maior variação entre elas
+        - o gerador termina após a iteração em que delta não excede delta_max (em PRIORIDADE,
+        quando nenhum resíduo excede delta_max)
+
+        Funcionamento:
+        - As utilidades são atualizadas no local, estando disponíveis em `utilidade_actual` entre
+        iterações; interromper o gerador (ex: ao esgotar o tempo disponível) deixa as utilidades
+        da última iteração, que podem ser usadas para obter a melhor política até ao momento
+        """
+        self.__estatisticas = EstatisticasUtil()
+        inicio = perf_counter()
+        U_inicial = U_inicial or {}
+        self.__U = U = {s: U_inicial.get(s, 0) for s in self.__modelo.S()}
+        self.__tabela_q = None
+        if self.__actualizacao is Actualizacao.GAUSS_SEIDEL:
+            iteracoes = self.__utilidade_gauss_seidel(U, list(self.__modelo.S()))
+        elif self.__actualizacao is Actualizacao.TOPOLOGICA:
+            iteracoes = self.__utilidade_gauss_seidel(U, self.__ordem_topologica())
+        elif self.__actualizacao is Actualizacao.PRIORIDADE:
+            iteracoes = self.__utilidade_prioridade(U)
+        else:
+            iteracoes = self.__utilidade_jacobi(U)
+        for iteracao, (delta, convergiu) in enumerate(iteracoes, 1):
+            self.__estatisticas.tempo_total = perf_counter() - inicio
+            self.__estatisticas.convergiu = convergiu
+            yield iteracao, delta, self.__estatisticas.tempo_total
+
+    def __utilidade_jacobi(self, U):
+        """
+        Iteração de valor com atualização síncrona: cada iteração usa apenas as utilidades
+        da iteração anterior (U_ant)
+
+        Os métodos de cálculo (__utilidade_*) atualizam U no local e são geradores, devolvendo
+        (delta, convergiu) após cada iteração (ver iterar)
+
+        Os valores Q(s,a) de cada iteração, calculados a partir de U_ant, são guardados numa
+        TabelaQ, pelo que no fim U(s) = maxₐ Q(s,a) da tabela da última iteração
+        """
+        S, A, util_accao = self.__modelo.S, self.__modelo.A, self.util_accao
+        estados = list(S())
+        accoes_estado = [A(s) for s in estados]
+        inicio, accoes = [0], []
+        for accoes_s in accoes_estado:
+            accoes.extend(accoes_s)
+            inicio.append(len(accoes))
         while True: #do while (emulado com ciclo infinito + break)
             U_ant = U.copy() #guardar utilidades anteriores
             delta = 0
-            for s in S():
-                U[s] = max([self.util_accao(s, a, U_ant) for a in A(s)], default=0)
+            valores = []
+            for s, accoes_s in zip(estados, accoes_estado):
+                q = [util_accao(s, a, U_ant) for a in accoes_s]
+                valores.extend(q)
+                U[s] = max(q, default=0)
                 delta = max(delta, abs(U[s] - U_ant[s]))
+            self.__estatisticas.actualizacoes += len(estados)
+            self.__estatisticas.iteracoes += 1
+            self.__tabela_q = TabelaQ(estados, inicio, accoes, valores)
+            yield delta, delta <= self.__delta_max
+            if delta <= self.__delta_max:
+                break
+
+    def __utilidade_gauss_seidel(self, U, estados):
+        """
+        Iteração de valor com atualização no local: cada estado é atualizado com as utilidades
+        mais recentes, incluindo as já calculadas na própria iteração
+
+        Parâmetros:
+        - U: utilidades iniciais, atualizadas no local
+        - estados: ordem pela qual os estados são atualizados em cada iteração
+        """
+        while True:
+            delta = 0
+            for s in estados:
+                u = self.__util_estado(s, U)
+                delta = max(delta, abs(u - U[s]))
+                U[s] = u
+            self.__estatisticas.iteracoes += 1
+            self.__tabela_q = None
+            yield delta, delta <= self.__delta_max
             if delta <= self.__delta_max:
                 break
-        return U
+
+    def __utilidade_prioridade(self, U):
+        """
+        Iteração de valor por varrimento com prioridades
+
+        Funcionamento:
+        - Calcula o resíduo de Bellman de todos os estados; os estados com resíduo superior a
+        delta_max são inseridos numa fila de prioridade (maior resíduo primeiro), juntamente
+        com a utilidade calculada
+        - Retira da fila o estado com maior resíduo e atribui-lhe a utilidade calculada; como
+        só as utilidades dos antecessores desse estado dependem dele, apenas os seus resíduos
+        são recalculados (e os estados reinseridos ou retirados da fila)
+        - Termina quando a fila fica vazia, ou seja, quando nenhum estado tem resíduo superior
+        a delta_max (o mesmo critério de paragem das restantes atualizações)
+        - As entradas desatualizadas da fila são ignoradas quando retiradas (remoção preguiçosa),
+        sendo identificadas pelo número de ordem da última inserção de cada estado
+        - É devolvida a maior variação a cada |S| atualizações retiradas da fila, e no fim
+        """
+        antecessores = self.__obter_antecessores()
+        fila = []
+        pendentes = {} #estado -> (número de ordem da última inserção, utilidade calculada)
+        ordem = count()
+
+        def avaliar(s):
+            u = self.__util_estado(s, U)
+            residuo = abs(u - U[s])
+            if residuo > self.__delta_max:
+                n = next(ordem)
+                pendentes[s] = (n, u)
+                heappush(fila, (-residuo, n, s))
+            else:
+                pendentes.pop(s, None)
+
+        for s in U:
+            avaliar(s)
+        self.__estatisticas.iteracoes = 1
+        delta, retirados = 0, 0
+        while fila:
+            _, n, s = heappop(fila)
+            pendente = pendentes.get(s)
+            if pendente is None or pendente[0] != n:
+                continue
+            del pendentes[s]
+            delta = max(delta, abs(pendente[1] - U[s]))
+            U[s] = pendente[1]
+            for p in antecessores[s]:
+                avaliar(p)
+            retirados += 1
+            if retirados == len(U) and fila:
+                self.__tabela_q = None
+                yield delta, False
+                delta, retirados = 0, 0
+        self.__tabela_q = None
+        yield delta, True
+
+    def __util_estado(self, s, U):
+        """
+        Atualização de Bellman de um estado: maxₐ Σ T(s,a,s')[R(s,a,s') + γU(s')], ou 0 se
+        o estado não tiver ações
+        """
+        self.__estatisticas.actualizacoes += 1
+        return max([self.util_accao(s, a, U) for a in self.__modelo.A(s)], default=0)
+
+    def __obter_antecessores(self):
+        """
+        Antecessores de cada estado (estados com uma ação que pode ter esse estado como
+        sucessor), calculados uma vez a partir de A(s) e suc(s,a)
+        """
+        if self.__antecessores is None:
+            S, A, suc = self.__modelo.S, self.__modelo.A, self.__modelo.suc
+            antecessores = {s: {} for s in S()} #dicionários usados como conjuntos ordenados
+            for s in S():
+                for a in A(s):
+                    for sn in suc(s, a):
+                        antecessores[sn][s] = None
+            self.__antecessores = {s: list(anteriores) for s, anteriores in antecessores.items()}
+        return self.__antecessores
+
+    def __ordem_topologica(self):
+        """
+        Ordem dos estados do objetivo para fora: procura em largura a partir dos estados
+        terminais (sem ações), seguindo os antecessores; os estados que não alcançam nenhum
+        estado terminal ficam no fim, pela ordem de S()
+
+        Num modelo determinista, como ModeloPDMPlan, cada estado é assim atualizado depois
+        do sucessor no percurso mais curto até ao objetivo, pelo que a utilidade se propaga
+        desde o objetivo numa única iteração
+        """
+        S, A = self.__modelo.S, self.__modelo.A
+        antecessores = self.__obter_antecessores()
+        ordem = [s for s in S() if not A(s)]
+        visitados = set(ordem)
+        for s in ordem: #a lista cresce durante o ciclo (fila da procura em largura)
+            for p in antecessores[s]:
+                if p not in visitados:
+                    visitados.add(p)
+                    ordem.append(p)
+        ordem.extend(s for s in S() if s not in visitados)
+        return ordem
 
     def util_accao(self, s, a, U):
         """
@@ -90,16 +301,68 @@ class MecUtil:
         - Para cada estado sucessor `sn` de `s` ao executar `a`, calcula a soma ponderada
         das recompensas esperadas e das utilidades dos estados sucessores, multiplicadas pela
         probabilidade de transição `T(s,a,sn)`. O resultado é a utilidade esperada da ação `a` em `s`
+        - Os sucessores, probabilidades e recompensas são obtidos de uma vez com
+        `modelo.transicoes(s, a)` (ver ModeloPDM.transicoes)
 
         Fundamentação teórica (15-pds.pdf):
         - Página 35: algoritmo de utilidade ao executar uma ação num estado,
         com base nas utilidades atuais
         """
-        T, R, suc = self.__modelo.T, self.__modelo.R, self.__modelo.suc
-        resultado = sum(T(s, a, sn) * (R(s, a, sn) + self.__gama * U[sn]) for sn in suc(s, a))
+        resultado = sum(prob * (rec + self.__gama * U[sn]) for sn, prob, rec in self.__modelo.transicoes(s, a))
         return resultado
 
     #propriedades getter para os fator de desconto e limiar de convergência
+    @property
+    def utilidade_actual(self):
+        """
+        Utilidades da última iteração (ver iterar)
+        """
+        return self.__U
+
+    @property
+    def tabela_q(self):
+        """
+        Valores Q(s,a) = Σ T(s,a,s')[R(s,a,s') + γU(s')] do último cálculo (TabelaQ)
+
+        - JACOBI: valores calculados na última iteração, a partir das utilidades anteriores a
+        essa iteração, sem nova passagem pelos pares (s, a); as utilidades devolvidas são
+        U(s) = maxₐ Q(s,a) e a política da tabela (TabelaQ.politica) é a política gananciosa em
+        relação às utilidades anteriores, que só difere de PDM.politica(U) em estados cujos
+        sucessores mudaram de utilidade na última iteração (no máximo delta_max)
+        - restantes esquemas: valores calculados uma vez a partir das utilidades finais, numa
+        única passagem por todos os pares (s, a), na primeira consulta após o cálculo
+
+        A tabela é guardada, pelo que consultas repetidas devolvem a mesma tabela
+        """
+        if self.__tabela_q is None:
+            self.__tabela_q = self.__calcular_tabela_q()
+        return self.__tabela_q
+
+    def __calcular_tabela_q(self):
+        """
+        Tabela Q calculada a partir das utilidades atuais (`utilidade_actual`)
+        """
+        U, A = self.__U, self.__modelo.A
+        estados, inicio, accoes, valores = [], [0], [], []
+        for s in self.__modelo.S():
+            accoes_s = A(s)
+            estados.append(s)
+            accoes.extend(accoes_s)
+            valores.extend([self.util_accao(s, a, U) for a in accoes_s])
+            inicio.append(len(accoes))
+        return TabelaQ(estados, inicio, accoes, valores)
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do último cálculo de utilidades (EstatisticasUtil)
+        """
+        return self.__estatisticas
+
+    @property
+    def actualizacao(self):
+        return self.__actualizacao
+
     @property
     def gama(self):
         return self.__gama
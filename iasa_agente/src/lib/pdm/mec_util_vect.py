@@ -0,0 +1,228 @@
+try:
+    import numpy as np
+except ImportError: #NumPy é opcional; sem NumPy é usado o cálculo em Python sobre o modelo compilado
+    np = None
+
+from time import perf_counter
+
+from pdm.estatisticas_util import EstatisticasUtil
+from pdm.tabela_q import TabelaQ
+
+class MecUtilVect:
+    """
+    Mecanismo de cálculo de utilidades por Iteração de Valor sobre um modelo compilado
+    (ModeloPDMComp), com a mesma interface de MecUtil
+
+    Em cada iteração, as atualizações de Bellman de todos os estados são calculadas com
+    operações vetoriais NumPy sobre os vetores de transições, em vez de um ciclo em Python
+    que invoca T, R e suc para cada par (s, a). Se o NumPy não estiver disponível, é usado
+    um ciclo em Python sobre os mesmos vetores, que continua a evitar as invocações ao modelo
+
+    Os resultados são iguais aos de MecUtil: a atualização é síncrona (as utilidades de uma
+    iteração são calculadas a partir das da iteração anterior), as ações de cada estado e
+    os sucessores de cada ação são considerados pela mesma ordem e a soma das parcelas de
+    cada ação é feita pela mesma ordem
+
+    Fundamentação teórica (15-pds.pdf):
+    - Página 35: cálculo iterativo da utilidade de estado com critério de paragem baseado no valor de delta
+    - Página 26: cálculo da utilidade máxima de um estado com base nas utilidades esperadas das ações possíveis
+    """
+    def __init__(self, modelo_comp, gama, delta_max):
+        """
+        Inicializa o mecanismo de cálculo de utilidades
+
+        Parâmetros:
+        - modelo_comp: ModeloPDMComp, modelo do PDM compilado
+        - gama: fator de desconto para recompensas futuras (γ ∈ [0,1])
+        - delta_max: limiar de convergência para paragem do algoritmo
+
+        Atributos (apenas com NumPy):
+        - _par, _suc, _prob, _rec: índice do par (s, a), índice do sucessor, probabilidade e
+        recompensa de cada transição
+        - __estados_accoes: índices dos estados com ações
+        - __inicios: índice do primeiro par de cada estado com ações (para np.maximum.reduceat)
+        """
+        self._modelo = modelo_comp
+        self.__gama = gama
+        self.__delta_max = delta_max
+        self._estatisticas = EstatisticasUtil()
+        self._U = self._utilidade_inicial(None) #utilidades da última iteração, indexadas por estado
+        self._Q = None #valores Q da última iteração, indexados pelo par (s, a)
+        self.__tabela_q = None
+        if np is not None:
+            inicio_estado = np.asarray(modelo_comp.inicio_estado, dtype=np.intp)
+            inicio_par = np.asarray(modelo_comp.inicio_par, dtype=np.intp)
+            self._par = np.repeat(np.arange(modelo_comp.num_pares), np.diff(inicio_par))
+            self._suc = np.asarray(modelo_comp.trans_suc, dtype=np.intp)
+            self._prob = np.asarray(modelo_comp.trans_prob, dtype=float)
+            self._rec = np.asarray(modelo_comp.trans_rec, dtype=float)
+            self.__estados_accoes = np.flatnonzero(np.diff(inicio_estado))
+            self.__inicios = inicio_estado[self.__estados_accoes]
+
+    def utilidade(self, U_inicial = None):
+        """
+        Calcula a utilidade ótima para todos os estados usando Iteração de Valor
+
+        Parâmetros:
+        - U_inicial: dicionário {estado: utilidade} com as utilidades iniciais (ver MecUtil.utilidade)
+
+        Retorno:
+        - Dicionário {estado: utilidade} com os valores ótimos
+
+        Funcionamento:
+        - Inicializa a utilidade de todos os estados com U_inicial ou, por omissão, com 0
+        - Em cada iteração calcula a utilidade de todos os pares (s, a),
+        Q(s,a) = Σ T(s,a,s')[R(s,a,s') + γU(s')], e U(s) = maxₐ Q(s,a) (0 para estados sem ações)
+        - Termina quando a variação máxima entre iterações (delta) não excede delta_max
+        """
+        for _ in self.iterar(U_inicial):
+            pass
+        return self.utilidade_actual
+
+    def iterar(self, U_inicial = None):
+        """
+        Calcula a utilidade iterativamente, como `utilidade`, devolvendo o controlo após cada
+        iteração (ver MecUtil.iterar)
+
+        Retorno:
+        - gerador de tuplos (iteração, delta, tempo); as utilidades da última iteração estão
+        disponíveis em `utilidade_actual`
+        """
+        self._estatisticas = EstatisticasUtil()
+        inicio = perf_counter()
+        self._U = self._utilidade_inicial(U_inicial)
+        self._guardar_q(None)
+        iteracoes = self.__utilidade_vect() if np is not None else self.__utilidade_py()
+        for iteracao, (delta, convergiu) in enumerate(iteracoes, 1):
+            self._estatisticas.tempo_total = perf_counter() - inicio
+            self._estatisticas.convergiu = bool(convergiu)
+            yield iteracao, float(delta), self._estatisticas.tempo_total
+
+    def politica(self, U):
+        """
+        Calcula a política ótima com base na utilidade de cada estado
+
+        Parâmetros:
+        - U: dicionário {estado: utilidade}
+
+        Retorno:
+        - Dicionário {estado: ação} para os estados com ações, sendo escolhida, em caso de
+        empate, a primeira ação de A(s) (como em PDM.politica)
+        """
+        modelo = self._modelo
+        Q = self._util_accoes([U[s] for s in modelo.estados])
+        inicio_estado, par_accao = modelo.inicio_estado, modelo.par_accao
+        politica = {}
+        for i, s in enumerate(modelo.estados):
+            inicio, fim = inicio_estado[i], inicio_estado[i + 1]
+            if inicio < fim:
+                politica[s] = par_accao[max(range(inicio, fim), key=Q.__getitem__)]
+        return politica
+
+    def _utilidade_inicial(self, U_inicial):
+        """
+        Utilidades iniciais indexadas por estado (vetor NumPy ou lista), 0 por omissão
+        """
+        U_inicial = U_inicial or {}
+        U = [U_inicial.get(s, 0) for s in self._modelo.estados]
+        return np.asarray(U, dtype=float) if np is not None else U
+
+    def _util_accoes(self, U):
+        """
+        Utilidade de todos os pares (s, a), dada a lista de utilidades indexada por estado
+
+        Retorno:
+        - Sequência com a utilidade de cada par, indexada pelo índice do par
+        """
+        if np is not None:
+            return self.__q_vect(np.asarray(U, dtype=float)).tolist()
+        return self.__q_py(U)
+
+    def _guardar_q(self, Q):
+        """
+        Guarda os valores Q da última iteração, a partir dos quais é construída a tabela Q
+        """
+        self._Q = Q
+        self.__tabela_q = None
+
+    def __q_vect(self, U):
+        #soma, por par, das parcelas T·(R + γU(s')) pela ordem das transições (np.bincount)
+        return np.bincount(self._par, weights=self._prob * (self._rec + self.__gama * U[self._suc]),
+                           minlength=self._modelo.num_pares)
+
+    def __utilidade_vect(self):
+        n = self._modelo.num_estados
+        while True:
+            U_novo = np.zeros(n)
+            Q = self.__q_vect(self._U)
+            if len(self.__inicios):
+                U_novo[self.__estados_accoes] = np.maximum.reduceat(Q, self.__inicios)
+            self._guardar_q(Q)
+            delta = np.max(np.abs(U_novo - self._U), initial=0)
+            self._U = U_novo
+            self.__contar_iteracao()
+            yield delta, delta <= self.__delta_max
+            if delta <= self.__delta_max:
+                break
+
+    def __q_py(self, U):
+        modelo, gama = self._modelo, self.__gama
+        inicio_par, suc, prob, rec = modelo.inicio_par, modelo.trans_suc, modelo.trans_prob, modelo.trans_rec
+        return [sum(prob[t] * (rec[t] + gama * U[suc[t]]) for t in range(inicio_par[k], inicio_par[k + 1]))
+                for k in range(modelo.num_pares)]
+
+    def __utilidade_py(self):
+        inicio_estado = self._modelo.inicio_estado
+        n = self._modelo.num_estados
+        while True:
+            Q = self.__q_py(self._U)
+            U_novo = [max(Q[inicio_estado[i]:inicio_estado[i + 1]], default=0) for i in range(n)]
+            self._guardar_q(Q)
+            delta = max((abs(u - v) for u, v in zip(U_novo, self._U)), default=0)
+            self._U = U_novo
+            self.__contar_iteracao()
+            yield delta, delta <= self.__delta_max
+            if delta <= self.__delta_max:
+                break
+
+    def __contar_iteracao(self):
+        self._estatisticas.iteracoes += 1
+        self._estatisticas.actualizacoes += self._modelo.num_estados
+
+    @property
+    def utilidade_actual(self):
+        """
+        Utilidades da última iteração, dicionário {estado: utilidade} (ver iterar)
+        """
+        U = self._U.tolist() if np is not None else self._U
+        return dict(zip(self._modelo.estados, U))
+
+    @property
+    def tabela_q(self):
+        """
+        Valores Q(s,a) calculados na última iteração (TabelaQ), sem nova passagem pelos pares
+        (s, a), com U(s) = maxₐ Q(s,a) (ver MecUtil.tabela_q); a tabela é construída na primeira
+        consulta após o cálculo e guardada
+        """
+        if self.__tabela_q is None:
+            modelo = self._modelo
+            Q = self._Q if self._Q is not None else self._util_accoes(self._U)
+            valores = Q.tolist() if np is not None and isinstance(Q, np.ndarray) else Q
+            self.__tabela_q = TabelaQ(modelo.estados, modelo.inicio_estado, modelo.par_accao, valores)
+        return self.__tabela_q
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do último cálculo de utilidades (EstatisticasUtil); a atualização é
+        sempre síncrona (Actualizacao.JACOBI)
+        """
+        return self._estatisticas
+
+    @property
+    def gama(self):
+        return self.__gama
+
+    @property
+    def delta_max(self):
+        return self.__delta_max
\ No newline at end of file
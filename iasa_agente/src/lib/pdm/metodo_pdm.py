@@ -0,0 +1,20 @@
+from enum import Enum
+
+class MetodoPDM(Enum):
+    """
+    Métodos de resolução de um PDM (ver PDM)
+
+    - ITERACAO_VALOR: Iteração de Valor (MecUtil ou, com o modelo compilado, MecUtilVect)
+    - ITERACAO_POLITICA: Iteração de Política, com avaliação exata da política (MecPol)
+    - ITERACAO_POLITICA_MOD: Iteração de Política Modificada, com avaliação aproximada da
+      política por um número fixo de iterações (MecPol)
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 35: iteração de valor
+    - Howard (1960), "Dynamic Programming and Markov Processes": iteração de política
+    - Puterman e Shin (1978), "Modified Policy Iteration Algorithms for Discounted Markov
+      Decision Problems": iteração de política modificada
+    """
+    ITERACAO_VALOR = "iteracao_valor"
+    ITERACAO_POLITICA = "iteracao_politica"
+    ITERACAO_POLITICA_MOD = "iteracao_politica_mod"
\ No newline at end of file
@@ -106,4 +106,26 @@ class ModeloPDM(ABC):
         """
         gera o estado sucessor que resulta de realizar a ação a no estado s
         """
-        pass
\ No newline at end of file
+        pass
+
+    def transicoes(self, s, a):
+        """
+        Obtém as transições possíveis ao executar a ação a no estado s
+
+        Parâmetros:
+        - s (Estado): estado atual
+        - a (Operador): ação a executar
+
+        Retorno:
+        - lista de tuplos (sn, T(s,a,sn), R(s,a,sn)), pela ordem de suc(s,a)
+
+        Funcionamento:
+        - Por omissão, invoca T e R para cada sucessor; os modelos que guardam as transições
+        já calculadas (ex: ModeloPDMPlanEstoc) podem devolvê-las diretamente, evitando as
+        invocações de T e R por sucessor no cálculo da utilidade
+
+        Fundamentação teórica:
+        - 15-pds.pdf, página 35: a utilidade de uma ação é Σ T(s,a,s')[R(s,a,s') + γU(s')],
+        sobre os sucessores s' de (s, a)
+        """
+        return [(sn, self.T(s, a, sn), self.R(s, a, sn)) for sn in self.suc(s, a)]
\ No newline at end of file
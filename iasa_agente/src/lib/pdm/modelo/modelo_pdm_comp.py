@@ -0,0 +1,104 @@
+from array import array
+
+class ModeloPDMComp:
+    """
+    Representação compilada de um ModeloPDM, com estados e ações identificados por índices
+    inteiros e as transições guardadas em vetores contíguos (formato de matriz esparsa por
+    linhas, CSR)
+
+    O modelo é percorrido uma única vez, sendo obtidos, para cada par (s, a), os estados
+    sucessores, as probabilidades T(s, a, s') e as recompensas R(s, a, s') (ModeloPDM.transicoes). O cálculo da
+    utilidade deixa assim de invocar os métodos do modelo em cada iteração
+
+    Estrutura:
+    - estados: lista de estados, sendo o índice de cada estado a sua posição na lista
+    - inicio_estado: os pares (s, a) do estado i têm índices de inicio_estado[i] a
+    inicio_estado[i + 1] - 1, pela ordem de A(s)
+    - par_accao: ação de cada par (s, a)
+    - inicio_par: as transições do par k têm índices de inicio_par[k] a inicio_par[k + 1] - 1,
+    pela ordem de transicoes(s, a)
+    - trans_suc, trans_prob, trans_rec: índice do estado sucessor, probabilidade e recompensa
+    de cada transição
+
+    Os vetores são do tipo array, podendo ser convertidos sem cópia em vetores NumPy
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 8: um PDM é definido por S, A(s), T(s, a, s') e R(s, a, s')
+    - 15-pds.pdf, página 35: em cada iteração do cálculo da utilidade são avaliados todos os
+    pares (s, a) e todos os sucessores, o que justifica obter T e R uma única vez
+    """
+    def __init__(self, modelo):
+        """
+        Compila o modelo
+
+        Parâmetros:
+        - modelo: ModeloPDM, com S(), A(s) e transicoes(s, a)
+
+        Funcionamento:
+        - Os sucessores que não pertencem a S() (que o modelo não deveria gerar) não são
+        representados, pois não têm utilidade associada
+        """
+        S, A, transicoes = modelo.S, modelo.A, modelo.transicoes
+        self.__estados = list(S())
+        self.__indices = {s: i for i, s in enumerate(self.__estados)}
+        self.__inicio_estado = array("i", [0])
+        self.__par_accao = []
+        self.__inicio_par = array("i", [0])
+        self.__trans_suc = array("i")
+        self.__trans_prob = array("d")
+        self.__trans_rec = array("d")
+        indices = self.__indices
+        for s in self.__estados:
+            for a in A(s):
+                for sn, prob, rec in transicoes(s, a):
+                    j = indices.get(sn)
+                    if j is not None:
+                        self.__trans_suc.append(j)
+                        self.__trans_prob.append(prob)
+                        self.__trans_rec.append(rec)
+                self.__par_accao.append(a)
+                self.__inicio_par.append(len(self.__trans_suc))
+            self.__inicio_estado.append(len(self.__par_accao))
+
+    @property
+    def estados(self):
+        return self.__estados
+
+    @property
+    def indices(self):
+        """
+        Índice de cada estado (dicionário estado -> índice)
+        """
+        return self.__indices
+
+    @property
+    def inicio_estado(self):
+        return self.__inicio_estado
+
+    @property
+    def par_accao(self):
+        return self.__par_accao
+
+    @property
+    def inicio_par(self):
+        return self.__inicio_par
+
+    @property
+    def trans_suc(self):
+        return self.__trans_suc
+
+    @property
+    def trans_prob(self):
+        return self.__trans_prob
+
+    @property
+    def trans_rec(self):
+        return self.__trans_rec
+
+    @property
+    def num_estados(self):
+        return len(self.__estados)
+
+    @property
+    def num_pares(self):
+        return len(self.__par_accao)
\ No newline at end of file
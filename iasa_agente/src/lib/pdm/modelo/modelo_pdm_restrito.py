@@ -0,0 +1,55 @@
+from pdm.modelo.modelo_pdm import ModeloPDM
+
+class ModeloPDMRestrito(ModeloPDM):
+    """
+    Restrição de um ModeloPDM a um subconjunto dos seus estados (ver Poda)
+
+    Os estados do subconjunto mantêm as ações, transições e recompensas do modelo original. Os
+    estados sucessores que não pertencem ao subconjunto (fronteira) também fazem parte do modelo
+    restrito, mas sem ações (terminais), pelo que a sua utilidade é 0; as transições para estes
+    estados mantêm a probabilidade e a recompensa originais
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 8: um PDM é definido por S, A(s), T(s, a, s') e R(s, a, s')
+    """
+    def __init__(self, modelo, estados):
+        """
+        Parâmetros:
+        - modelo: ModeloPDM original
+        - estados: estados do subconjunto, pela ordem de S() do modelo original
+        """
+        self.__modelo = modelo
+        self.__estados = list(estados)
+        self.__incluidos = set(self.__estados)
+        fronteira = {}
+        for s in self.__estados:
+            for a in modelo.A(s):
+                for sn in modelo.suc(s, a):
+                    if sn not in self.__incluidos:
+                        fronteira[sn] = None
+        self.__fronteira = list(fronteira)
+
+    def S(self):
+        return self.__estados + self.__fronteira
+
+    def A(self, s):
+        return self.__modelo.A(s) if s in self.__incluidos else []
+
+    def T(self, s, a, sn):
+        return self.__modelo.T(s, a, sn)
+
+    def R(self, s, a, sn):
+        return self.__modelo.R(s, a, sn)
+
+    def suc(self, s, a):
+        return self.__modelo.suc(s, a)
+
+    def transicoes(self, s, a):
+        return self.__modelo.transicoes(s, a)
+
+    @property
+    def fronteira(self):
+        """
+        Estados sucessores que não pertencem ao subconjunto (terminais no modelo restrito)
+        """
+        return self.__fronteira
\ No newline at end of file
@@ -1,4 +1,14 @@
+from time import perf_counter
+
+from pdm.actualizacao import Actualizacao
+from pdm.mec_pol import MecPol
 from pdm.mec_util import MecUtil
+from pdm.mec_util_vect import MecUtilVect
+from pdm.metodo_pdm import MetodoPDM
+from pdm.modelo.modelo_pdm_comp import ModeloPDMComp
+from pdm.modelo.modelo_pdm_restrito import ModeloPDMRestrito
+from pdm.poda import Poda
+from pdm.traco_convergencia import TracoConvergencia
 
 class PDM:
     """
@@ -25,7 +35,8 @@ class PDM:
     - P4-iasa-proj.pdf, página 11: corresponde à classe PDM no diagrama de classes
     - 15-pds.pdf, página 26: princípio da solução ótima e equações de Bellman
     """
-    def __init__(self, modelo, gama, delta_max):
+    def __init__(self, modelo, gama, delta_max, vectorizado = False, actualizacao = Actualizacao.JACOBI,
+                 metodo = MetodoPDM.ITERACAO_VALOR, avaliacoes = 5, poda = Poda.NENHUMA):
         """
         Inicialização de um Processo de Decisão de Markov com os parâmetros base
 
@@ -35,6 +46,16 @@ class PDM:
         - gama: fator de desconto [0,1], que pondera o valor das recompensas futuras (15-pds.pdf, página 16)
         - delta_max: critério de paragem para a iteração de valor; define o limiar de convergência 
         da diferença entre utilidades sucessivas (15-pds.pdf, página 35)
+        - vectorizado: se True, o modelo é compilado (ModeloPDMComp) e a utilidade e a política
+        são calculadas por MecUtilVect (com NumPy, se disponível); caso contrário é usado MecUtil
+        - actualizacao: esquema de atualização das utilidades em MecUtil (ver Actualizacao); o
+        modelo compilado suporta apenas a atualização síncrona (JACOBI)
+        - metodo: método de resolução (ver MetodoPDM); a Iteração de Política usa sempre o modelo
+        compilado (MecPol)
+        - avaliacoes: número de iterações de avaliação da política por melhoria, na Iteração de
+        Política Modificada
+        - poda: estados excluídos do cálculo da utilidade em cada resolução (ver Poda); com poda,
+        o mecanismo de cálculo é criado em cada resolução, para o modelo restrito
 
         Fundamentação teórica:
         - P4-iasa-proj.pdf, página 11: construtor da classe PDM com estes parâmetros
@@ -42,7 +63,32 @@ class PDM:
         self.__modelo = modelo
         self.__gama = gama
         self.__delta_max = delta_max
-        self.__mec_util = MecUtil(self.__modelo, self.__gama, self.__delta_max)
+        self.__vectorizado = vectorizado
+        self.__actualizacao = actualizacao
+        self.__metodo = metodo
+        self.__avaliacoes = avaliacoes
+        self.__poda = poda
+        self.__compilado = vectorizado or metodo is not MetodoPDM.ITERACAO_VALOR
+        if self.__compilado and actualizacao is not Actualizacao.JACOBI:
+            raise ValueError(f"Atualização {actualizacao.name} não suportada com o modelo compilado")
+        self.__modelo_resolvido = self.__modelo #modelo do último cálculo (restrito, com poda)
+        self.__mec_util = self.__criar_mec_util(self.__modelo) if poda is Poda.NENHUMA else None
+        self.__traco = TracoConvergencia()
+        self.__tabela_q = None
+        self.__tempo_extraccao = None #tempo de obtenção da política no último resolver (ver resolver)
+
+    def __criar_mec_util(self, modelo):
+        """
+        Cria o mecanismo de cálculo de utilidades para o modelo, de acordo com o método, a
+        vectorização e o esquema de atualização
+        """
+        if self.__metodo is MetodoPDM.ITERACAO_POLITICA:
+            return MecPol(ModeloPDMComp(modelo), self.__gama, self.__delta_max)
+        if self.__metodo is MetodoPDM.ITERACAO_POLITICA_MOD:
+            return MecPol(ModeloPDMComp(modelo), self.__gama, self.__delta_max, self.__avaliacoes)
+        if self.__vectorizado:
+            return MecUtilVect(ModeloPDMComp(modelo), self.__gama, self.__delta_max)
+        return MecUtil(modelo, self.__gama, self.__delta_max, self.__actualizacao)
 
     def politica(self, U):
         """
@@ -73,6 +119,13 @@ class PDM:
         pela soma ponderada das utilidades dos estados seguintes, de acordo com a função de transição 
         e o fator de desconto
         - A utilidade da ação é calculada através do método `util_accao` da classe `MecUtil`
+        - Com o modelo compilado, a política é calculada por `MecUtilVect.politica` (também usado por
+        `MecPol`), com o mesmo resultado
+        - A política devolvida por `resolver` é obtida da tabela Q da última iteração (ver
+        `tabela_q`), sem esta passagem pelos pares (s, a); com as utilidades devolvidas por
+        `resolver`, o resultado só difere dessa política em estados cujos sucessores mudaram de
+        utilidade na última iteração (no máximo delta_max)
+        - O tempo de cálculo da política fica em `estatisticas.tempo_politica`
 
         Fundamentação teórica:
         - 15-pds.pdf, página 26: utiliza as equações de Bellman para determinar a ação ótima.
@@ -80,29 +133,141 @@ class PDM:
         sucessores, considerando as ações disponíveis e as probabilidades de transição
         - P4-iasa-proj.pdf, página 11: método `politica()` da classe PDM
         """
-        S, A, util_accao = self.__modelo.S, self.__modelo.A, self.__mec_util.util_accao
-        politica = {}
-        for s in S():
-            if A(s):
-                politica[s] = max(A(s), key=lambda a: util_accao(s, a, U))
+        inicio = perf_counter()
+        if self.__compilado:
+            politica = self.__mec_util.politica(U)
+        else:
+            S, A, util_accao = self.__modelo_resolvido.S, self.__modelo_resolvido.A, self.__mec_util.util_accao
+            politica = {}
+            for s in S():
+                if A(s):
+                    politica[s] = max(A(s), key=lambda a: util_accao(s, a, U))
+        self.__mec_util.estatisticas.tempo_politica = perf_counter() - inicio
         return politica
 
-    def resolver(self):
+    def resolver(self, U_inicial = None, estado = None, tempo_max = None):
         """
         Resolve o PDM calculando utilidades ótimas e política correspondente
         
+        Parâmetros:
+        - U_inicial: dicionário {estado: utilidade} com as utilidades iniciais do cálculo da
+        utilidade (ex: de um planeamento anterior); por omissão, as utilidades começam com 0
+        - estado: estado atual (ex: estado do agente), necessário com as podas ALCANCAVEIS e
+        ALCANCAVEIS_RELEVANTES
+        - tempo_max: tempo máximo (segundos) de `resolver`, incluindo a poda e a obtenção da
+        política, ou None (sem limite); o cálculo da utilidade é interrompido no fim da iteração
+        em que o tempo decorrido mais o tempo estimado da obtenção da política (o do `resolver`
+        anterior ou, no primeiro, a duração da última iteração) atinge tempo_max, sendo a política
+        obtida a partir das utilidades dessa iteração (melhor política até ao momento), ficando
+        `estatisticas.convergiu` a False; o tempo total pode exceder tempo_max no máximo pela
+        duração de uma iteração
+
         Retorno:
         - tuplo: (utilidade, politica) onde:
             - utilidade: dicionário com a utilidade final de cada estado
             - politica: dicionário com a ação ótima para cada estado
         
         Funcionamento:
-        1. Calcula utilidades ótimas usando iteração de valor (via MecUtil)
-        2. Deriva a política ótima a partir das utilidades calculadas
+        1. Calcula utilidades ótimas usando iteração de valor (via MecUtil) ou, consoante o método,
+        iteração de política (via MecPol)
+        2. Deriva a política ótima a partir dos valores Q(s,a) da última iteração do cálculo da
+        utilidade, guardados em `tabela_q` (ver MecUtil.tabela_q), sendo a política a ação de maior
+        valor em cada estado, sem voltar a calcular a utilidade das ações
+        3. Com poda, o cálculo é feito sobre o modelo restrito aos estados não excluídos
+        (ModeloPDMRestrito); os estados excluídos ficam com utilidade 0 e sem ação, e o seu número
+        fica em `estatisticas.estados_podados`
+        4. O cálculo da utilidade é feito iteração a iteração (`iterar` do mecanismo), sendo o
+        número da iteração, delta e o tempo decorrido registados em `traco` (TracoConvergencia)
         
         Fundamentação teórica:
         - P4-iasa-proj.pdf, página 11: método resolver() da classe PDM
         - 15-pds.pdf, página 26: separação entre cálculo de utilidade e política
         """
-        utilidade= self.__mec_util.utilidade()
-        return utilidade, self.politica(utilidade)
\ No newline at end of file
+        inicio = perf_counter()
+        if self.__poda is not Poda.NENHUMA:
+            estados = self.__podar(estado)
+            self.__modelo_resolvido = ModeloPDMRestrito(self.__modelo, estados)
+            self.__mec_util = self.__criar_mec_util(self.__modelo_resolvido)
+        self.__traco = TracoConvergencia()
+        tempo_ant = 0
+        for iteracao, delta, tempo in self.__mec_util.iterar(U_inicial):
+            self.__traco.registar(iteracao, delta, tempo)
+            if tempo_max is not None and not self.__mec_util.estatisticas.convergiu:
+                reserva = self.__tempo_extraccao if self.__tempo_extraccao is not None else tempo - tempo_ant
+                if perf_counter() - inicio + reserva >= tempo_max:
+                    break
+            tempo_ant = tempo
+        inicio_politica = perf_counter()
+        utilidade = self.__mec_util.utilidade_actual
+        self.__tabela_q = self.__mec_util.tabela_q
+        politica = self.__tabela_q.politica()
+        if self.__poda is not Poda.NENHUMA:
+            utilidade = {s: utilidade.get(s, 0) for s in self.__modelo.S()}
+            self.__mec_util.estatisticas.estados_podados = len(utilidade) - len(self.__modelo_resolvido.S())
+        self.__tempo_extraccao = perf_counter() - inicio_politica
+        self.__mec_util.estatisticas.tempo_politica = self.__tempo_extraccao
+        return utilidade, politica
+
+    def __podar(self, estado):
+        """
+        Estados não excluídos pela poda, pela ordem de S() (ver Poda)
+
+        Exceções:
+        - ValueError: se a poda partir do estado atual e este não for indicado
+        """
+        S, A, suc = self.__modelo.S, self.__modelo.A, self.__modelo.suc
+        incluidos = None
+        if self.__poda in (Poda.ALCANCAVEIS, Poda.ALCANCAVEIS_RELEVANTES):
+            if estado is None:
+                raise ValueError(f"Poda {self.__poda.name} requer o estado atual")
+            incluidos = {estado}
+            fila = [estado]
+            for s in fila: #a lista cresce durante o ciclo (fila da procura em largura)
+                for a in A(s):
+                    for sn in suc(s, a):
+                        if sn not in incluidos:
+                            incluidos.add(sn)
+                            fila.append(sn)
+        if self.__poda in (Poda.RELEVANTES, Poda.ALCANCAVEIS_RELEVANTES):
+            candidatos = S() if incluidos is None else [s for s in S() if s in incluidos]
+            antecessores = {}
+            terminais = []
+            for s in candidatos:
+                accoes = A(s)
+                if not accoes:
+                    terminais.append(s)
+                for a in accoes:
+                    for sn in suc(s, a):
+                        antecessores.setdefault(sn, []).append(s)
+            relevantes = set(terminais)
+            for sn in terminais: #a lista cresce durante o ciclo (fila da procura em largura)
+                for s in antecessores.get(sn, []):
+                    if s not in relevantes:
+                        relevantes.add(s)
+                        terminais.append(s)
+            incluidos = relevantes
+        return [s for s in S() if s in incluidos]
+
+    @property
+    def tabela_q(self):
+        """
+        Valores Q(s,a) da última iteração do último `resolver` (TabelaQ), com U(s) = maxₐ Q(s,a)
+        para as utilidades devolvidas, a partir dos quais foi obtida a política, ou None se
+        ainda não foi resolvido
+        """
+        return self.__tabela_q
+
+    @property
+    def traco(self):
+        """
+        Registo da convergência do último cálculo de utilidades (TracoConvergencia)
+        """
+        return self.__traco
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do último cálculo de utilidades (EstatisticasUtil), ou None se, com poda,
+        ainda não foi resolvido
+        """
+        return self.__mec_util.estatisticas if self.__mec_util is not None else None
\ No newline at end of file
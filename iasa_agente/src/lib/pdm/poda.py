@@ -0,0 +1,28 @@
+from enum import Enum
+
+class Poda(Enum):
+    """
+    Poda dos estados antes do cálculo da utilidade (ver PDM.resolver)
+
+    - NENHUMA: a utilidade é calculada em todos os estados de S()
+    - ALCANCAVEIS: apenas nos estados alcançáveis a partir do estado atual, por qualquer
+      sequência de ações (procura em largura segundo as transições com probabilidade não nula);
+      o conjunto é fechado, pelo que as utilidades destes estados não dependem dos restantes
+    - RELEVANTES: apenas nos estados a partir dos quais é possível alcançar um estado terminal
+      (sem ações), obtidos por procura em largura a partir dos estados terminais, no sentido
+      inverso; os restantes estados sucessores destes passam a ser terminais, com utilidade 0,
+      o que é exato quando, como em ModeloPDMPlan, só as transições para estados terminais
+      têm recompensa não nula
+    - ALCANCAVEIS_RELEVANTES: interseção das duas anteriores
+
+    Os estados excluídos ficam com utilidade 0 e sem ação na política
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 35: cada iteração do cálculo da utilidade percorre todos os estados
+    - Barto, Bradtke e Singh (1995), "Learning to Act Using Real-Time Dynamic Programming":
+      a política ótima só é necessária nos estados relevantes, alcançáveis a partir do estado atual
+    """
+    NENHUMA = "nenhuma"
+    ALCANCAVEIS = "alcancaveis"
+    RELEVANTES = "relevantes"
+    ALCANCAVEIS_RELEVANTES = "alcancaveis_relevantes"
\ No newline at end of file
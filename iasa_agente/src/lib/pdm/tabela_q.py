@@ -0,0 +1,86 @@
+class TabelaQ:
+    """
+    Tabela das utilidades das ações, Q(s, a) = Σ T(s,a,s')[R(s,a,s') + γU(s')], guardadas da
+    última iteração do cálculo da utilidade (ver MecUtil.tabela_q)
+
+    A política é obtida da tabela (a ação de maior valor em cada estado) e os valores ficam
+    disponíveis para consulta e visualização (ver PlanoPDM), sem voltar a calcular a
+    utilidade de cada ação
+
+    Estrutura (compacta, como ModeloPDMComp):
+    - os estados são identificados por índices; as ações do estado i e os respetivos valores
+    têm índices de inicio[i] a inicio[i + 1] - 1, pela ordem de A(s)
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 26: a política ótima escolhe, em cada estado, a ação com maior
+    utilidade esperada, π(s) = argmaxₐ Q(s, a)
+    """
+    def __init__(self, estados, inicio, accoes, valores):
+        """
+        Parâmetros:
+        - estados: lista de estados, sendo o índice de cada estado a sua posição na lista
+        - inicio: as ações do estado i têm índices de inicio[i] a inicio[i + 1] - 1
+        - accoes: ação de cada par (s, a)
+        - valores: valor Q(s, a) de cada par (s, a)
+
+        As sequências são guardadas sem cópia (ex: os vetores de ModeloPDMComp); o índice de
+        cada estado só é construído na primeira consulta de um estado
+        """
+        self.__estados = estados
+        self.__inicio = inicio
+        self.__accoes = accoes
+        self.__valores = valores
+        self.__indices = None
+
+    def __indice(self, s):
+        if self.__indices is None:
+            self.__indices = {estado: i for i, estado in enumerate(self.__estados)}
+        return self.__indices.get(s)
+
+    def valores(self, s):
+        """
+        Dicionário {ação: Q(s, a)} do estado, vazio se o estado não tiver ações na tabela
+        """
+        i = self.__indice(s)
+        if i is None:
+            return {}
+        inicio, fim = self.__inicio[i], self.__inicio[i + 1]
+        return dict(zip(self.__accoes[inicio:fim], self.__valores[inicio:fim]))
+
+    def q(self, s, a):
+        """
+        Valor Q(s, a), ou None se não estiver na tabela
+        """
+        return self.valores(s).get(a)
+
+    def melhor_accao(self, s):
+        """
+        Ação com maior valor no estado (a primeira, em caso de empate, como max sobre A(s)),
+        ou None se o estado não tiver ações na tabela
+        """
+        i = self.__indice(s)
+        return self.__melhor(i) if i is not None else None
+
+    def __melhor(self, i):
+        inicio, fim = self.__inicio[i], self.__inicio[i + 1]
+        if inicio == fim:
+            return None
+        return self.__accoes[max(range(inicio, fim), key=self.__valores.__getitem__)]
+
+    def politica(self):
+        """
+        Política gananciosa em relação aos valores da tabela, {estado: ação}, para os estados
+        com ações
+        """
+        politica = {}
+        for i, s in enumerate(self.__estados):
+            accao = self.__melhor(i)
+            if accao is not None:
+                politica[s] = accao
+        return politica
+
+    def __contains__(self, s):
+        return self.__indice(s) is not None
+
+    def __len__(self):
+        return len(self.__estados)
\ No newline at end of file
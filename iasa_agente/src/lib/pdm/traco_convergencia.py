@@ -0,0 +1,52 @@
+import csv
+import json
+
+class TracoConvergencia:
+    """
+    Registo da convergência de um cálculo de utilidades: para cada iteração, o número da
+    iteração, a variação máxima das utilidades (delta, resíduo de Bellman) e o tempo decorrido
+    desde o início do cálculo (ver MecUtil.iterar e PDM.resolver)
+
+    Permite analisar o decaimento de delta ao longo das iterações (na Iteração de Valor, delta
+    diminui por um fator de até γ em cada iteração), e exportá-lo em CSV ou JSON
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 35: critério de paragem da iteração de valor baseado em delta
+    """
+    CAMPOS = ("iteracao", "delta", "tempo")
+
+    def __init__(self):
+        self.__iteracoes = []
+
+    def registar(self, iteracao, delta, tempo):
+        """
+        Regista uma iteração
+        """
+        self.__iteracoes.append((iteracao, delta, tempo))
+
+    def exportar_csv(self, caminho):
+        """
+        Exporta o registo para um ficheiro CSV, com uma linha de cabeçalho (CAMPOS) e uma linha
+        por iteração
+        """
+        with open(caminho, "w", newline="", encoding="utf-8") as ficheiro:
+            escritor = csv.writer(ficheiro)
+            escritor.writerow(self.CAMPOS)
+            escritor.writerows(self.__iteracoes)
+
+    def exportar_json(self, caminho):
+        """
+        Exporta o registo para um ficheiro JSON, como lista de objetos com os campos CAMPOS
+        """
+        with open(caminho, "w", encoding="utf-8") as ficheiro:
+            json.dump([dict(zip(self.CAMPOS, iteracao)) for iteracao in self.__iteracoes], ficheiro, indent=2)
+
+    @property
+    def iteracoes(self):
+        """
+        Lista de tuplos (iteração, delta, tempo)
+        """
+        return self.__iteracoes
+
+    def __len__(self):
+        return len(self.__iteracoes)
\ No newline at end of file
@@ -0,0 +1,209 @@
+from time import perf_counter
+
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+
+class ProcuraBidireccional(MecanismoProcura):
+    """
+    Procura bidirecional de custo uniforme ou A*, para problemas com um único
+    estado objetivo explícito (problema.estado_final) e operadores reversíveis
+    (OperadorReversivel)
+
+    São realizadas duas procuras melhor-primeiro em simultâneo, uma a partir do estado
+    inicial (sentido direto) e outra a partir do estado objetivo (sentido inverso),
+    em que os antecessores de um estado são gerados pelos operadores inversos. Sempre
+    que um estado gerado num sentido já é conhecido no outro, é obtido um percurso
+    completo (encontro a meio), sendo guardado o de menor custo
+
+    A procura termina quando nenhum percurso ainda por encontrar pode ter custo menor:
+    - custo uniforme: quando a soma dos menores custos das duas fronteiras não é
+      inferior ao custo do melhor percurso encontrado
+    - A*: quando o menor f(n) de uma das fronteiras não é inferior a esse custo,
+      pois f(n) é um minorante do custo de qualquer percurso que passe por n
+      (heurísticas admissíveis e consistentes)
+
+    Em cada passo é expandido o sentido com menos nós na fronteira
+
+    Fundamentação teórica:
+    - 11-pee-2.pdf: a complexidade da procura cresce exponencialmente com a
+      profundidade; duas procuras até metade da profundidade geram muito menos nós
+      do que uma procura até à profundidade total
+    - 12-pee-3.pdf, página 20: algoritmo A*, com f(n) = g(n) + h(n)
+    """
+    def __init__(self):
+        """
+        Inicializa o mecanismo; as fronteiras dos dois sentidos são criadas em cada
+        procura, consoante seja de custo uniforme ou A*
+        """
+        super().__init__(None)
+        self._fronteira_inv = None
+        self.__heuristicas = None
+
+    def procurar(self, problema, heuristica = None, heuristica_inv = None):
+        """
+        Executa a procura bidirecional
+
+        Parâmetros:
+        - problema: Problema com estado_final e operadores reversíveis
+        - heuristica (Heuristica): Estimativa do custo até ao estado objetivo
+        - heuristica_inv (Heuristica): Estimativa do custo até ao estado inicial; por
+          omissão é obtida da heurística direta (heuristica.inversa), a partir do estado
+          inicial do problema
+
+        Retorno:
+        - Solucao: Percurso do estado inicial ao objetivo, ou None
+
+        Funcionamento:
+        - Sem heurísticas é realizada uma procura de custo uniforme bidirecional
+        - Com as duas heurísticas é realizada uma procura A* bidirecional
+        """
+        if heuristica is not None and heuristica_inv is None:
+            heuristica_inv = heuristica.inversa(problema.estado_inicial)
+        self.__heuristicas = heuristica is not None and heuristica_inv is not None
+        if self.__heuristicas:
+            avaliador, avaliador_inv = AvaliadorAA(), AvaliadorAA()
+            avaliador.heuristica = heuristica
+            avaliador_inv.heuristica = heuristica_inv
+        else:
+            avaliador, avaliador_inv = AvaliadorCustoUnif(), AvaliadorCustoUnif()
+        self._fronteira = FronteiraPrioridade(avaliador, Desempate.MAIOR_CUSTO)
+        self._fronteira_inv = FronteiraPrioridade(avaliador_inv, Desempate.MAIOR_CUSTO)
+        return super().procurar(problema)
+
+    def _procurar(self, problema):
+        """
+        Executa a procura nos dois sentidos, acumulando as estatísticas em self._estatisticas
+
+        Funcionamento:
+        1. Inicia as fronteiras e os índices do melhor nó de cada estado, em cada sentido
+        2. Enquanto as duas fronteiras tiverem nós e o critério de paragem não se verificar:
+           a) Escolhe o sentido com menos nós na fronteira e remove o nó mais prioritário,
+              ignorando-o se estiver obsoleto
+           b) Expande o nó no sentido escolhido e memoriza os sucessores, verificando se
+              algum deles completa um percurso melhor com um nó do outro sentido
+        3. Retorna a solução obtida pela junção dos dois percursos do melhor encontro
+        """
+        estatisticas = self._estatisticas
+        inicio = perf_counter()
+        try:
+            fronteiras = (self._fronteira, self._fronteira_inv)
+            self._explorados = ({}, {})
+            no = No(problema.estado_inicial)
+            no_inv = No(problema.estado_final)
+            estatisticas.nos_gerados += 2
+            if no.estado == no_inv.estado:
+                return Solucao(no)
+            for sentido, no_inicial in enumerate((no, no_inv)):
+                fronteiras[sentido].iniciar()
+                fronteiras[sentido].inserir(no_inicial)
+                self._explorados[sentido][no_inicial.estado] = no_inicial
+            self.__custo_encontro = float("inf")
+            self.__encontro = None
+            while not self._fronteira.vazia and not self._fronteira_inv.vazia:
+                if self.__minorante() >= self.__custo_encontro:
+                    break
+                sentido = 0 if len(self._fronteira) <= len(self._fronteira_inv) else 1
+                no = fronteiras[sentido].remover()
+                if self._explorados[sentido][no.estado] is not no:
+                    estatisticas.nos_repetidos += 1
+                    continue # entrada antiga da fronteira, entretanto substituída
+                inicio_fase = perf_counter()
+                if sentido == 0:
+                    sucessores = self._expandir(problema, no)
+                else:
+                    sucessores = self._expandir_inv(problema, no)
+                fim_expandir = perf_counter()
+                for no_sucessor in sucessores:
+                    self.__memorizar(sentido, no_sucessor)
+                fim_memorizar = perf_counter()
+                estatisticas.tempo_expandir += fim_expandir - inicio_fase
+                estatisticas.tempo_memorizar += fim_memorizar - fim_expandir
+                estatisticas.max_fronteira = max(estatisticas.max_fronteira,
+                                                 len(self._fronteira) + len(self._fronteira_inv))
+                estatisticas.max_memoria = max(estatisticas.max_memoria, self._nos_em_memoria())
+            if self.__encontro is not None:
+                return Solucao(self.__juntar(*self.__encontro))
+        finally:
+            estatisticas.tempo_total += perf_counter() - inicio
+
+    def __minorante(self):
+        """
+        Minorante do custo de qualquer percurso ainda não encontrado
+        """
+        prioridade = self._fronteira.prioridade_minima
+        prioridade_inv = self._fronteira_inv.prioridade_minima
+        if self.__heuristicas:
+            return max(prioridade, prioridade_inv)
+        return prioridade + prioridade_inv
+
+    def __memorizar(self, sentido, no):
+        """
+        Memoriza um nó gerado num sentido, atualizando o melhor encontro entre os dois sentidos
+
+        Parâmetros:
+        - sentido: 0 para o sentido direto, 1 para o sentido inverso
+        - no (No): Nó gerado
+        """
+        explorados = self._explorados[sentido]
+        melhor = explorados.get(no.estado)
+        if melhor is not None and no.custo >= melhor.custo:
+            self._estatisticas.nos_repetidos += 1
+            return
+        (self._fronteira, self._fronteira_inv)[sentido].inserir(no)
+        explorados[no.estado] = no
+        no_outro = self._explorados[1 - sentido].get(no.estado)
+        if no_outro is not None and no.custo + no_outro.custo < self.__custo_encontro:
+            self.__custo_encontro = no.custo + no_outro.custo
+            self.__encontro = (no, no_outro) if sentido == 0 else (no_outro, no)
+
+    def _expandir_inv(self, problema, no):
+        """
+        Gera os nós antecessores de um nó, no sentido inverso da procura
+
+        Parâmetros:
+        - problema: Contém os operadores disponíveis, que devem ser reversíveis
+        - no (No): Nó a expandir
+
+        Retorno:
+        - Lista de nós com os estados a partir dos quais se alcança o estado do nó, em que
+          o operador de cada nó é o operador que leva desse estado ao estado do nó
+        """
+        antecessores = []
+        estado = no.estado
+        for operador in problema.operadores:
+            estado_ant = operador.inverso().aplicar(estado)
+            if estado_ant != None:
+                custo = no.custo + operador.custo(estado_ant, estado)
+                antecessores.append(No(estado_ant, operador, no, custo))
+        self._estatisticas.nos_expandidos += 1
+        self._estatisticas.nos_gerados += len(antecessores)
+        return antecessores
+
+    def __juntar(self, no, no_inv):
+        """
+        Junta o percurso do sentido direto até um estado com o percurso do sentido
+        inverso desse estado até ao objetivo, num único percurso de nós
+
+        Parâmetros:
+        - no (No): Nó do sentido direto
+        - no_inv (No): Nó do sentido inverso com o mesmo estado
+
+        Retorno:
+        - No: Nó final do percurso completo, cujos antecessores levam ao estado inicial
+        """
+        while no_inv.antecessor is not None:
+            seguinte = no_inv.antecessor
+            no = No(seguinte.estado, no_inv.operador, no, no.custo + no_inv.custo - seguinte.custo)
+            no_inv = seguinte
+        return no
+
+    def _nos_em_memoria(self):
+        """
+        Número de nós em memória: melhores nós conhecidos nos dois sentidos
+        """
+        return len(self._explorados[0]) + len(self._explorados[1])
\ No newline at end of file
@@ -9,6 +9,10 @@ class FronteiraFIFO(Fronteira):
         forma que os primeiros a serem inseridos sejam os primeiros a serem processados
         Esta abordagem é utilizada em estratégias como a procura em largura (Breadth-First Search)
 
+        Funcionamento:
+        - O nó é inserido no fim da deque, sendo removido pelo início (Fronteira.remover),
+        ambas as operações em tempo constante
+
         Fundamentação teórica:
         - 10-pee-1.pdf, página 28: explica-se que a procura em largura utiliza uma fronteira FIFO para explorar primeiro os nós mais antigos
         - P3-iasa-proj.pdf, página 7: é descrito o conceito de fronteira como uma estrutura ordenada que gerencia os nós a explorar
@@ -0,0 +1,73 @@
+from time import perf_counter
+
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.reserva_nos import ReservaNos
+from pee.mec_proc.solucao import Solucao
+
+class ProcuraLarguraCompacta(MecanismoProcura):
+    """
+    Procura em largura sobre uma reserva compacta de nós (ReservaNos)
+
+    Na procura em largura os nós são expandidos pela ordem em que são gerados, que
+    é também a ordem em que são criados na reserva; a fronteira FIFO corresponde
+    por isso ao intervalo de índices da reserva ainda não expandidos, não sendo
+    necessária uma estrutura de fronteira nem objetos No
+
+    O resultado e as estatísticas são os mesmos de ProcuraLargura, com uma fração
+    da memória ocupada
+
+    Fundamentação teórica:
+    - 10-pee-1.pdf, página 28: algoritmo de procura em largura com fronteira FIFO
+    """
+    def __init__(self):
+        """
+        Inicializa o mecanismo sem fronteira, pois esta é a própria reserva de nós
+        """
+        super().__init__(None)
+
+    def _procurar(self, problema):
+        """
+        Executa a procura em largura, acumulando as estatísticas em self._estatisticas
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+
+        Retorno:
+        - Solucao: Sequência de passos do estado inicial ao objetivo
+        - None: Se nenhuma solução for encontrada
+
+        Funcionamento:
+        1. Cria a reserva de nós com o nó inicial
+        2. Enquanto existirem nós por expandir (índice seguinte menor que a dimensão da reserva):
+           a) Obtém o nó seguinte e verifica se o seu estado é objetivo
+           b) Se for, retorna a solução, reconstruída a partir dos índices dos antecessores
+           c) Senão, cria na reserva um nó por cada operador aplicável
+        3. Retorna None se todos os nós forem expandidos sem solução
+        """
+        estatisticas = self._estatisticas
+        inicio = perf_counter()
+        try:
+            operadores = list(problema.operadores)
+            reserva = ReservaNos(operadores)
+            reserva.criar(reserva.identificar(problema.estado_inicial))
+            estatisticas.nos_gerados += 1
+            indice = 0
+            while indice < len(reserva):
+                estado = reserva.estado(indice)
+                if problema.objectivo(estado):
+                    return Solucao(reserva.no(indice))
+                inicio_fase = perf_counter()
+                custo = reserva.custo(indice)
+                for num_operador, operador in enumerate(operadores):
+                    estado_suc = operador.aplicar(estado)
+                    if estado_suc != None:
+                        reserva.criar(reserva.identificar(estado_suc), num_operador, indice,
+                                      custo + operador.custo(estado, estado_suc))
+                        estatisticas.nos_gerados += 1
+                estatisticas.tempo_expandir += perf_counter() - inicio_fase
+                estatisticas.nos_expandidos += 1
+                indice += 1
+                estatisticas.max_fronteira = max(estatisticas.max_fronteira, len(reserva) - indice)
+                estatisticas.max_memoria = len(reserva) #os nós da reserva nunca são removidos
+        finally:
+            estatisticas.tempo_total += perf_counter() - inicio
\ No newline at end of file
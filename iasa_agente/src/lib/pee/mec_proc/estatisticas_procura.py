@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+@dataclass
+class EstatisticasProcura:
+    """
+    Estatísticas de uma procura, mantidas por cada instância de MecanismoProcura
+
+    Substituem os contadores estáticos da classe No, que eram partilhados por todas
+    as procuras do processo e atualizados pelo finalizador de cada nó, pelo que
+    procuras sucessivas ou encaixadas (ex: ProcuraProfIter, vários agentes)
+    interferiam entre si
+
+    A complexidade temporal e espacial de um mecanismo de procura é avaliada pelo
+    número de nós processados e pelo número máximo de nós em memória, tal como é
+    feito nos resultados registados em contagem.py
+    """
+    nos_gerados: int = 0 # Nós criados (incluindo o nó inicial)
+    nos_expandidos: int = 0 # Nós cujos sucessores foram gerados
+    nos_repetidos: int = 0 # Nós descartados por corresponderem a estados já conhecidos
+    max_fronteira: int = 0 # Número máximo de nós na fronteira
+    max_memoria: int = 0 # Número máximo de nós em memória (fronteira e explorados)
+    tempo_expandir: float = 0.0 # Tempo gasto a expandir nós (segundos)
+    tempo_memorizar: float = 0.0 # Tempo gasto a memorizar nós sucessores (segundos)
+    tempo_total: float = 0.0 # Tempo total de procura (segundos)
+
+    def acumular(self, outras):
+        """
+        Acumula as estatísticas de outra procura nestas estatísticas
+
+        Parâmetros:
+        - outras (EstatisticasProcura): estatísticas a acumular (ex: de uma iteração
+          de uma procura iterativa)
+
+        Funcionamento:
+        - Os contadores de nós e os tempos são somados; os máximos de nós na fronteira
+          e em memória passam a ser o maior dos dois valores
+        """
+        self.nos_gerados += outras.nos_gerados
+        self.nos_expandidos += outras.nos_expandidos
+        self.nos_repetidos += outras.nos_repetidos
+        self.max_fronteira = max(self.max_fronteira, outras.max_fronteira)
+        self.max_memoria = max(self.max_memoria, outras.max_memoria)
+        self.tempo_expandir += outras.tempo_expandir
+        self.tempo_memorizar += outras.tempo_memorizar
+        self.tempo_total += outras.tempo_total
\ No newline at end of file
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod #import das bibliotecas necessárias para criação de uma classe abstrata
+from collections import deque #fila com inserção e remoção O(1) em ambas as extremidades
 
 #definir a classe como abstrata, segundo o diagrama do slide 5 do P3-iasa-proj
 class Fronteira(ABC):
@@ -27,11 +28,17 @@ class Fronteira(ABC):
         """
         Método para iniciar a fronteira
 
+        Funcionamento:
+        - Os nós são guardados numa deque, que permite inserir e remover nós
+        em ambas as extremidades em tempo constante. Com uma lista, remover o
+        primeiro nó (pop(0)) ou inserir no início (insert(0, no)) obriga a deslocar
+        todos os restantes nós, tornando a procura quadrática na dimensão da fronteira
+
         Fundamentação teórica:
         - 10-pee-1.pdf (slide 18): Necessário entre buscas consecutivas
         - P3-iasa-proj.pdf (slide 5): Método presente no diagrama
         """
-        self._nos = []
+        self._nos = deque()
     
     #método abstrato que serve para inserir um nó na fronteira
     @abstractmethod
@@ -62,9 +69,20 @@ class Fronteira(ABC):
         - P3-iasa-proj.pdf (slide 5): Parte essencial da interface
         - 09-rac-aut.pdf (slide 6): Seleção de opções na exploração
         """
-        return self._nos.pop(0)
+        return self._nos.popleft() #remoção O(1) do início da deque
     
     @property
     def vazia(self):
-        return len(self._nos) == 0
+        return not self._nos
+
+    def __len__(self):
+        """
+        Retorna o número de nós presentes na fronteira
+        """
+        return len(self._nos)
+
+    def __contains__(self, no): #implementação do operador in
+        #retorna True ou False, caso o nó passado como parâmetro
+        #esteja presente na fronteira
+        return no in self._nos
     
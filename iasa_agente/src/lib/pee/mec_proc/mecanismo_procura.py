@@ -1,5 +1,7 @@
 from abc import ABC
+from time import perf_counter
 
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
 from pee.mec_proc.no import No
 from pee.mec_proc.solucao import Solucao
 
@@ -19,8 +21,10 @@ class MecanismoProcura(ABC):
         Inicializa o mecanismo com uma estratégia de fronteira
 
         A fronteira determina a estratégia de procura, ou seja, a ordem de exploração dos nós
+        As estatísticas da última procura são mantidas pelo próprio mecanismo
         """
         self._fronteira = fronteira
+        self._estatisticas = EstatisticasProcura()
 
     def _iniciar_memoria(self):
         """
@@ -60,21 +64,120 @@ class MecanismoProcura(ABC):
         2. Criação do nó inicial
         3. Memorizar o nó criado
         4. Enquanto existir nós na fronteira:
-           a) Remove o primeiro nó da fronteira
+           a) Remove o primeiro nó da fronteira, ignorando-o se estiver obsoleto
            b) Verifica se o estado é objetivo
            c) Se for, retorna solução
            d) Senão, expande o nó e adiciona sucessores à fronteira
         5. Retorna None se fronteira esvaziar sem solução
+
+        As estatísticas são reiniciadas em cada chamada a este método, sendo a procura
+        propriamente dita realizada por _procurar
+        """
+        self._estatisticas = EstatisticasProcura()
+        return self._procurar(problema)
+
+    def _procurar(self, problema):
+        """
+        Executa uma procura, acumulando as estatísticas em self._estatisticas
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+
+        Retorno:
+        - Solucao: Sequência de nós do estado inicial ao objetivo
+        - None: Se nenhuma solução for encontrada
+
+        Funcionamento:
+        - Segue o algoritmo descrito em procurar, medindo o tempo gasto a expandir
+          e a memorizar nós, e registando o máximo de nós na fronteira e em memória
+          após cada expansão
+        - Não reinicia as estatísticas, de modo que procuras compostas por várias
+          procuras sucessivas (ex: ProcuraProfIter) possam acumulá-las
         """
-        self._iniciar_memoria() # Iniciar a memória
-        no = No(problema.estado_inicial)
-        self._memorizar(no) # Memorizar o no
-        while not self._fronteira.vazia:
-            no = self._fronteira.remover()
-            if problema.objectivo(no.estado):
-                return Solucao(no)
-            for no_sucessor in self._expandir(problema, no):
-                self._memorizar(no_sucessor)
+        estatisticas = self._estatisticas
+        inicio = perf_counter()
+        try:
+            self._iniciar_memoria() # Iniciar a memória
+            for no in self._nos_iniciais(problema):
+                self._memorizar(no) # Memorizar o no
+            while not self._fronteira.vazia:
+                no = self._fronteira.remover()
+                if self._obsoleto(no):
+                    continue # entrada antiga da fronteira, entretanto substituída
+                if self._objectivo(problema, no):
+                    return Solucao(no)
+                inicio_fase = perf_counter()
+                sucessores = self._expandir(problema, no)
+                fim_expandir = perf_counter()
+                for no_sucessor in sucessores:
+                    self._memorizar(no_sucessor)
+                fim_memorizar = perf_counter()
+                estatisticas.tempo_expandir += fim_expandir - inicio_fase
+                estatisticas.tempo_memorizar += fim_memorizar - fim_expandir
+                estatisticas.max_fronteira = max(estatisticas.max_fronteira, len(self._fronteira))
+                estatisticas.max_memoria = max(estatisticas.max_memoria, self._nos_em_memoria())
+        finally:
+            estatisticas.tempo_total += perf_counter() - inicio
+
+    def _objectivo(self, problema, no):
+        """
+        Teste de objetivo de um nó removido da fronteira
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+        - no: Nó removido da fronteira
+
+        Retorno:
+        - bool: True se o estado do nó é objetivo do problema, terminando a procura
+
+        Funcionamento:
+        - Permite às procuras com vários objetivos (ex: ProcuraCustoUnif.procurar_objectivos)
+          registar cada objetivo alcançado e continuar a procura até alcançarem todos
+        """
+        return problema.objectivo(no.estado)
+
+    def _nos_iniciais(self, problema):
+        """
+        Nós a partir dos quais a procura é iniciada
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+
+        Retorno:
+        - list: Nó raiz, com o estado inicial do problema
+
+        Funcionamento:
+        - Permite às procuras que retomam uma procura anterior (ex: ProcuraProfIter
+          incremental) iniciar a procura a partir dos nós em que esta foi interrompida
+        """
+        self._estatisticas.nos_gerados += 1
+        return [No(problema.estado_inicial)]
+
+    def _nos_em_memoria(self):
+        """
+        Número de nós mantidos em memória pelo mecanismo de procura
+
+        Retorno:
+        - int: Número de nós na fronteira; as procuras em grafos acrescentam os nós explorados
+        """
+        return len(self._fronteira)
+
+    def _obsoleto(self, no):
+        """
+        Indica se um nó removido da fronteira deve ser ignorado
+
+        Parâmetros:
+        - no: Nó removido da fronteira
+
+        Retorno:
+        - bool: False, nenhum nó é obsoleto na procura genérica
+
+        Funcionamento:
+        - Permite às procuras em grafos descartar entradas da fronteira que foram
+          substituídas por um nó de menor custo para o mesmo estado (remoção diferida),
+          evitando a remoção direta de elementos no interior da fronteira
+        """
+        return False
 
     def _expandir(self, problema, no):
         """
@@ -95,7 +198,8 @@ class MecanismoProcura(ABC):
            b) Se gerar estado válido:
               - Calcula custo acumulado (custo do pai + custo da transição)
               - Cria um novo nó com estado, operador, antecessor e custo
-        2. Retorna todos os sucessores gerados
+        2. Retorna todos os sucessores gerados, contabilizando a expansão e os nós
+           gerados nas estatísticas da procura
         """
         sucessores = []
         estado = no.estado
@@ -105,16 +209,25 @@ class MecanismoProcura(ABC):
                 custo = no.custo + operador.custo(estado, estado_suc)
                 no_sucessor = No(estado_suc, operador, no, custo)
                 sucessores.append(no_sucessor)
+        self._estatisticas.nos_expandidos += 1
+        self._estatisticas.nos_gerados += len(sucessores)
         return sucessores
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas da última procura realizada por este mecanismo
+        """
+        return self._estatisticas
     
     @property
     def nos_processados(self):
-        return No.nos_criados
+        return self._estatisticas.nos_gerados
     
     @property
     def nos_memoria(self):
-        return No.max_nos_em_mem
+        return self._estatisticas.max_memoria
     
     @property
     def nos_repetidos(self):
-        return No.nos_repetidos
\ No newline at end of file
+        return self._estatisticas.nos_repetidos
\ No newline at end of file
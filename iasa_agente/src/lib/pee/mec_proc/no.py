@@ -13,11 +13,10 @@ class No:
        - Profundidade na árvore
        - Custo acumulado do caminho
     """
-    #os seguintes atributos foram criados como estáticos, pois são comuns a todos os objetos da classe "No"
-    nos_criados = 0
-    nos_eliminados = 0
-    max_nos_em_mem = 0
-    nos_repetidos = 0
+    #os atributos são declarados em __slots__, evitando um dicionário por instância,
+    #pois uma procura pode criar centenas de milhares de nós
+    __slots__ = ("__estado", "__operador", "__antecessor", "__custo", "__prioridade", "__profundidade")
+
     def __init__(self, estado, operador = None, antecessor = None, custo = 0):
         """
         Construtor do nó de procura
@@ -45,14 +44,6 @@ class No:
             self.__profundidade = antecessor.__profundidade + 1
         else:
             self.__profundidade = 0
-            No.nos_criados = 0
-            No.nos_eliminados = 0
-        
-        No.nos_criados += 1
-        var_aux = No.nos_criados - No.nos_eliminados
-
-        if (var_aux > No.max_nos_em_mem):
-            No.max_nos_em_mem = var_aux
     
     @property
     def profundidade(self):
@@ -138,7 +129,4 @@ class No:
     Função necessária para o avaliador poder comparar nós
     """
     def __lt__(self, outro_no):
-        return self.prioridade < outro_no.prioridade
-    
-    def __del__(self):
-        No.nos_eliminados += 1
\ No newline at end of file
+        return self.prioridade < outro_no.prioridade
\ No newline at end of file
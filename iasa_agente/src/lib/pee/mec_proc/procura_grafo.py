@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
 from pee.mec_proc.mecanismo_procura import MecanismoProcura
-from pee.mec_proc.no import No
 
 class ProcuraGrafo(MecanismoProcura, ABC):
     """
     Classe abstrata que estende MecanismoProcura para implementar procura em grafos,
     evitando estados repetidos através de uma memória de nós explorados
+
+    A memória separa os nós abertos dos fechados:
+    - _explorados: índice com o melhor nó (menor custo) conhecido para cada estado
+    - _fechados: conjunto dos estados já expandidos
+
+    Quando um estado é alcançado por um caminho melhor, o novo nó substitui o anterior
+    no índice e o nó antigo permanece na fronteira até ser removido, sendo nessa altura
+    descartado como obsoleto (remoção diferida), em vez de ser expandido novamente
     
     Fundamentação teórica:
     - 10-pee-1.pdf, página 27: existe a necessidade de haver memória de nós explorados
@@ -19,7 +26,8 @@ class ProcuraGrafo(MecanismoProcura, ABC):
         
         Funcionamento:
         - Chama a inicialização da superclasse (MecanismoProcura) para preparar a fronteira
-        - Cria um dicionário vazio para armazenar nós explorados (estados já visitados)
+        - Cria um dicionário vazio para o melhor nó conhecido de cada estado
+        - Cria um conjunto vazio para os estados fechados (já expandidos)
         
         Fundamentação teórica:
         - 10-pee-1.pdf, página 27: estruturas de memória
@@ -29,6 +37,7 @@ class ProcuraGrafo(MecanismoProcura, ABC):
         """
         super()._iniciar_memoria()
         self._explorados = {}
+        self._fechados = set()
     
     def _memorizar(self, no):
         """
@@ -40,7 +49,9 @@ class ProcuraGrafo(MecanismoProcura, ABC):
         Funcionamento:
         1. Verifica se o nó deve ser mantido através do método abstrato _manter(no)
         2. Se sim, adiciona o nó à fronteira (super()._memorizar(no))
-        3. Armazena o nó no dicionário de explorados, indexado pelo estado
+        3. Armazena o nó no dicionário de explorados, indexado pelo estado, substituindo
+           o nó anterior desse estado, que passa a ser obsoleto
+        4. Se o estado já estava fechado, é reaberto, pois foi encontrado um caminho melhor
         
         Fundamentação teórica:
         - 10-pee-1.pdf, página 28: pseudocódigo mostra a inserção condicional
@@ -49,8 +60,48 @@ class ProcuraGrafo(MecanismoProcura, ABC):
         if self._manter(no):
             super()._memorizar(no)
             self._explorados[no.estado] = no
+            self._fechados.discard(no.estado)
         else:
-            No.nos_repetidos += 1
+            self._estatisticas.nos_repetidos += 1
+
+    def _obsoleto(self, no):
+        """
+        Verifica se um nó removido da fronteira foi substituído por um nó de menor custo
+
+        Parâmetros:
+        - no (No): Nó removido da fronteira
+
+        Retorno:
+        - bool: True se o nó já não é o melhor nó conhecido para o seu estado
+
+        Funcionamento:
+        - O nó é obsoleto se o índice de explorados referir outro nó para o mesmo estado;
+          nesse caso é contabilizado como repetido e não volta a ser expandido
+        """
+        if self._explorados[no.estado] is not no:
+            self._estatisticas.nos_repetidos += 1
+            return True
+        return False
+
+    def _nos_em_memoria(self):
+        """
+        Número de nós em memória: nós na fronteira e nós dos estados fechados
+        """
+        return len(self._fronteira) + len(self._fechados)
+
+    def _expandir(self, problema, no):
+        """
+        Expande um nó, marcando o seu estado como fechado
+
+        Parâmetros:
+        - problema: Contém os operadores disponíveis
+        - no (No): Nó a ser expandido
+
+        Retorno:
+        - Lista de nós sucessores válidos
+        """
+        self._fechados.add(no.estado)
+        return super()._expandir(problema, no)
     
     @abstractmethod
     def _manter(self, no):
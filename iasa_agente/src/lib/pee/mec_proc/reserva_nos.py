@@ -0,0 +1,154 @@
+from array import array
+
+class ReservaNos:
+    """
+    Reserva compacta de nós de procura, organizada como vetores paralelos
+    (estrutura de vetores em vez de vetor de estruturas)
+
+    Cada nó é identificado pelo seu índice na reserva, sendo guardados, para cada índice:
+    - o identificador do estado (os estados são registados uma única vez)
+    - o índice do nó antecessor (-1 para o nó raiz)
+    - o índice do operador na lista de operadores do problema (-1 para o nó raiz)
+    - o custo acumulado g(n)
+    - a profundidade
+
+    Deste modo, cada nó ocupa apenas alguns bytes nos vetores do módulo array, em vez
+    de um objeto No, e o caminho até um nó é reconstruído a partir dos índices dos
+    antecessores
+
+    Fundamentação teórica:
+    - 10-pee-1.pdf, slides 5 e 6: um nó da árvore de procura guarda o estado, o operador,
+      o nó antecessor, a profundidade e o custo, que são os campos de cada vetor
+    """
+    def __init__(self, operadores):
+        """
+        Inicializa uma reserva vazia
+
+        Parâmetros:
+        - operadores: Lista dos operadores do problema, indexada pelos nós
+        """
+        self.__operadores = operadores
+        self.__estados = [] # estado de cada identificador
+        self.__ids = {} # identificador de cada estado
+        self.__estado_no = array("i")
+        self.__antecessor = array("i")
+        self.__operador = array("h")
+        self.__custo = array("d")
+        self.__profundidade = array("i")
+
+    def identificar(self, estado):
+        """
+        Obtém o identificador de um estado, registando-o se ainda não for conhecido
+
+        Parâmetros:
+        - estado: Estado a identificar
+
+        Retorno:
+        - int: Identificador do estado (sequencial, a partir de 0)
+        """
+        id_estado = self.__ids.get(estado)
+        if id_estado is None:
+            id_estado = len(self.__estados)
+            self.__ids[estado] = id_estado
+            self.__estados.append(estado)
+        return id_estado
+
+    def criar(self, id_estado, operador = -1, antecessor = -1, custo = 0.0):
+        """
+        Cria um nó na reserva
+
+        Parâmetros:
+        - id_estado: Identificador do estado do nó (ver identificar)
+        - operador: Índice do operador que gerou o estado (-1 para o nó raiz)
+        - antecessor: Índice do nó antecessor (-1 para o nó raiz)
+        - custo: Custo acumulado desde o nó raiz
+
+        Retorno:
+        - int: Índice do nó criado
+        """
+        self.__estado_no.append(id_estado)
+        self.__antecessor.append(antecessor)
+        self.__operador.append(operador)
+        self.__custo.append(custo)
+        self.__profundidade.append(self.__profundidade[antecessor] + 1 if antecessor >= 0 else 0)
+        return len(self.__estado_no) - 1
+
+    def __len__(self):
+        return len(self.__estado_no)
+
+    @property
+    def num_estados(self):
+        """
+        Número de estados distintos registados
+        """
+        return len(self.__estados)
+
+    def id_estado(self, indice):
+        return self.__estado_no[indice]
+
+    def estado(self, indice):
+        return self.__estados[self.__estado_no[indice]]
+
+    def antecessor(self, indice):
+        return self.__antecessor[indice]
+
+    def operador(self, indice):
+        num_operador = self.__operador[indice]
+        return self.__operadores[num_operador] if num_operador >= 0 else None
+
+    def custo(self, indice):
+        return self.__custo[indice]
+
+    def profundidade(self, indice):
+        return self.__profundidade[indice]
+
+    def no(self, indice):
+        """
+        Obtém uma vista de um nó da reserva com a interface de No, para uso em Solucao
+
+        Parâmetros:
+        - indice: Índice do nó
+
+        Retorno:
+        - NoReserva: Vista do nó
+        """
+        return NoReserva(self, indice)
+
+class NoReserva:
+    """
+    Vista de um nó de uma ReservaNos com a mesma interface de leitura de No
+    (estado, operador, antecessor, custo e profundidade)
+
+    As vistas são criadas apenas quando necessárias, por exemplo, para construir a
+    Solucao a partir do nó final, percorrendo os índices dos antecessores
+    """
+    __slots__ = ("__reserva", "__indice")
+
+    def __init__(self, reserva, indice):
+        self.__reserva = reserva
+        self.__indice = indice
+
+    @property
+    def indice(self):
+        return self.__indice
+
+    @property
+    def estado(self):
+        return self.__reserva.estado(self.__indice)
+
+    @property
+    def operador(self):
+        return self.__reserva.operador(self.__indice)
+
+    @property
+    def antecessor(self):
+        indice = self.__reserva.antecessor(self.__indice)
+        return NoReserva(self.__reserva, indice) if indice >= 0 else None
+
+    @property
+    def custo(self):
+        return self.__reserva.custo(self.__indice)
+
+    @property
+    def profundidade(self):
+        return self.__reserva.profundidade(self.__indice)
\ No newline at end of file
@@ -10,15 +10,21 @@ class Solucao:
     Referências cruzadas:
     - P3-iasa-proj.pdf (slide 5): Diagrama da classe Solucao
     - 10-pee-1.pdf (slide 13): Solução como sequência de nós
+
+    O nó final pode ser um No ou uma vista NoReserva, caso em que o caminho é
+    reconstruído a partir dos índices dos antecessores guardados na ReservaNos
     """
     def __init__(self, no_final):
         self.__no_final = no_final
         self.__passos = []
         no = no_final
-        while no.antecessor:
-            passo = PassoSolucao(no.antecessor.estado, no.operador) # Criar um novo passo
-            self.__passos.insert(0, passo) # Inserir o passo no início da lista
-            no = no.antecessor # Andar com o nó para trás sucessivamente até não haver mais nenhum antecessor
+        antecessor = no.antecessor
+        while antecessor:
+            passo = PassoSolucao(antecessor.estado, no.operador) # Criar um novo passo
+            self.__passos.append(passo) # Os passos são obtidos do fim para o início
+            no = antecessor # Andar com o nó para trás sucessivamente até não haver mais nenhum antecessor
+            antecessor = no.antecessor
+        self.__passos.reverse() # Ordenar os passos do estado inicial para o objetivo
 
     def __iter__(self):
         return iter(self.__passos) #iterador para a lista de passos
@@ -26,6 +32,13 @@ class Solucao:
     def __getitem__(self, index):
         return self.__passos[index]
     
+    @property
+    def estado_final(self):
+        """
+        Estado alcançado no fim do percurso da solução (estado objetivo)
+        """
+        return self.__no_final.estado
+
     @property
     def dimensao(self):
         """
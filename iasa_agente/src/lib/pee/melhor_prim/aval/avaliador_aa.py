@@ -28,7 +28,8 @@ class AvaliadorAA(AvaliadorHeur):
         
         Funcionamento:
         1. Obtém o custo acumulado do nó (g(n)) através de no.custo
-        2. Calcula a heurística h(n) aplicando self.heuristica.h(no.estado)
+        2. Calcula a heurística h(n) aplicando self._heuristica.h(no.estado), acedendo
+           diretamente ao atributo, pois este método é chamado em cada inserção na fronteira
         3. Retorna a soma g(n) + h(n), que prioriza nós com menor custo total estimado
         
         Fundamentação teórica:
@@ -39,4 +40,4 @@ class AvaliadorAA(AvaliadorHeur):
         - P3-iasa-proj.pdf, página 14: Mostra a integração deste avaliador
           com a classe ProcuraAA para implementar o algoritmo A* completo
         """
-        return no.custo + self.heuristica.h(no.estado)
\ No newline at end of file
+        return no.custo + self._heuristica.h(no.estado)
\ No newline at end of file
@@ -33,4 +33,4 @@ class AvaliadorSofrega(AvaliadorHeur):
         - P3-iasa-proj.pdf, página 14: mostra o uso deste avaliador em
         ProcuraSofrega para implementar o algoritmo de procura sôfrega
         """
-        return self.heuristica.h(no.estado)
\ No newline at end of file
+        return self._heuristica.h(no.estado)
\ No newline at end of file
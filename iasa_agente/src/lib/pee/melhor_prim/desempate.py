@@ -0,0 +1,39 @@
+from enum import Enum
+
+class Desempate(Enum):
+    """
+    Critérios de desempate entre nós com a mesma prioridade na FronteiraPrioridade
+
+    - MAIOR_CUSTO: prefere o nó com maior custo acumulado g(n), ou seja, o mais
+      próximo do objetivo segundo a heurística, quando f(n) = g(n) + h(n)
+    - MENOR_HEUR: prefere o nó com menor estimativa heurística h(n), obtida da heurística
+      do avaliador, pelo que requer um avaliador heurístico (A* ou procura sôfrega)
+    - FIFO: mantém a ordem de inserção dos nós
+
+    Fundamentação teórica:
+    - 12-pee-3.pdf, página 20: em A*, todos os nós com f(n) menor que o custo da
+      solução ótima são expandidos, mas entre os nós com f(n) igual a esse custo
+      a ordem de expansão é livre, podendo ser escolhida de modo a aproximar a
+      procura do objetivo e reduzir o número de nós expandidos
+    """
+    MAIOR_CUSTO = "maior_custo"
+    MENOR_HEUR = "menor_heur"
+    FIFO = "fifo"
+
+    def chave(self, no, prioridade, avaliador):
+        """
+        Calcula a chave de desempate de um nó
+
+        Parâmetros:
+        - no (No): Nó a inserir na fronteira
+        - prioridade: Prioridade f(n) do nó, calculada pelo avaliador
+        - avaliador (Avaliador): Avaliador da fronteira, cuja heurística dá h(n)
+
+        Retorno:
+        - Valor a comparar entre nós com a mesma prioridade (menor é preferido)
+        """
+        if self is Desempate.MAIOR_CUSTO:
+            return -no.custo
+        if self is Desempate.MENOR_HEUR:
+            return avaliador.heuristica.h(no.estado)
+        return 0
\ No newline at end of file
@@ -1,4 +1,7 @@
+from itertools import count
 from pee.mec_proc.fronteira import Fronteira
+from pee.melhor_prim.aval.avaliador_heur import AvaliadorHeur
+from pee.melhor_prim.desempate import Desempate
 import heapq as hq #utilizada para estruturar dados de forma prioritária
 
 class FronteiraPrioridade(Fronteira):
@@ -7,6 +10,10 @@ class FronteiraPrioridade(Fronteira):
     onde os nós são ordenados dinamicamente conforme uma função de avaliação
     Utiliza a estrutura heap para eficiência nas operações de inserção/remoção
 
+    Cada entrada do heap é um tuplo (prioridade, desempate, ordem, no), de modo
+    que as comparações entre entradas são comparações nativas de tuplos, sem
+    recorrer a No.__lt__; o contador de ordem garante que o nó nunca é comparado
+
     Fundamentação teórica:
     - P3-iasa-proj.pdf, página 11 e 12: os diagramas de classes mostram FronteiraPrioridade
     como uma classe que precisa de um avaliador e que é usado em algoritmos de procura
@@ -15,23 +22,52 @@ class FronteiraPrioridade(Fronteira):
     Procura Informada, onde a procura é guiada, ou seja, o espaço de estados não é
     exaustivamente explorado
     """
-    def __init__(self, avaliador):
+    def __init__(self, avaliador, desempate=Desempate.FIFO):
         """
         Inicializa a fronteira com um avaliador de prioridades
 
         Parâmetros:
         - avaliador (Avaliador): Objeto que calcula a prioridade dos nós
+        - desempate (Desempate): Critério de ordenação dos nós com a mesma prioridade
+
+        Exceções:
+        - ValueError: se o desempate MENOR_HEUR for usado com um avaliador sem heurística
 
         Funcionamento:
         1. Chama o construtor da superclasse Fronteira para inicializar a lista _nos
-        2. Armazena o avaliador que será usado para calcular prioridades
+        2. Armazena o avaliador que será usado para calcular prioridades, guardando
+           também o método prioridade, para evitar a sua procura em cada inserção
+        3. Armazena o critério de desempate
 
         Fundamentação teórica:
         - P3-iasa-proj.pdf, página 11: Mostra a relação entre FronteiraPrioridade
           e os avaliadores no diagrama de arquitetura
         """
+        if desempate is Desempate.MENOR_HEUR and not isinstance(avaliador, AvaliadorHeur):
+            raise ValueError(f"Desempate {desempate.name} requer um avaliador com heurística")
         super().__init__()
         self.__avaliador = avaliador
+        self.__prioridade = avaliador.prioridade
+        self.__desempate = desempate
+
+    def iniciar(self):
+        """
+        Inicia a fronteira com uma lista vazia
+
+        Funcionamento:
+        - Ao contrário das fronteiras FIFO e LIFO, que usam uma deque, o heap
+        do módulo heapq tem de ser uma lista, pois é indexado por posição
+        - Reinicia o contador da ordem de inserção
+        """
+        self._nos = []
+        self.__ordem = count()
+
+    @property
+    def desempate(self):
+        """
+        Critério de desempate entre nós com a mesma prioridade
+        """
+        return self.__desempate
 
     def inserir(self, no):
         """
@@ -43,7 +79,8 @@ class FronteiraPrioridade(Fronteira):
         Funcionamento:
         1. Calcula a prioridade do nó usando self.__avaliador.prioridade(no).
         2. Atribui a prioridade ao nó (no.prioridade).
-        3. Insere o nó no heap usando heapq.heappush para manter a ordem.
+        3. Insere o tuplo (prioridade, desempate, ordem, nó) no heap usando
+           heapq.heappush para manter a ordem.
 
         Fundamentação teórica:
         - P3-iasa-proj, página 11: o diagrama mostra a necessidade de implementação
@@ -53,8 +90,10 @@ class FronteiraPrioridade(Fronteira):
         sucessores na fronteira, ou seja, expandir o(s) nó(s) anterior(es), e como 
         esta classe estende de Fronteira, este método teve de ser implementado
         """
-        no.prioridade = self.__avaliador.prioridade(no) #alterar a prioridade do nó, consoante a avaliação do avaliador
-        hq.heappush(self._nos, no)
+        prioridade = self.__prioridade(no)
+        no.prioridade = prioridade #alterar a prioridade do nó, consoante a avaliação do avaliador
+        hq.heappush(self._nos, (prioridade, self.__desempate.chave(no, prioridade, self.__avaliador),
+                                next(self.__ordem), no))
 
     def remover(self):
         """
@@ -64,7 +103,8 @@ class FronteiraPrioridade(Fronteira):
         - No - Nó com maior prioridade na fronteira
 
         Funcionamento:
-        1. Usa heapq.heappop para extrair eficientemente o nó mais prioritário
+        1. Usa heapq.heappop para extrair eficientemente a entrada mais prioritária,
+           retornando o nó nela contido
         2. Mantém a propriedade de heap após a remoção
 
         Fundamentação teórica:
@@ -75,4 +115,15 @@ class FronteiraPrioridade(Fronteira):
         - P3-iasa-proj.pdf, página 7: Mostra este método como parte da
         classe abstrata Fronteira
         """
-        return hq.heappop(self._nos)
\ No newline at end of file
+        return hq.heappop(self._nos)[-1]
+
+    @property
+    def prioridade_minima(self):
+        """
+        Menor prioridade presente na fronteira (None se estiver vazia), sem remover o nó
+        """
+        return self._nos[0][0] if self._nos else None
+
+    def __contains__(self, no):
+        #as entradas do heap são tuplos, pelo que se compara o nó de cada entrada
+        return any(entrada[-1] is no for entrada in self._nos)
\ No newline at end of file
@@ -39,4 +39,18 @@ class Heuristica(ABC):
         para cada nó n, o seu sucessor n' e o custo de transição c(n,n'): 
             - h(n) ≤ c(n,n') + h(n'), para qualquer transição n→n'
         """
-        pass
\ No newline at end of file
+        pass
+
+    def inversa(self, estado_inicial):
+        """
+        Heurística para o sentido inverso da procura, que estima o custo desde um estado
+        até ao estado inicial (usada pela procura bidirecional)
+
+        Parâmetros:
+        - estado_inicial (Estado) - Estado inicial do problema
+
+        Retorno:
+        - Heuristica - Heurística para o estado inicial, ou None se não for possível
+          obtê-la, caso em que a procura inversa não é informada
+        """
+        return None
\ No newline at end of file
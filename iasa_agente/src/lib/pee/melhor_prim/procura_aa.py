@@ -1,4 +1,5 @@
 from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.desempate import Desempate
 from pee.melhor_prim.procura_informada import ProcuraInformada
 
 class ProcuraAA(ProcuraInformada):
@@ -15,9 +16,14 @@ class ProcuraAA(ProcuraInformada):
     - P3-iasa-proj.pdf, página 14: o diagrama de classes mostra ProcuraAA como
     especialização de ProcuraInformada, que por sua vez, herda de ProcuraMelhorPrim
     """
-    def __init__(self):
+    def __init__(self, desempate=Desempate.MAIOR_CUSTO):
         """
         Inicializa o mecanismo de procura A* com um AvaliadorAA configurado
+
+        Parâmetros:
+        - desempate (Desempate): Critério de ordenação dos nós com o mesmo f(n); por
+          omissão prefere o maior g(n), ou seja, os nós mais próximos do objetivo, o que
+          reduz o número de nós expandidos quando há muitos caminhos de igual custo
         
         Funcionamento:
         1. Cria uma instância de AvaliadorAA (que implementa f(n) = g(n) + h(n))
@@ -28,4 +34,4 @@ class ProcuraAA(ProcuraInformada):
         - P3-iasa-proj.pdf, página 15: diagrama mostra a dependência desta classe
         de AvaliadorAA, daí ter que se passar AvaliadorAA como parâmetro
         """
-        super().__init__(AvaliadorAA())
\ No newline at end of file
+        super().__init__(AvaliadorAA(), desempate)
\ No newline at end of file
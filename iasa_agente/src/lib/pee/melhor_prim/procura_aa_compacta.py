@@ -0,0 +1,123 @@
+from array import array
+from struct import Struct
+from time import perf_counter
+import heapq as hq
+
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.reserva_nos import ReservaNos
+from pee.mec_proc.solucao import Solucao
+
+class ProcuraAACompacta(MecanismoProcura):
+    """
+    Procura A* sobre uma reserva compacta de nós (ReservaNos)
+
+    A fronteira guarda, para cada nó, um único inteiro com a chave (f, -g, índice do nó),
+    sendo os empates em f(n) resolvidos pelo maior custo acumulado, como em ProcuraAA por
+    omissão; como f(n) e g(n) não são negativos, a ordem dos seus valores é a ordem da sua
+    representação binária (IEEE 754), pelo que a chave é a concatenação dos 64 bits de f(n),
+    dos 64 bits de g(n) complementados e dos 32 bits do índice, e é comparada de forma nativa
+    pelo heap, ocupando muito menos memória do que um tuplo com três objetos. A memória
+    de explorados é um vetor com o índice do melhor nó conhecido para cada estado
+    (indexado pelo identificador do estado na reserva). Os nós substituídos por um
+    nó de menor custo são descartados quando removidos da fronteira, tal como em
+    ProcuraGrafo
+
+    Só são criados na reserva os nós que entram na fronteira, pelo que os nós
+    repetidos não chegam a ocupar memória
+
+    Fundamentação teórica:
+    - 12-pee-3.pdf, página 20: algoritmo A*, com f(n) = g(n) + h(n)
+    - 10-pee-1.pdf, página 27: memória de nós explorados para evitar estados repetidos
+    """
+    BITS_INDICE = 32
+    MASCARA_INDICE = (1 << BITS_INDICE) - 1
+    MASCARA_CUSTO = (1 << 64) - 1
+
+    def __init__(self):
+        """
+        Inicializa o mecanismo sem fronteira partilhada, pois a fronteira é criada em cada procura
+        """
+        super().__init__(None)
+
+    @classmethod
+    def chave(cls, f, custo, indice, _bits = Struct("<Q").unpack, _real = Struct("<d").pack):
+        """
+        Chave de um nó na fronteira, com a mesma ordem do tuplo (f, -custo, indice), para
+        f e custo não negativos (a soma com 0.0 converte -0.0 em 0.0)
+        """
+        bits_f = _bits(_real(f + 0.0))[0]
+        bits_custo = _bits(_real(custo + 0.0))[0] ^ cls.MASCARA_CUSTO
+        return (((bits_f << 64) | bits_custo) << cls.BITS_INDICE) | indice
+
+    def procurar(self, problema, heuristica):
+        """
+        Executa a procura A* com uma dada heurística
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+        - heuristica (Heuristica): Função heurística que estima o custo até ao objetivo
+
+        Retorno:
+        - Solucao: Sequência de passos do estado inicial ao objetivo, ou None
+        """
+        self._heuristica = heuristica
+        return super().procurar(problema)
+
+    def _procurar(self, problema):
+        """
+        Executa a procura A*, acumulando as estatísticas em self._estatisticas
+
+        Funcionamento:
+        1. Cria a reserva de nós e a fronteira com o nó inicial
+        2. Enquanto a fronteira não estiver vazia:
+           a) Remove a entrada com menor f(n), descartando-a se o nó já não for o
+              melhor conhecido para o seu estado
+           b) Se o estado for objetivo, retorna a solução, reconstruída a partir dos índices
+           c) Senão, para cada sucessor com custo menor que o melhor conhecido para o seu
+              estado, cria o nó na reserva e insere-o na fronteira
+        3. Retorna None se a fronteira esvaziar sem solução
+        """
+        estatisticas = self._estatisticas
+        inicio = perf_counter()
+        try:
+            h = self._heuristica.h
+            chave = self.chave
+            mascara_indice = self.MASCARA_INDICE
+            operadores = list(problema.operadores)
+            reserva = ReservaNos(operadores)
+            estado = problema.estado_inicial
+            melhor = array("i", [reserva.criar(reserva.identificar(estado))])
+            estatisticas.nos_gerados += 1
+            fronteira = [chave(h(estado), 0.0, 0)]
+            while fronteira:
+                indice = hq.heappop(fronteira) & mascara_indice
+                if melhor[reserva.id_estado(indice)] != indice:
+                    estatisticas.nos_repetidos += 1
+                    continue # entrada antiga da fronteira, entretanto substituída
+                estado = reserva.estado(indice)
+                if problema.objectivo(estado):
+                    return Solucao(reserva.no(indice))
+                inicio_fase = perf_counter()
+                custo = reserva.custo(indice)
+                for num_operador, operador in enumerate(operadores):
+                    estado_suc = operador.aplicar(estado)
+                    if estado_suc == None:
+                        continue
+                    estatisticas.nos_gerados += 1
+                    custo_suc = custo + operador.custo(estado, estado_suc)
+                    id_suc = reserva.identificar(estado_suc)
+                    if id_suc < len(melhor):
+                        if custo_suc >= reserva.custo(melhor[id_suc]):
+                            estatisticas.nos_repetidos += 1
+                            continue
+                    else:
+                        melhor.append(-1)
+                    indice_suc = reserva.criar(id_suc, num_operador, indice, custo_suc)
+                    melhor[id_suc] = indice_suc
+                    hq.heappush(fronteira, chave(custo_suc + h(estado_suc), custo_suc, indice_suc))
+                estatisticas.tempo_expandir += perf_counter() - inicio_fase
+                estatisticas.nos_expandidos += 1
+                estatisticas.max_fronteira = max(estatisticas.max_fronteira, len(fronteira))
+                estatisticas.max_memoria = len(reserva) #os nós da reserva nunca são removidos
+        finally:
+            estatisticas.tempo_total += perf_counter() - inicio
\ No newline at end of file
@@ -1,4 +1,6 @@
+from pee.mec_proc.solucao import Solucao
 from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
+from pee.melhor_prim.desempate import Desempate
 from pee.melhor_prim.procura_melhor_prim import ProcuraMelhorPrim
 
 class ProcuraCustoUnif(ProcuraMelhorPrim):
@@ -14,12 +16,15 @@ class ProcuraCustoUnif(ProcuraMelhorPrim):
     herda de ProcuraMelhorPrim, ou seja, é uma implementação de ProcuraMelhorPrim, e
     ainda dependende do AvaliadorCustoUnif
     """
-    def __init__(self):
+    def __init__(self, desempate=Desempate.FIFO):
         """
         Inicializa o mecanismo de procura com um AvaliadorCustoUnif,
         que prioriza nós exclusivamente pelo custo acumulado até um certo
         estado n (g(n))
 
+        Parâmetros:
+        - desempate (Desempate): Critério de ordenação dos nós com o mesmo custo
+
         Funcionamento:
         1. Cria uma instância de AvaliadorCustoUnif (que implementa f(n) = g(n))
         2. Passa o avaliador para a superclasse ProcuraMelhorPrim
@@ -31,4 +36,49 @@ class ProcuraCustoUnif(ProcuraMelhorPrim):
         - P3-iasa-proj.pdf, página 14: segundo o diagrama, esta classe conta
         apenas com o construtor
         """
-        super().__init__(AvaliadorCustoUnif())
\ No newline at end of file
+        super().__init__(AvaliadorCustoUnif(), desempate)
+        self._por_alcancar = None
+        self._solucoes = {}
+
+    def procurar_objectivos(self, problema, objectivos):
+        """
+        Procura de custo uniforme a partir do estado inicial até todos os objetivos indicados
+        (varrimento de Dijkstra), obtendo numa única procura o percurso ótimo para cada um
+
+        Parâmetros:
+        - problema: problema que define o estado inicial e os operadores (o seu teste de
+        objetivo não é utilizado)
+        - objectivos: estados objetivo a alcançar
+
+        Retorno:
+        - dict: solução ótima (Solucao) para cada objetivo alcançável; os objetivos não
+        alcançáveis não estão presentes
+
+        Funcionamento:
+        - A procura só termina quando todos os objetivos foram removidos da fronteira ou
+        quando a fronteira fica vazia
+        - Como os nós são removidos por ordem crescente de custo, quando um objetivo é
+        removido da fronteira o seu custo é ótimo, e a solução é registada nesse momento
+        - O custo de cada solução (solucao.custo) forma a tabela de distâncias do estado
+        inicial aos objetivos
+        """
+        self._por_alcancar = set(objectivos)
+        self._solucoes = {}
+        try:
+            if self._por_alcancar:
+                self.procurar(problema)
+            return self._solucoes
+        finally:
+            self._por_alcancar = None
+
+    def _objectivo(self, problema, no):
+        """
+        Teste de objetivo; na procura de vários objetivos, regista a solução de cada
+        objetivo alcançado e só termina a procura quando todos foram alcançados
+        """
+        if self._por_alcancar is None:
+            return super()._objectivo(problema, no)
+        if no.estado in self._por_alcancar:
+            self._por_alcancar.discard(no.estado)
+            self._solucoes[no.estado] = Solucao(no)
+        return not self._por_alcancar
\ No newline at end of file
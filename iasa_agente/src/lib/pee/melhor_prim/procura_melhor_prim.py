@@ -1,6 +1,7 @@
 from abc import ABC
 from pee.mec_proc.no import No
 from pee.mec_proc.procura_grafo import ProcuraGrafo
+from pee.melhor_prim.desempate import Desempate
 from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
 
 class ProcuraMelhorPrim(ProcuraGrafo, ABC):
@@ -15,17 +16,18 @@ class ProcuraMelhorPrim(ProcuraGrafo, ABC):
     procuras informadas
     - 11-pee-2.pdf, página 20: descreve o algoritmo genérico de melhor-primeiro
     """
-    def __init__(self, avaliador):
+    def __init__(self, avaliador, desempate=Desempate.FIFO):
         """
         Inicializa o mecanismo de procura com um avaliador específico
 
         Parâmetros:
         - avaliador (Avaliador) - Objeto que calcula prioridades para os nós
+        - desempate (Desempate) - Critério de ordenação dos nós com a mesma prioridade
 
         Funcionamento:
         1. Armazena o avaliador para uso posterior
         2. Inicializa a superclasse ProcuraGrafo com uma FronteiraPrioridade
-        configurada com o avaliador
+        configurada com o avaliador e o critério de desempate
 
         Fundamentação teórica:
         - P3-iasa-proj.pdf, página 12: o diagrama mostra a utilização de um
@@ -36,7 +38,7 @@ class ProcuraMelhorPrim(ProcuraGrafo, ABC):
         ser explorado
         """
         self._avaliador = avaliador
-        super().__init__(FronteiraPrioridade(self._avaliador))
+        super().__init__(FronteiraPrioridade(self._avaliador, desempate))
     
     def _manter(self, no):
         """
@@ -52,7 +54,8 @@ class ProcuraMelhorPrim(ProcuraGrafo, ABC):
         Funcionamento:
         1. Mantém o nó se seu estado nunca foi explorado
         2. Se o estado já tivesse sido explorado, mantém-se apenas se o novo caminho
-        tiver custo menor que o anterior (self._explorados[no.estado].custo)
+        tiver custo menor que o melhor conhecido (self._explorados[no.estado].custo);
+        o nó anterior fica obsoleto e é descartado quando sair da fronteira
 
         Fundamentação teórica:
         - 12-pee-3.pdf, página 26: para garantir otimismo durante a procura,
@@ -62,5 +65,5 @@ class ProcuraMelhorPrim(ProcuraGrafo, ABC):
         - P3-iasa-proj.pdf, página 8: descreve o método _manter como parte
         do contrato para procura em grafos
         """
-        return no.estado not in self._explorados or \
-               no.custo < self._explorados[no.estado].custo
\ No newline at end of file
+        melhor = self._explorados.get(no.estado)
+        return melhor is None or no.custo < melhor.custo
\ No newline at end of file
@@ -1,4 +1,5 @@
 from pee.melhor_prim.aval.avaliador_sofrega import AvaliadorSofrega
+from pee.melhor_prim.desempate import Desempate
 from pee.melhor_prim.procura_informada import ProcuraInformada
 
 class ProcuraSofrega(ProcuraInformada):
@@ -12,11 +13,14 @@ class ProcuraSofrega(ProcuraInformada):
     puramente guiada por heurísticas, onde as soluções são sub-ótimas, 
     e há a minimização da estimativa do custo para atingir o objetivo
     """
-    def __init__(self):
+    def __init__(self, desempate=Desempate.FIFO):
         """
         Inicializa o mecanismo de procura com um AvaliadorSofrega,
         que implementa a estratégia de priorizar apenas h(n)
 
+        Parâmetros:
+        - desempate (Desempate): Critério de ordenação dos nós com o mesmo h(n)
+
         Funcionamento:
         1. Cria uma instância de AvaliadorSofrega (f(n) = h(n))
         2. Passa o avaliador para a superclasse
@@ -26,4 +30,4 @@ class ProcuraSofrega(ProcuraInformada):
         - P3-iasa-proj.pdf, página 15: é percetível que esta classe
         herda de ProcuraInformada e que usa o AvaliadorSofrega
         """
-        super().__init__(AvaliadorSofrega())
\ No newline at end of file
+        super().__init__(AvaliadorSofrega(), desempate)
\ No newline at end of file
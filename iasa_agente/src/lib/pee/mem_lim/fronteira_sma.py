@@ -0,0 +1,92 @@
+from itertools import count
+import heapq as hq
+
+from pee.mec_proc.fronteira import Fronteira
+
+class FronteiraSMA(Fronteira):
+    """
+    Fronteira da procura A* com memória limitada (SMA*), que permite remover
+    tanto o nó mais prioritário (menor f, desempate pelo mais profundo) como o
+    menos prioritário (maior f, desempate pelo menos profundo)
+
+    A prioridade de cada nó é o valor de no.prioridade no momento da inserção, podendo
+    um nó ser reinserido com outra prioridade; são mantidos dois heaps, com remoção
+    diferida das entradas cujo nó já não está na fronteira ou cuja prioridade mudou
+
+    Fundamentação teórica:
+    - Russell (1992), "Efficient Memory-Bounded Search Methods"
+    """
+    def iniciar(self):
+        """
+        Inicia a fronteira vazia
+
+        Funcionamento:
+        - self._nos guarda a prioridade atual de cada nó na fronteira
+        - self.__melhores e self.__piores são os heaps de entradas dos dois extremos
+        """
+        self._nos = {}
+        self.__melhores = []
+        self.__piores = []
+        self.__ordem = count()
+
+    def inserir(self, no):
+        """
+        Insere um nó na fronteira, ou atualiza a sua prioridade se já estiver presente
+        """
+        prioridade = no.prioridade
+        self._nos[no] = prioridade
+        ordem = next(self.__ordem)
+        hq.heappush(self.__melhores, (prioridade, -no.profundidade, ordem, no))
+        hq.heappush(self.__piores, (-prioridade, no.profundidade, ordem, no))
+
+    def remover(self):
+        """
+        Remove e retorna o nó com menor prioridade (o mais profundo, em caso de empate)
+        """
+        while True:
+            prioridade, _, _, no = hq.heappop(self.__melhores)
+            if self._nos.get(no) == prioridade:
+                del self._nos[no]
+                return no
+
+    def remover_pior(self, removivel):
+        """
+        Remove e retorna o nó com maior prioridade (o menos profundo, em caso de empate)
+        entre os nós que satisfazem uma condição
+
+        Parâmetros:
+        - removivel: função que indica se um nó pode ser removido
+
+        Retorno:
+        - No: Nó removido, ou None se nenhum nó puder ser removido
+        """
+        adiados = []
+        no_removido = None
+        while self.__piores:
+            entrada = hq.heappop(self.__piores)
+            no = entrada[-1]
+            if self._nos.get(no) != -entrada[0]:
+                continue # entrada obsoleta
+            if removivel(no):
+                del self._nos[no]
+                no_removido = no
+                break
+            adiados.append(entrada)
+        for entrada in adiados:
+            hq.heappush(self.__piores, entrada)
+        return no_removido
+
+    @property
+    def prioridade_minima(self):
+        """
+        Menor prioridade presente na fronteira (None se estiver vazia)
+        """
+        while self.__melhores:
+            prioridade, _, _, no = self.__melhores[0]
+            if self._nos.get(no) == prioridade:
+                return prioridade
+            hq.heappop(self.__melhores)
+        return None
+
+    def __contains__(self, no):
+        return no in self._nos
\ No newline at end of file
@@ -0,0 +1,136 @@
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.prof.procura_prof import ProcuraProfundidade
+
+class ProcuraIDAA(ProcuraProfundidade):
+    """
+    Procura A* por aprofundamento iterativo (IDA*)
+
+    Realiza procuras em profundidade sucessivas limitadas por um valor máximo de
+    f(n) = g(n) + h(n), em vez de uma profundidade máxima. Em cada iteração, o limite
+    passa a ser o menor f(n) dos nós cortados na iteração anterior, pelo que, com uma
+    heurística admissível, a primeira solução encontrada é ótima
+
+    Tal como em ProcuraProfIter, só são mantidos em memória os nós da fronteira LIFO
+    (e os seus antecessores), ou seja, a memória é proporcional à profundidade da
+    solução; os ciclos são evitados descartando os sucessores cujo estado já está no
+    percurso até ao nó expandido
+
+    Em grafos com muitos caminhos alternativos para o mesmo estado (como as grelhas
+    dos ambientes), a procura em profundidade reexplora cada estado uma vez por
+    caminho; opcionalmente, é usada uma tabela de transposição de dimensão limitada,
+    reiniciada em cada iteração, com o menor custo com que cada estado foi alcançado,
+    sendo descartados os sucessores que alcançam um estado da tabela com custo igual
+    ou superior
+
+    Fundamentação teórica:
+    - 11-pee-2.pdf, páginas 16 e 17: procura em profundidade iterativa
+    - 12-pee-3.pdf, página 20: algoritmo A*, com f(n) = g(n) + h(n)
+    - Korf (1985), "Depth-First Iterative-Deepening: An Optimal Admissible Tree Search"
+    - Reinefeld e Marsland (1994), "Enhanced Iterative-Deepening Search"
+    """
+    def __init__(self, dim_tabela = 10000):
+        """
+        Inicializa o mecanismo de procura
+
+        Parâmetros:
+        - dim_tabela: número máximo de estados na tabela de transposição (0 para não a usar),
+          que limita a memória adicional da procura
+        """
+        super().__init__()
+        self._dim_tabela = dim_tabela
+        self._tabela = {}
+
+    def procurar(self, problema, heuristica):
+        """
+        Executa a procura IDA*
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+        - heuristica (Heuristica): Estimativa do custo até ao objetivo (admissível)
+
+        Retorno:
+        - Solucao: Sequência de passos do estado inicial ao objetivo, ou None
+
+        Funcionamento:
+        1. O limite inicial é h(estado inicial)
+        2. Realiza uma procura em profundidade limitada pelo limite de f(n)
+        3. Se não encontrar solução, o novo limite é o menor f(n) que excedeu o limite;
+           se nenhum nó foi cortado, não existe solução
+        - As estatísticas são acumuladas ao longo das iterações
+        """
+        self._heuristica = heuristica
+        self._estatisticas = EstatisticasProcura()
+        self._limite = heuristica.h(problema.estado_inicial)
+        self._iteracoes = 0
+        while True:
+            self._iteracoes += 1
+            self._limite_seguinte = float("inf")
+            self._tabela = {}
+            solucao = self._procurar(problema)
+            if solucao or self._limite_seguinte == float("inf"):
+                return solucao
+            self._limite = self._limite_seguinte
+
+    @property
+    def iteracoes(self):
+        """
+        Número de iterações (limites de f(n)) da última procura
+        """
+        return self._iteracoes
+
+    def _expandir(self, problema, no):
+        """
+        Expande um nó, descartando os sucessores cujo f(n) excede o limite atual,
+        cujo estado já se encontra no percurso do nó ou que alcançam um estado da
+        tabela de transposição sem menor custo
+
+        Parâmetros:
+        - problema: definição do problema a resolver
+        - no: nó a expandir
+
+        Retorno:
+        - Lista de nós sucessores dentro do limite
+        """
+        sucessores = []
+        for no_sucessor in super()._expandir(problema, no):
+            f = no_sucessor.custo + self._heuristica.h(no_sucessor.estado)
+            if f > self._limite:
+                self._limite_seguinte = min(self._limite_seguinte, f)
+            elif self.__repetido(no_sucessor, no):
+                self._estatisticas.nos_repetidos += 1
+            else:
+                sucessores.append(no_sucessor)
+        return sucessores
+
+    def __repetido(self, no_sucessor, no):
+        """
+        Verifica se um sucessor pode ser descartado por repetir um estado
+
+        Funcionamento:
+        - Se o estado estiver na tabela de transposição com custo menor ou igual, o
+          sucessor é descartado, pois a sua subárvore é explorada a partir do outro nó
+          com um limite de custo restante pelo menos igual (nesta iteração)
+        - Caso contrário, o custo é registado na tabela (se não estiver cheia); os
+          estados fora da tabela são verificados no percurso até ao nó
+        """
+        estado = no_sucessor.estado
+        custo = self._tabela.get(estado)
+        if custo is not None:
+            if no_sucessor.custo >= custo:
+                return True
+            self._tabela[estado] = no_sucessor.custo
+            return False
+        if len(self._tabela) < self._dim_tabela:
+            self._tabela[estado] = no_sucessor.custo
+            return self.__no_percurso(estado, no)
+        return self.__no_percurso(estado, no)
+
+    def __no_percurso(self, estado, no):
+        """
+        Verifica se um estado pertence ao percurso desde o nó raiz até um nó
+        """
+        while no is not None:
+            if no.estado == estado:
+                return True
+            no = no.antecessor
+        return False
\ No newline at end of file
@@ -0,0 +1,208 @@
+from time import perf_counter
+
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.mem_lim.fronteira_sma import FronteiraSMA
+
+class ProcuraSMAA(MecanismoProcura):
+    """
+    Procura A* com memória limitada simplificada (SMA*), com um número máximo de
+    nós em memória
+
+    A árvore de procura é mantida em memória enquanto houver espaço; quando o número
+    de nós excede o limite, é esquecida a folha menos promissora (maior f, a menos
+    profunda em caso de empate) e o seu valor f é guardado no antecessor, que volta
+    à fronteira com prioridade igual ao menor f dos sucessores esquecidos. Quando
+    esse antecessor é de novo o nó mais promissor, os sucessores esquecidos são
+    regenerados com o valor f memorizado
+
+    Para evitar a reexploração dos caminhos alternativos para o mesmo estado, é
+    mantido um índice com o nó de menor custo de cada estado em memória, sendo
+    descartados os sucessores que não melhoram esse custo; se o nó do índice for
+    esquecido, o seu antecessor guarda o seu f e regenera-o, pelo que o estado
+    continua alcançável por um percurso com custo não superior
+
+    Os valores f são monotonamente não decrescentes ao longo de cada percurso
+    (f(n') = max(f(n), g(n') + h(n'))). Um sucessor que, não sendo objetivo, fique à
+    profundidade máxima que cabe em memória recebe f infinito, pois o percurso até
+    ele não pode ser continuado. Com uma heurística admissível, a solução é ótima
+    sempre que o percurso ótimo cabe no limite de nós; se não couber, é retornada
+    a melhor solução que cabe, ou None
+
+    Fundamentação teórica:
+    - 12-pee-3.pdf, página 20: algoritmo A*, com f(n) = g(n) + h(n)
+    - Russell (1992), "Efficient Memory-Bounded Search Methods"
+    """
+    def __init__(self, limite_nos = 1000):
+        """
+        Inicializa o mecanismo de procura
+
+        Parâmetros:
+        - limite_nos: número máximo de nós em memória
+        """
+        super().__init__(FronteiraSMA())
+        self._limite_nos = limite_nos
+
+    def procurar(self, problema, heuristica):
+        """
+        Executa a procura SMA*
+
+        Parâmetros:
+        - problema: Objeto que implementa o modelo do problema
+        - heuristica (Heuristica): Estimativa do custo até ao objetivo (admissível)
+
+        Retorno:
+        - Solucao: Sequência de passos do estado inicial ao objetivo, ou None
+        """
+        self._heuristica = heuristica
+        return super().procurar(problema)
+
+    def _procurar(self, problema):
+        """
+        Executa a procura, acumulando as estatísticas em self._estatisticas
+
+        Funcionamento:
+        1. Insere o nó inicial na fronteira, com f = h(estado inicial)
+        2. Enquanto a fronteira não estiver vazia e o menor f for finito:
+           a) Remove o nó mais promissor; se for objetivo, retorna a solução
+           b) Gera os sucessores que não estão em memória (todos, na primeira expansão,
+              ou apenas os esquecidos, nas seguintes) e insere-os na fronteira
+           c) Enquanto o número de nós exceder o limite, esquece a folha menos promissora
+        3. Retorna None se nenhuma solução couber no limite de nós
+        """
+        estatisticas = self._estatisticas
+        inicio = perf_counter()
+        try:
+            h = self._heuristica.h
+            self._iniciar_memoria()
+            self._sucessores = {} # nó -> sucessores em memória, indexados pelo estado
+            self._esquecidos = {} # nó -> f dos sucessores esquecidos, indexado pelo estado
+            self._explorados = {} # estado -> nó de menor custo em memória
+            self._num_nos = 1
+            no = No(problema.estado_inicial)
+            no.prioridade = h(no.estado)
+            estatisticas.nos_gerados += 1
+            self._fronteira.inserir(no)
+            self._explorados[no.estado] = no
+            while not self._fronteira.vazia:
+                if self._fronteira.prioridade_minima == float("inf"):
+                    return None
+                no = self._fronteira.remover()
+                if problema.objectivo(no.estado):
+                    return Solucao(no)
+                inicio_fase = perf_counter()
+                sucessores = self.__gerar(problema, no, h)
+                fim_expandir = perf_counter()
+                self.__memorizar(no, sucessores)
+                estatisticas.tempo_expandir += fim_expandir - inicio_fase
+                estatisticas.tempo_memorizar += perf_counter() - fim_expandir
+                estatisticas.max_fronteira = max(estatisticas.max_fronteira, len(self._fronteira))
+                estatisticas.max_memoria = max(estatisticas.max_memoria, self._num_nos)
+        finally:
+            estatisticas.tempo_total += perf_counter() - inicio
+
+    def __gerar(self, problema, no, h):
+        """
+        Gera os sucessores de um nó que não estão em memória, calculando o seu valor f
+
+        Funcionamento:
+        - Na primeira expansão são gerados todos os sucessores; nas seguintes, apenas
+          os esquecidos, cujo f é o maior entre o memorizado e o calculado
+        - São descartados os sucessores cujo estado já se encontra no percurso do nó,
+          ou em memória com custo menor ou igual
+        """
+        esquecidos = self._esquecidos.pop(no, None)
+        sucessores = []
+        for no_sucessor in self._expandir(problema, no):
+            estado = no_sucessor.estado
+            if esquecidos is not None and estado not in esquecidos:
+                continue # sucessor em memória
+            melhor = self._explorados.get(estado)
+            if (melhor is not None and melhor.custo <= no_sucessor.custo) or \
+               self.__no_percurso(estado, no):
+                self._estatisticas.nos_repetidos += 1
+                continue
+            if no_sucessor.profundidade >= self._limite_nos - 1 and not problema.objectivo(estado):
+                f = float("inf") # o percurso não pode ser continuado dentro do limite de nós
+            else:
+                f = max(no.prioridade, no_sucessor.custo + h(estado))
+            if esquecidos is not None:
+                f = max(f, esquecidos[estado])
+            no_sucessor.prioridade = f
+            sucessores.append(no_sucessor)
+        return sucessores
+
+    def __memorizar(self, no, sucessores):
+        """
+        Insere os sucessores de um nó na memória e na fronteira, esquecendo as folhas
+        menos promissoras enquanto o limite de nós for excedido
+
+        Funcionamento:
+        - Um nó sem sucessores (beco sem saída) volta à fronteira com f infinito, para
+          ser o primeiro a ser esquecido
+        """
+        if not sucessores and no not in self._sucessores:
+            no.prioridade = float("inf")
+            self._fronteira.inserir(no)
+        if sucessores:
+            filhos = self._sucessores.setdefault(no, {})
+            for no_sucessor in sucessores:
+                filhos[no_sucessor.estado] = no_sucessor
+                self._explorados[no_sucessor.estado] = no_sucessor
+                self._fronteira.inserir(no_sucessor)
+            self._num_nos += len(sucessores)
+        while self._num_nos > self._limite_nos:
+            if not self.__esquecer():
+                break
+
+    def __esquecer(self):
+        """
+        Esquece a folha menos promissora da fronteira, guardando o seu f no antecessor
+
+        Retorno:
+        - bool: True se uma folha foi esquecida
+        """
+        folha = self._fronteira.remover_pior(
+            lambda no: no.antecessor is not None and no not in self._sucessores)
+        if folha is None:
+            return False
+        self._esquecidos.pop(folha, None)
+        if self._explorados.get(folha.estado) is folha:
+            del self._explorados[folha.estado]
+        antecessor = folha.antecessor
+        filhos = self._sucessores[antecessor]
+        del filhos[folha.estado]
+        esquecidos = self._esquecidos.setdefault(antecessor, {})
+        esquecidos[folha.estado] = min(esquecidos.get(folha.estado, float("inf")), folha.prioridade)
+        if not filhos:
+            del self._sucessores[antecessor]
+        # o antecessor volta à fronteira com o menor f dos sucessores esquecidos
+        f_esquecidos = min(esquecidos.values())
+        if not filhos:
+            antecessor.prioridade = max(antecessor.prioridade, f_esquecidos)
+            self._fronteira.inserir(antecessor)
+        else:
+            self.__inserir_interior(antecessor, f_esquecidos)
+        self._num_nos -= 1
+        return True
+
+    def __inserir_interior(self, no, f):
+        """
+        Insere na fronteira um nó com sucessores em memória e sucessores esquecidos,
+        com prioridade igual ao menor f dos esquecidos
+        """
+        prioridade = no.prioridade
+        no.prioridade = max(prioridade, f)
+        self._fronteira.inserir(no)
+        no.prioridade = prioridade
+
+    def __no_percurso(self, estado, no):
+        """
+        Verifica se um estado pertence ao percurso desde o nó raiz até um nó
+        """
+        while no is not None:
+            if no.estado == estado:
+                return True
+            no = no.antecessor
+        return False
\ No newline at end of file
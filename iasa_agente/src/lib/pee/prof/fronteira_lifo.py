@@ -19,7 +19,9 @@ class FronteiraLIFO(Fronteira): #Last In, First Out
         Método que insere um nó na fronteira, seguindo a lógica LIFO
 
         Funcionamento:
-        - O nó é inserido no início da lista de nós, garantindo que será processado antes dos restantes nós
+        - O nó é inserido no início da deque de nós, garantindo que será processado antes dos restantes nós
+        - A inserção no início da deque (appendleft) é feita em tempo constante, ao contrário da
+        inserção no início de uma lista, que obriga a deslocar todos os nós já presentes na fronteira
 
         Parâmetros:
         - no: O nó a ser inserido na fronteira
@@ -28,4 +30,4 @@ class FronteiraLIFO(Fronteira): #Last In, First Out
         - 10-pee-1.pdf, página 13: descreve-se que inserir nós no início da fronteira é essencial para implementar o comportamento esperado de exploração
         - P3-iasa-proj.pdf, páginas 7 e 8: o método inserir é apresentado como parte crítica da interface da classe de fronteira
         """
-        self._nos.insert(0, no)
\ No newline at end of file
+        self._nos.appendleft(no)
\ No newline at end of file
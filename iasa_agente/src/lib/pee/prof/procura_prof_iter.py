@@ -1,16 +1,26 @@
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
 from .procura_prof_lim import ProcuraProfLim
 
 class ProcuraProfIter(ProcuraProfLim):
     """
     Classe que implementa o mecanismo de procura em profundidade iterativa
 
+    Cada iteração volta a gerar todos os nós das profundidades anteriores; opcionalmente,
+    a procura pode ser incremental, mantendo os nós cortados no limite de profundidade
+    anterior e retomando a procura a partir deles, e pode usar uma tabela de transposição
+    para não voltar a expandir estados já alcançados com profundidade igual ou inferior
+
     Fundamentação teórica:
     - 11-pee-2.pdf, páginas 16 e 17: a procura em profundidade iterativa, faz procuras em profundidade sucessivas 
         com limites de profundidade incrementais
     - P3-iasa-proj.pdf, página 9: é descrito o diagrama de classes que inclui a implementação de tanto desta classe,
     como da classe ProcuraProfLim
+    - Korf (1985), "Depth-First Iterative-Deepening: An Optimal Admissible Tree Search": com fator de
+    ramificação b, a repetição das iterações multiplica o número de nós gerados por cerca de b/(b-1)
+    - Reinefeld e Marsland (1994), "Enhanced Iterative-Deepening Search": tabelas de transposição em
+    procuras por aprofundamento iterativo
     """
-    def __init__(self, prof_max_inicial = 10):
+    def __init__(self, prof_max_inicial = 10, incremental = False, tabela_transp = False):
         """
         Construtor da classe ProcuraProfIter
 
@@ -20,6 +30,12 @@ class ProcuraProfIter(ProcuraProfLim):
 
         Parâmetros:
         - prof_max_inicial: valor da profundidade máxima inicial, que, por defeito, é 10
+        - incremental: se True, cada iteração retoma a procura a partir dos nós cortados na iteração
+        anterior, em vez de recomeçar no estado inicial; os nós cortados são mantidos em memória, pelo
+        que a memória deixa de ser linear na profundidade e passa a ser da ordem da última camada
+        - tabela_transp: se True, é mantida uma tabela com a menor profundidade com que cada estado foi
+        alcançado, sendo descartados os sucessores que alcançam um estado da tabela com profundidade igual
+        ou superior
 
         Fundamentação teórica:
         - 11-pee-2.pdf, página 17: existe a possibilidade de limitar a procura a uma profundidade máxima
@@ -28,6 +44,12 @@ class ProcuraProfIter(ProcuraProfLim):
         máxima inicial
         """
         super().__init__(prof_max_inicial)
+        self._incremental = incremental
+        self._tabela_transp = tabela_transp
+        self._tabela = {}
+        self._cortados = []
+        self._num_cortados = 0
+        self._estatisticas_iteracoes = []
 
 
     def procurar(self, problema, inc_prof = 1, limite_prof = 100):
@@ -39,6 +61,13 @@ class ProcuraProfIter(ProcuraProfLim):
         o limite de profundidade até encontrar uma solução ou atingir o limite máximo especificado
         - Em cada iteração, executa uma procura em profundidade até a profundidade atual
         - Se encontrar uma solução válida dentro do limite, retorna-a imediatamente
+        - Se uma iteração não cortar nenhum nó, o espaço de estados foi esgotado e não existe solução
+        - Na procura incremental, cada iteração inicia-se nos nós cortados na iteração anterior, pois
+        os nós de profundidade inferior já foram testados e expandidos
+        - Sem procura incremental, a tabela de transposição é reiniciada em cada iteração; na procura
+        incremental é mantida, pois a exploração de um estado continua a partir dos seus nós cortados
+        - As estatísticas de cada iteração ficam disponíveis em estatisticas_iteracoes, e as
+        estatísticas da procura (ver EstatisticasProcura) acumulam as de todas as iterações
 
         Parâmetros:
         - problema: objeto que contém a definição do problema
@@ -49,8 +78,93 @@ class ProcuraProfIter(ProcuraProfLim):
         - 11-pee-2.pdf, página 17: esta função foi implementada segundo o pseudocódigo 'function procura_prof_iter'
         - P3-iasa-proj.pdf, página 9: este método está presente no diagrama de classes 'Procura em Profundidade"
         """
+        estatisticas = EstatisticasProcura() #as estatísticas acumulam os nós de todas as iterações
+        self._estatisticas_iteracoes = []
+        self._tabela = {}
+        self._cortados = []
         for profundidade in range(0, limite_prof + 1, inc_prof): #itera de 0 a limite_prof, de inc_prof em inc_prof (sendo limite_prof = limite_prof+1, pois é necessário adicionar 1)
             self._prof_max = profundidade #atualiza a profundiade máxima como profundidade, para se poder iterar por cada limite
-            solucao = super().procurar(problema) #realiza uma procura em profundidade com o limite de profundidade atual
-            if solucao: #se existir solução
-                return solucao #retorna a solução
\ No newline at end of file
+            self._estatisticas = EstatisticasProcura()
+            self._num_cortados = 0
+            if not self._incremental:
+                self._tabela = {}
+            solucao = self._procurar(problema) #realiza uma procura em profundidade com o limite de profundidade atual
+            self._estatisticas_iteracoes.append(self._estatisticas)
+            estatisticas.acumular(self._estatisticas)
+            if solucao or self._num_cortados == 0: #se existir solução, ou se não existirem mais nós a explorar
+                self._estatisticas = estatisticas
+                self._cortados = []
+                return solucao #retorna a solução
+        self._estatisticas = estatisticas
+        self._cortados = []
+
+    @property
+    def estatisticas_iteracoes(self):
+        """
+        Estatísticas de cada iteração (limite de profundidade) da última procura
+
+        Retorno:
+        - list: EstatisticasProcura de cada iteração, pela ordem dos limites de profundidade
+        """
+        return self._estatisticas_iteracoes
+
+    def _nos_iniciais(self, problema):
+        """
+        Nós a partir dos quais cada iteração é iniciada
+
+        Funcionamento:
+        - Na procura incremental, após a primeira iteração, são os nós cortados na iteração
+        anterior, inseridos por ordem inversa para que a fronteira LIFO os remova pela ordem
+        em que foram cortados
+        - Caso contrário, é o nó raiz, cujo estado é registado na tabela de transposição
+        """
+        if self._incremental and self._cortados:
+            nos, self._cortados = self._cortados, []
+            return reversed(nos)
+        nos = super()._nos_iniciais(problema)
+        if self._tabela_transp:
+            self._tabela[problema.estado_inicial] = 0
+        return nos
+
+    def _expandir(self, problema, no):
+        """
+        Expande um nó até à profundidade máxima da iteração atual
+
+        Funcionamento:
+        - Os nós na profundidade máxima não são expandidos e são contabilizados como cortados
+        (na procura incremental são guardados, para serem retomados na iteração seguinte)
+        - Com tabela de transposição, os sucessores cujo estado já foi alcançado com profundidade
+        igual ou inferior são descartados e contabilizados como repetidos, pois a sua subárvore,
+        dentro do limite de profundidade, está contida na do nó anterior
+
+        Parâmetros:
+        - problema: definição do problema a resolver
+        - no: nó atual a ser expandido
+
+        Retorno:
+        - Lista de nós sucessores ou lista vazia se atingir o limite
+        """
+        if no.profundidade >= self._prof_max:
+            self._num_cortados += 1
+            if self._incremental:
+                self._cortados.append(no)
+            return []
+        sucessores = super()._expandir(problema, no)
+        if not self._tabela_transp:
+            return sucessores
+        tabela = self._tabela
+        profundidade = no.profundidade + 1
+        novos = []
+        for no_sucessor in sucessores:
+            if tabela.get(no_sucessor.estado, profundidade + 1) <= profundidade:
+                self._estatisticas.nos_repetidos += 1
+            else:
+                tabela[no_sucessor.estado] = profundidade
+                novos.append(no_sucessor)
+        return novos
+
+    def _nos_em_memoria(self):
+        """
+        Número de nós em memória: fronteira, nós cortados guardados e estados da tabela de transposição
+        """
+        return super()._nos_em_memoria() + len(self._cortados) + len(self._tabela)
\ No newline at end of file
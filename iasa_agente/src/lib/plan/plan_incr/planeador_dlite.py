@@ -0,0 +1,271 @@
+import heapq
+from itertools import count
+
+from pee.mec_proc.passo_solucao import PassoSolucao
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.plano_pee import PlanoPEE
+from plan.planeador import Planeador
+
+class PlaneadorDLite(Planeador):
+    """
+    Planeador incremental baseado no algoritmo D* Lite, que reutiliza o trabalho de
+    planeamentos anteriores em vez de repetir a procura desde o início
+
+    A procura é realizada no sentido inverso, a partir dos estados objetivo (através dos
+    operadores inversos, ver OperadorReversivel) até ao estado do agente. Para cada estado
+    são mantidos dois valores:
+    - g: custo do percurso até ao objetivo mais próximo, calculado na última expansão do estado
+    - rhs: estimativa com um passo de antecipação, min(custo(s, s') + g(s')) sobre os sucessores
+    s' (0 para os estados objetivo)
+
+    Um estado é inconsistente quando g != rhs, e só os estados inconsistentes são colocados
+    na fila de prioridade. Entre planeamentos, as tabelas g e rhs e a fila são mantidas;
+    quando o modelo do mundo muda (estados que deixam de ser ou passam a ser válidos,
+    objetivos recolhidos ou acrescentados), só os estados afetados são atualizados, e a
+    procura seguinte apenas repara a região em que os custos mudaram. O movimento do agente
+    é tido em conta pelo termo km, que acumula a variação da heurística, sem reordenar a fila
+
+    Como a procura parte de todos os objetivos em simultâneo, o plano leva ao objetivo com
+    menor custo de percurso, e não ao primeiro objetivo da lista, como em PlaneadorPee
+
+    Fundamentação teórica:
+    - 14-plan-pee.pdf, página 5: planeamento com base em procura em espaço de estados, com
+    modelo do problema, heurística e mecanismo de procura
+    - 13-arq-delib.pdf, páginas 14 e 15: o replaneamento após a reconsideração tem custo
+    computacional, num ambiente que muda durante o raciocínio
+    - Koenig e Likhachev (2002), "D* Lite"; Koenig, Likhachev e Furcy (2004),
+    "Lifelong Planning A*"
+    """
+    def __init__(self):
+        """
+        Inicializa o planeador sem informação de planeamentos anteriores
+
+        Atributos:
+        - __modelo_plan: modelo do mundo do último planeamento
+        - __estados: estados válidos do modelo no último planeamento
+        - __objectivos: estados objetivo do último planeamento
+        - __estado: estado do agente no último planeamento (início da procura inversa)
+        - __g, __rhs: custos de cada estado até ao objetivo (ausente = infinito)
+        - __fila: fila de prioridade com entradas (chave, ordem, estado), sendo ignoradas
+        as entradas cuja chave já não corresponde a __chaves (remoção diferida)
+        - __chaves: chave atual de cada estado inconsistente na fila
+        - __km: variação acumulada da heurística devido ao movimento do agente
+        - __vizinhos: sucessores de cada estado, obtidos pelos operadores do modelo, guardados
+        enquanto os estados válidos do modelo não mudarem
+        """
+        self.__modelo_plan = None
+        self.__estados = frozenset()
+        self.__objectivos = frozenset()
+        self.__estado = None
+        self.__heuristica = None
+        self.__g = {}
+        self.__rhs = {}
+        self.__fila = []
+        self.__chaves = {}
+        self.__ordem = count()
+        self.__km = 0
+        self.__vizinhos = {}
+        self.__nos_expandidos = 0
+
+    @property
+    def nos_expandidos(self):
+        """
+        Número de estados expandidos no último planeamento
+        """
+        return self.__nos_expandidos
+
+    def planear(self, modelo_plan, objetivos):
+        """
+        Gera um plano para o objetivo com menor custo de percurso a partir do estado do agente
+
+        Parâmetros:
+        - modelo_plan: modelo do mundo, com operadores reversíveis
+        - objetivos: lista de estados objetivo
+
+        Retorno:
+        - PlanoPEE: plano do estado do agente até ao objetivo, ou None se nenhum
+        objetivo for alcançável
+
+        Funcionamento:
+        1. Se o modelo for diferente do anterior, reinicia as tabelas e a fila
+        2. Caso contrário, acumula em km a distância entre a posição anterior e a atual
+        do agente, e atualiza os estados afetados pelas alterações do modelo e dos objetivos;
+        as chaves destes estados já são calculadas com a heurística relativa à posição atual,
+        pois uma chave superior à correta poderia terminar a procura antes de o estado ser expandido
+        3. Processa os estados inconsistentes até o estado do agente ficar consistente
+        4. Extrai o plano seguindo, a partir do estado do agente, o sucessor que minimiza
+        custo(s, s') + g(s')
+        """
+        estado = modelo_plan.obter_estado()
+        objectivos = frozenset(objetivos)
+        estados = frozenset(modelo_plan.obter_estados())
+        if modelo_plan is not self.__modelo_plan:
+            self.__iniciar(modelo_plan, estado, estados, objectivos)
+        else:
+            self.__km += self.__heuristica.h(estado)
+            self.__estado = estado
+            self.__heuristica = HeurDist(estado)
+            self.__actualizar(estados, objectivos)
+        self.__calcular_percurso()
+        return self.__extrair_plano()
+
+    def __iniciar(self, modelo_plan, estado, estados, objectivos):
+        """
+        Reinicia o planeador para um novo modelo do mundo, colocando os objetivos na fila
+        """
+        self.__modelo_plan = modelo_plan
+        self.__estados = estados
+        self.__objectivos = objectivos
+        self.__g = {}
+        self.__rhs = {}
+        self.__fila = []
+        self.__chaves = {}
+        self.__km = 0
+        self.__vizinhos = {}
+        self.__estado = estado
+        self.__heuristica = HeurDist(estado)
+        for objectivo in objectivos:
+            self.__actualizar_estado(objectivo)
+
+    def __actualizar(self, estados, objectivos):
+        """
+        Atualiza os estados afetados pelas alterações do modelo do mundo
+
+        Funcionamento:
+        - Estados que deixaram de ser válidos: são esquecidos e os seus vizinhos atualizados
+        - Estados que passaram a ser válidos: são atualizados, tal como os seus vizinhos
+        - Objetivos removidos ou acrescentados: são atualizados (rhs deixa de ser ou passa a ser 0)
+        """
+        removidos = self.__estados - estados
+        acrescentados = estados - self.__estados
+        alterados = self.__objectivos ^ objectivos
+        self.__estados = estados
+        self.__objectivos = objectivos
+        if removidos or acrescentados:
+            self.__vizinhos = {}
+        for estado in removidos:
+            self.__g.pop(estado, None)
+            self.__rhs.pop(estado, None)
+            self.__chaves.pop(estado, None)
+            for antecessor in self.__antecessores(estado):
+                self.__actualizar_estado(antecessor)
+        for estado in acrescentados:
+            self.__actualizar_estado(estado)
+            for antecessor in self.__antecessores(estado):
+                self.__actualizar_estado(antecessor)
+        for estado in alterados:
+            if estado in estados:
+                self.__actualizar_estado(estado)
+
+    def __chave(self, estado):
+        """
+        Chave de prioridade de um estado: (min(g, rhs) + h + km, min(g, rhs))
+        """
+        custo = min(self.__g.get(estado, float("inf")), self.__rhs.get(estado, float("inf")))
+        return (custo + self.__heuristica.h(estado) + self.__km, custo)
+
+    def __actualizar_estado(self, estado):
+        """
+        Recalcula rhs de um estado e coloca-o na fila se estiver inconsistente
+        """
+        if estado in self.__objectivos:
+            rhs = 0
+        else:
+            rhs = min((operador.custo(estado, estado_suc) + self.__g.get(estado_suc, float("inf"))
+                       for estado_suc, operador in self.__sucessores(estado)), default=float("inf"))
+        self.__rhs[estado] = rhs
+        self.__chaves.pop(estado, None)
+        if self.__g.get(estado, float("inf")) != rhs:
+            self.__inserir(estado, self.__chave(estado))
+
+    def __inserir(self, estado, chave):
+        self.__chaves[estado] = chave
+        heapq.heappush(self.__fila, (chave, next(self.__ordem), estado))
+
+    def __calcular_percurso(self):
+        """
+        Expande os estados inconsistentes por ordem de chave até o estado do agente
+        ficar consistente e nenhuma chave na fila ser inferior à sua
+
+        Funcionamento:
+        - Entradas com chave desatualizada são descartadas
+        - Se a chave aumentou (devido a km), o estado é reinserido com a nova chave
+        - Estado com g > rhs (custo diminuiu): g = rhs e os antecessores são atualizados
+        - Estado com g < rhs (custo aumentou): g = infinito e o estado e os antecessores
+        são atualizados
+        """
+        fila = self.__fila
+        chaves = self.__chaves
+        g = self.__g
+        rhs = self.__rhs
+        estado_agente = self.__estado
+        self.__nos_expandidos = 0
+        while fila:
+            chave, _, estado = fila[0]
+            if chaves.get(estado) != chave:
+                heapq.heappop(fila)
+                continue
+            g_agente = g.get(estado_agente, float("inf"))
+            if chave >= self.__chave(estado_agente) and rhs.get(estado_agente, float("inf")) == g_agente:
+                break
+            heapq.heappop(fila)
+            del chaves[estado]
+            chave_nova = self.__chave(estado)
+            if chave < chave_nova:
+                self.__inserir(estado, chave_nova)
+                continue
+            self.__nos_expandidos += 1
+            if g.get(estado, float("inf")) > rhs[estado]:
+                g[estado] = rhs[estado]
+            else:
+                g.pop(estado, None)
+                self.__actualizar_estado(estado)
+            for antecessor in self.__antecessores(estado):
+                self.__actualizar_estado(antecessor)
+
+    def __extrair_plano(self):
+        """
+        Constrói o plano a partir do estado do agente, escolhendo em cada estado o
+        operador que minimiza custo(s, s') + g(s')
+        """
+        estado = self.__estado
+        if self.__g.get(estado, float("inf")) == float("inf"):
+            return None
+        passos = []
+        while estado not in self.__objectivos:
+            custo, estado_suc, operador = min(
+                ((operador.custo(estado, estado_suc) + self.__g.get(estado_suc, float("inf")), estado_suc, operador)
+                 for estado_suc, operador in self.__sucessores(estado)), key=lambda opcao: opcao[0])
+            if custo == float("inf") or len(passos) > len(self.__g):
+                return None
+            passos.append(PassoSolucao(estado, operador))
+            estado = estado_suc
+        return PlanoPEE(passos)
+
+    def __sucessores(self, estado):
+        """
+        Pares (estado sucessor, operador) obtidos pelos operadores do modelo
+
+        Os sucessores de cada estado são guardados, pois cada atualização de rhs volta a
+        consultá-los; a tabela é reiniciada quando os estados válidos do modelo mudam
+        """
+        sucessores = self.__vizinhos.get(estado)
+        if sucessores is None:
+            sucessores = []
+            for operador in self.__modelo_plan.obter_operadores():
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is not None:
+                    sucessores.append((estado_suc, operador))
+            self.__vizinhos[estado] = sucessores
+        return sucessores
+
+    def __antecessores(self, estado):
+        """
+        Estados antecessores de um estado, isto é, estados a partir dos quais algum
+        operador gera o estado
+
+        Como os operadores são reversíveis (OperadorReversivel), se o operador o gera s'
+        a partir de s, o inverso de o gera s a partir de s', pelo que os antecessores são
+        os próprios sucessores, não sendo necessário aplicar os operadores inversos
+        """
+        return [estado_suc for estado_suc, _ in self.__sucessores(estado)]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pdm.modelo.modelo_pdm import ModeloPDM
 from plan.modelo.modelo_plan import ModeloPlan
+from plan.plan_pdm.modelo.transicoes_plan import TransicoesPlan
 
 class ModeloPDMPlan(ModeloPlan, ModeloPDM):
     """
@@ -23,7 +24,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
     - 16-plan-pdm.pdf, página 3: O planeamento automático com PDM requer um modelo interno que
     especifique estados, operadores, transições e recompensas, que esta classe implementa
     """
-    def __init__(self, modelo_plan, objectivos, rmax = 1000.0):
+    def __init__(self, modelo_plan, objectivos, rmax = 1000.0, transicoes = None):
         """
         Inicializa o modelo de PDM com base no modelo de planeamento e objetivos fornecidos
 
@@ -32,11 +33,15 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         operadores e estado inicial do ambiente
         - objectivos: lista de estados objetivo que o agente deve alcançar
         - rmax: float, recompensa máxima para estados objetivo. Valor padrão: 1000.0
+        - transicoes: TransicoesPlan, tabela de transições do modelo de planeamento; se não for
+        indicada, é construída (a tabela não depende dos objetivos, podendo ser reutilizada
+        enquanto os estados válidos não mudarem)
 
         Funcionamento:
-        1. Armazena os parâmetros `rmax`, `objectivos` e `modelo_plan` como atributos privados
-        2. Cria um dicionário de transições (`__transicoes`) que mapeia pares (estado, ação)
-        para o estado seguinte (s'), calculado aplicando cada operador a cada estado
+        1. Armazena os parâmetros `rmax`, `objectivos` e `modelo_plan` como atributos privados;
+        os objetivos são guardados num conjunto, pois são consultados em cada chamada de A e R
+        2. Usa a tabela de transições (`__transicoes`), que mapeia pares (estado, ação) para o
+        estado seguinte (s'), ou constrói-a a partir dos estados e operadores do modelo
         3. Garante que as transições sejam deterministas, com T(s, a, s') = 1 se a transição
         for válida, e T(s, a, s') = 0 caso contrário
 
@@ -47,14 +52,9 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         o formato de PDM, fornecendo as funções necessárias para o planeador
         """
         self.__rmax = rmax
-        self.__objectivos = objectivos
+        self.__objectivos = set(objectivos)
         self.__modelo_plan = modelo_plan
-        self.__transicoes = {}
-        for s in self.obter_estados():
-            for a in self.obter_operadores():
-                sn = a.aplicar(s)
-                if sn:
-                    self.__transicoes[(s, a)] = sn
+        self.__transicoes = transicoes if transicoes is not None else TransicoesPlan(modelo_plan)
 
     def obter_estado(self):
         """
@@ -142,7 +142,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         Retorna uma lista vazia se o estado for um objetivo
 
         Funcionamento:
-        1. Verifica se o estado `s` está na lista de objetivos (`__objectivos`)
+        1. Verifica se o estado `s` está no conjunto de objetivos (`__objectivos`)
         2. Se for um estado objetivo, retorna uma lista vazia, indicando que não há
         ações a realizar
         3. Caso contrário, retorna o conjunto de operadores disponíveis através do
@@ -172,7 +172,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         válida (s, a → s'), ou 0 caso contrário
 
         Funcionamento:
-        1. Consulta o dicionário de transições (`__transicoes`) para verificar se o
+        1. Consulta a tabela de transições (`__transicoes`) para verificar se o
         par (s, a) leva ao estado `sn`
         2. Retorna 1 se a transição for válida, ou 0 se não for
 
@@ -183,7 +183,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         - 16-plan-pdm.pdf, página 3: A função de transição é essencial para o modelo
         de PDM usado no planeamento automático
         """
-        sn = self.__transicoes.get((s, a))
+        sn = self.__transicoes.sucessor(s, a)
         return 1 if sn is not None else 0
 
     def R(self, s, a, sn):
@@ -200,7 +200,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         objetivo, ou o negativo do custo da ação caso contrário
 
         Funcionamento:
-        1. Verifica se o estado seguinte (`sn`) está na lista de objetivos
+        1. Verifica se o estado seguinte (`sn`) está no conjunto de objetivos
         2. Se for um objetivo, retorna a recompensa máxima (`__rmax`)
         3. Caso contrário, retorna o custo da ação (`a.custo(s, sn)`) com sinal
         negativo, representando uma penalidade
@@ -230,7 +230,7 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         uma lista vazia caso contrário
 
         Funcionamento:
-        1. Consulta o dicionário de transições (`__transicoes`) para obter o estado
+        1. Consulta a tabela de transições (`__transicoes`) para obter o estado
         seguinte associado ao par (s, a)
         2. Retorna uma lista contendo o estado seguinte, se existir, ou uma lista
         vazia, se a transição não for válida
@@ -240,10 +240,23 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
         estados alcançáveis a partir de um estado e uma ação, suportando o cálculo
         das transições no modelo de PDM
         """
-        sn = self.__transicoes.get((s, a)) #tem que ser com get, se não dá uma exceção
+        sn = self.__transicoes.sucessor(s, a) #None se o operador não for aplicável
         return [sn] if sn else [] #retorna uma lista com o estado sucessor se existir, ou uma lista vazia se não existir
         #retorna-se uma lista e não um único estado, porque o ambiente pode ser não determinista
         #caso geral, return [sn] if sn is not None else []
+
+    def transicoes(self, s, a):
+        """
+        Obtém as transições do par (s, a), com os mesmos valores de T e R
+
+        Retorno:
+        - Lista: [(s', 1, R(s, a, s'))] se a transição for válida, ou uma lista vazia caso
+        contrário (ver ModeloPDM.transicoes)
+        """
+        sn = self.__transicoes.sucessor(s, a)
+        if not sn:
+            return []
+        return [(sn, 1, self.R(s, a, sn))]
     
     @property
     def rmax (self):
@@ -251,4 +264,11 @@ class ModeloPDMPlan(ModeloPlan, ModeloPDM):
     
     @property
     def objetivos (self):
-        return self.__objectivos
\ No newline at end of file
+        return self.__objectivos
+
+    @property
+    def tabela_transicoes(self):
+        """
+        Tabela de transições do modelo de planeamento (TransicoesPlan)
+        """
+        return self.__transicoes
\ No newline at end of file
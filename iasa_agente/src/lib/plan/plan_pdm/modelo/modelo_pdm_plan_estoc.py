@@ -0,0 +1,132 @@
+import math
+
+from plan.plan_pdm.modelo.modelo_pdm_plan import ModeloPDMPlan
+
+class ModeloPDMPlanEstoc(ModeloPDMPlan):
+    """
+    Modelo de PDM de planeamento com transições estocásticas (deslize), para agentes cujos
+    atuadores nem sempre executam o movimento pretendido
+
+    Descrição:
+    Em ModeloPDMPlan, cada operador leva sempre ao mesmo estado sucessor (T = 1 ou T = 0), pelo
+    que o PDM se reduz a um problema de caminho mais curto. Neste modelo, ao executar um operador:
+    - com probabilidade p, o agente move-se na direção pretendida
+    - com probabilidade q, move-se em cada uma das direções laterais (operadores com ângulo
+      perpendicular ao do operador executado)
+    - com probabilidade r, permanece no mesmo estado
+    Se um movimento levar a um estado inválido (ex: obstáculo), o agente permanece no mesmo
+    estado. Cada transição para um estado que não é objetivo tem um custo (custo_passo), e o
+    alcance de um objetivo tem a recompensa rmax
+
+    As transições de cada par (s, a) são calculadas uma única vez, na construção do modelo,
+    a partir da tabela de transições determinista (TransicoesPlan), e guardadas numa lista
+    esparsa de tuplos (s', T(s, a, s'), R(s, a, s')), com os sucessores repetidos agregados;
+    T, R, suc e transicoes consultam essa lista, sem recalcular os movimentos
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 8: um PDM é definido por S, A(s), T(s, a, s') e R(s, a, s'), sendo
+    T uma distribuição de probabilidade sobre os estados sucessores
+    - 15-pds.pdf, página 20: no ambiente 4x3, a ação pretendida é executada com probabilidade
+    0.8 e o agente desvia-se para cada uma das direções perpendiculares com probabilidade 0.1,
+    permanecendo no mesmo estado se colidir com um obstáculo; os estados não terminais têm
+    recompensa negativa (custo por passo)
+    - 16-plan-pdm.pdf, página 3: o modelo de PDM do planeador é obtido a partir dos estados e
+    operadores do modelo de planeamento
+    """
+    def __init__(self, modelo_plan, objectivos, p = 0.8, q = 0.1, r = 0.0, rmax = 1000.0,
+                 custo_passo = 0.0, transicoes = None):
+        """
+        Inicializa o modelo e calcula as transições de todos os pares (s, a)
+
+        Parâmetros:
+        - modelo_plan: modelo de planeamento (ModeloPlan); os operadores laterais são obtidos
+        pelo atributo `ang` dos operadores (ex: OperadorMover), não tendo laterais os operadores
+        sem esse atributo
+        - objectivos: lista de estados objetivo
+        - p: probabilidade de executar o movimento pretendido. Valor padrão: 0.8
+        - q: probabilidade de cada movimento lateral. Valor padrão: 0.1
+        - r: probabilidade de permanecer no mesmo estado. Valor padrão: 0.0
+        - rmax: recompensa ao alcançar um objetivo. Valor padrão: 1000.0
+        - custo_passo: custo de cada transição para um estado que não é objetivo (recompensa
+        -custo_passo). Valor padrão: 0.0
+        - transicoes: TransicoesPlan do modelo de planeamento (ver ModeloPDMPlan)
+
+        Exceções:
+        - ValueError: se, para algum operador, p + q·(número de laterais) + r não for 1
+        """
+        super().__init__(modelo_plan, objectivos, rmax, transicoes)
+        self.__p, self.__q, self.__r = p, q, r
+        self.__custo_passo = custo_passo
+        operadores = self.obter_operadores()
+        movimentos = {}
+        for a in operadores:
+            laterais = self.__laterais(a, operadores)
+            if not math.isclose(p + q * len(laterais) + r, 1.0):
+                raise ValueError(f"Probabilidades de deslize inválidas: p + {len(laterais)}·q + r = "
+                                 f"{p + q * len(laterais) + r} (deve ser 1)")
+            movimentos[a] = [(a, p)] + [(b, q) for b in laterais]
+        tabela = self.tabela_transicoes
+        objetivos = self.objetivos
+        self.__transicoes = {}
+        for s in self.S():
+            if s in objetivos:
+                continue
+            for a in operadores:
+                distribuicao = {s: r} if r > 0 else {} #dicionário ordenado: sucessor -> probabilidade
+                for b, prob in movimentos[a]:
+                    if prob > 0:
+                        sn = tabela.sucessor(s, b) or s #movimento inválido: permanece no mesmo estado
+                        distribuicao[sn] = distribuicao.get(sn, 0) + prob
+                self.__transicoes[(s, a)] = [(sn, prob, self.R(s, a, sn))
+                                             for sn, prob in distribuicao.items()]
+
+    @staticmethod
+    def __laterais(a, operadores):
+        """
+        Operadores com ângulo perpendicular ao do operador a
+        """
+        ang = getattr(a, "ang", None)
+        if ang is None:
+            return []
+        return [b for b in operadores
+                if getattr(b, "ang", None) is not None and abs(math.cos(b.ang - ang)) < 1e-9]
+
+    def T(self, s, a, sn):
+        """
+        Probabilidade de transição T(s, a, s'), 0 se s' não for sucessor de (s, a)
+        """
+        return next((prob for suc, prob, _ in self.transicoes(s, a) if suc == sn), 0)
+
+    def R(self, s, a, sn):
+        """
+        Recompensa R(s, a, s'): rmax se s' for objetivo, -custo_passo caso contrário
+        """
+        return self.rmax if sn in self.objetivos else -self.__custo_passo
+
+    def suc(self, s, a):
+        """
+        Estados sucessores do par (s, a), com probabilidade não nula
+        """
+        return [sn for sn, _, _ in self.transicoes(s, a)]
+
+    def transicoes(self, s, a):
+        """
+        Transições do par (s, a), calculadas na construção do modelo (ver ModeloPDM.transicoes)
+        """
+        return self.__transicoes.get((s, a), [])
+
+    @property
+    def p(self):
+        return self.__p
+
+    @property
+    def q(self):
+        return self.__q
+
+    @property
+    def r(self):
+        return self.__r
+
+    @property
+    def custo_passo(self):
+        return self.__custo_passo
\ No newline at end of file
@@ -0,0 +1,59 @@
+class TransicoesPlan:
+    """
+    Tabela de transições de um modelo de planeamento: estado sucessor de cada par (estado,
+    operador) válido
+
+    A tabela depende apenas dos estados válidos e dos operadores do modelo (no modelo do
+    mundo, das posições livres), e não dos objetivos, pelo que pode ser construída uma vez
+    e reutilizada por vários ModeloPDMPlan, enquanto os estados válidos não mudarem (ver
+    PlaneadorPDM); a recolha de um alvo altera os objetivos, mas não os estados válidos
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 8: T(s, a, s') depende apenas do estado, da ação e do estado seguinte
+    - 16-plan-pdm.pdf, página 3: o modelo de PDM do planeador é obtido a partir dos estados
+    e operadores do modelo de planeamento
+    """
+    def __init__(self, modelo_plan):
+        """
+        Constrói a tabela de transições
+
+        Parâmetros:
+        - modelo_plan: modelo de planeamento (ModeloPlan)
+
+        Funcionamento:
+        - Os estados válidos são guardados num dicionário (estado -> estado), sendo o sucessor
+        de cada par o estado válido igual a operador.destino(estado), caso exista
+        - Cada par (s, a) é assim avaliado em tempo constante, em vez de aplicar o operador, que
+        no modelo do mundo verifica se o estado resultante pertence à lista de estados válidos
+        (percorrendo-a); a construção é O(|S|·|A|) em vez de O(|S|²·|A|)
+        """
+        estados = modelo_plan.obter_estados()
+        validos = {s: s for s in estados}
+        self.__modelo_plan = modelo_plan
+        self.__estados = frozenset(validos)
+        self.__transicoes = {}
+        for a in modelo_plan.obter_operadores():
+            for s in estados:
+                sn = validos.get(a.destino(s))
+                if sn is not None:
+                    self.__transicoes[(s, a)] = sn
+
+    def sucessor(self, s, a):
+        """
+        Estado sucessor do par (s, a), ou None se o operador não for aplicável
+        """
+        return self.__transicoes.get((s, a))
+
+    def valida(self, modelo_plan):
+        """
+        Verifica se a tabela foi construída para o modelo de planeamento e corresponde aos seus
+        estados válidos atuais (as chaves da tabela incluem os operadores do modelo)
+        """
+        return modelo_plan is self.__modelo_plan and self.__estados == frozenset(modelo_plan.obter_estados())
+
+    @property
+    def estados(self):
+        """
+        Estados válidos a que se refere a tabela
+        """
+        return self.__estados
\ No newline at end of file
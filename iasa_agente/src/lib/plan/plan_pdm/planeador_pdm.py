@@ -1,8 +1,17 @@
+import logging
+
+from pdm.actualizacao import Actualizacao
+from pdm.metodo_pdm import MetodoPDM
 from pdm.pdm import PDM
+from pdm.poda import Poda
 from plan.plan_pdm.modelo.modelo_pdm_plan import ModeloPDMPlan
+from plan.plan_pdm.modelo.modelo_pdm_plan_estoc import ModeloPDMPlanEstoc
+from plan.plan_pdm.modelo.transicoes_plan import TransicoesPlan
 from plan.plan_pdm.plano_pdm import PlanoPDM
 from plan.planeador import Planeador
 
+registo = logging.getLogger(__name__)
+
 class PlaneadorPDM(Planeador):
     """
     Classe que implementa um planeador baseado em Processos de Decisão de Markov (PDM) para sistemas autónomos
@@ -22,7 +31,9 @@ class PlaneadorPDM(Planeador):
     - 16-plan-pdm.pdf, página 3: O planeador utiliza um modelo interno de PDM com estados, operadores, transições
       (T(s, a, s')) e recompensas (R(s, a, s')) para gerar a política de ação
     """
-    def __init__(self, gama = 0.85, delta_max = 1.0):
+    def __init__(self, gama = 0.85, delta_max = 1.0, vectorizado = None, actualizacao = Actualizacao.JACOBI,
+                 metodo = MetodoPDM.ITERACAO_VALOR, avaliacoes = 5, reutilizar = True, deslize = None,
+                 poda = Poda.NENHUMA, tempo_max = None):
         """
         Inicializa o planeador PDM com os parâmetros de desconto e convergência.
 
@@ -30,6 +41,30 @@ class PlaneadorPDM(Planeador):
         - gama: float, fator de desconto para recompensas futuras (γ ∈ [0,1]). Valor padrão: 0.85
         - delta_max: float, limiar máximo para a diferença de utilidade entre iterações, 
         determinando a convergência do cálculo. Valor padrão: 1.0
+        - vectorizado: bool, se True o PDM é resolvido sobre o modelo compilado (ver PDM), com o
+        mesmo resultado e menor tempo de cálculo; se None, o modelo compilado é usado apenas com a
+        atualização JACOBI, a única que suporta. Valor padrão: None
+        - actualizacao: Actualizacao, esquema de atualização das utilidades; os esquemas diferentes
+        de JACOBI requerem o modelo não compilado (vectorizado = False e Iteração de Valor).
+        Valor padrão: Actualizacao.JACOBI
+        - metodo: MetodoPDM, método de resolução do PDM. Valor padrão: MetodoPDM.ITERACAO_VALOR
+        - avaliacoes: int, iterações de avaliação da política na Iteração de Política Modificada.
+        Valor padrão: 5
+        - reutilizar: bool, se True o cálculo da utilidade parte das utilidades do planeamento
+        anterior (ver planear). Valor padrão: True
+        - deslize: tuplo (p, q, r) com as probabilidades do movimento pretendido, de cada movimento
+        lateral e de permanecer no mesmo estado, para planear com transições estocásticas
+        (ModeloPDMPlanEstoc); se None, as transições são deterministas (ModeloPDMPlan).
+        Valor padrão: None
+        - poda: Poda, estados excluídos do cálculo da utilidade, a partir do estado do agente
+        e dos objetivos (ver Poda). Valor padrão: Poda.NENHUMA
+        - tempo_max: float, tempo máximo (segundos) da resolução do PDM (utilidade e política) em
+        cada planeamento, ou None (sem limite); esgotado o tempo, o plano usa a melhor política até ao momento (ver
+        PDM.resolver), e o planeamento seguinte parte dessas utilidades. Valor padrão: None
+
+        Exceções:
+        - ValueError: se o esquema de atualização não for suportado pelo modelo compilado, usado
+        com vectorizado = True ou com a Iteração de Política
 
         Fundamentação teórica:
         - 15-pds.pdf, página 16: O fator de desconto (γ) é introduzido para refletir o efeito da passagem do tempo
@@ -39,6 +74,22 @@ class PlaneadorPDM(Planeador):
         """
         self.__gama = gama
         self.__delta_max = delta_max
+        if vectorizado is None:
+            vectorizado = actualizacao is Actualizacao.JACOBI
+        compilado = vectorizado or metodo is not MetodoPDM.ITERACAO_VALOR
+        if compilado and actualizacao is not Actualizacao.JACOBI:
+            raise ValueError(f"Atualização {actualizacao.name} não suportada com o modelo compilado")
+        self.__vectorizado = vectorizado
+        self.__actualizacao = actualizacao
+        self.__metodo = metodo
+        self.__avaliacoes = avaliacoes
+        self.__reutilizar = reutilizar
+        self.__deslize = deslize
+        self.__poda = poda
+        self.__tempo_max = tempo_max
+        self.__transicoes = None #tabela de transições do último modelo de planeamento (TransicoesPlan)
+        self.__anterior = None #último planeamento: (ModeloPDMPlan, utilidade, política)
+        self.__estatisticas = None
 
     def planear(self, modelo_plan, objectivos):
         """
@@ -53,12 +104,18 @@ class PlaneadorPDM(Planeador):
         - PlanoPDM: objeto contendo a utilidade calculada e a política ótima gerada pelo processo de PDM.
 
         Funcionamento:
-        1. Cria um objeto `ModeloPDMPlan` com base no `modelo_plan` e `objectivos`, adaptando o modelo
-        para o formato de PDM
+        1. Cria um objeto `ModeloPDMPlan` (ou `ModeloPDMPlanEstoc`, com deslize) com base no `modelo_plan`
+        e `objectivos`, adaptando o modelo para o formato de PDM; a tabela de transições (TransicoesPlan) só é reconstruída se os estados
+        válidos do modelo de planeamento mudaram (por exemplo, com a deteção de novos obstáculos), sendo
+        reutilizada quando mudam apenas os objetivos (por exemplo, após a recolha de um alvo)
         2. Instancia um objeto `PDM` com o modelo adaptado, o fator de desconto (`gama`) e o limiar de
         convergência (`delta_max`)
-        3. Executa o método `resolver` do objeto `PDM` para calcular a utilidade e a política ótima
-        4. Retorna um objeto `PlanoPDM` com a utilidade e a política resultantes
+        3. Executa o método `resolver` do objeto `PDM` para calcular a utilidade e a política ótima; se a
+        tabela de transições foi reutilizada, o cálculo parte das utilidades do planeamento anterior
+        (ver __utilidade_inicial), em vez de 0, e o número de iterações e de atualizações é registado
+        (logging, nível DEBUG) e fica disponível em `estatisticas`
+        4. Retorna um objeto `PlanoPDM` com a utilidade, a política resultantes e os valores Q(s, a)
+        da última iteração do cálculo da utilidade (`PDM.tabela_q`), dos quais a política foi obtida
 
         Fundamentação teórica:
         - P4-iasa-proj.pdf, página 12: O método `planear` é a realização do contrato da interface `Planeador`,
@@ -68,10 +125,79 @@ class PlaneadorPDM(Planeador):
         transições e recompensas para suportar o cálculo da política ótima
         - Implementação baseada no main do teste_pdm.py, que demonstra o uso do PDM para resolver um problema de planeamento
         """
-        modelo_pdm_plan = ModeloPDMPlan(modelo_plan, objectivos)
-        pdm = PDM(modelo_pdm_plan, self.__gama, self.__delta_max)
-        utilidade, politica = pdm.resolver()
-        return PlanoPDM(utilidade, politica)
+        U_inicial, reiniciados = None, 0
+        if self.__transicoes is None or not self.__transicoes.valida(modelo_plan):
+            self.__transicoes = TransicoesPlan(modelo_plan)
+        elif self.__reutilizar and self.__anterior is not None:
+            U_inicial, reiniciados = self.__utilidade_inicial(objectivos)
+        if self.__deslize is not None:
+            modelo_pdm_plan = ModeloPDMPlanEstoc(modelo_plan, objectivos, *self.__deslize, transicoes=self.__transicoes)
+        else:
+            modelo_pdm_plan = ModeloPDMPlan(modelo_plan, objectivos, transicoes=self.__transicoes)
+        pdm = PDM(modelo_pdm_plan, self.__gama, self.__delta_max, self.__vectorizado, self.__actualizacao,
+                  self.__metodo, self.__avaliacoes, self.__poda)
+        utilidade, politica = pdm.resolver(U_inicial, modelo_plan.obter_estado(), self.__tempo_max)
+        self.__anterior = (modelo_pdm_plan, utilidade, politica)
+        self.__estatisticas = pdm.estatisticas
+        registo.debug("PlaneadorPDM: %s, %d estados reiniciados, %d estados podados, %d iterações, "
+                      "%d atualizações, %.1f ms, %s, política em %.1f ms",
+                      "utilidades anteriores" if U_inicial is not None else "utilidades nulas", reiniciados,
+                      self.__estatisticas.estados_podados, self.__estatisticas.iteracoes,
+                      self.__estatisticas.actualizacoes, self.__estatisticas.tempo_total * 1000,
+                      "convergiu" if self.__estatisticas.convergiu else "interrompido",
+                      self.__estatisticas.tempo_politica * 1000)
+        return PlanoPDM(utilidade, politica, pdm.tabela_q)
+
+    def __utilidade_inicial(self, objectivos):
+        """
+        Utilidades iniciais para o planeamento, obtidas a partir do planeamento anterior
+
+        Parâmetros:
+        - objectivos: objetivos do novo planeamento
+
+        Retorno:
+        - tuplo: (utilidades iniciais, número de estados cuja utilidade foi reposta a 0)
+
+        Funcionamento:
+        - As recompensas não são negativas, pelo que as utilidades do planeamento anterior só
+        sobrestimam as novas utilidades ótimas nos estados cuja utilidade dependia de objetivos
+        removidos (ex: alvo recolhido): os estados a partir dos quais a política anterior pode
+        levar a um objetivo removido; estes estados são obtidos por procura em largura a partir
+        dos objetivos removidos, seguindo as transições da política anterior no sentido inverso,
+        e a sua utilidade é reposta a 0
+        - Nos restantes estados, a política anterior continua a levar aos mesmos objetivos, com as
+        mesmas recompensas, pelo que as utilidades anteriores (que não excedem as da política
+        anterior) não excedem as novas utilidades ótimas; os objetivos acrescentados só aumentam
+        as utilidades ótimas
+        - Partindo de utilidades que não excedem as ótimas, a utilidade converge por valores
+        inferiores, como partindo de 0, mas sem recalcular a utilidade dos estados que não
+        dependiam dos objetivos removidos; o critério de paragem (delta_max) e o erro máximo
+        são os mesmos (ver MecUtil.utilidade)
+        """
+        modelo_pdm, utilidade, politica = self.__anterior
+        removidos = set(modelo_pdm.objetivos) - set(objectivos)
+        antecessores = {}
+        for s, a in politica.items():
+            for sn in modelo_pdm.suc(s, a):
+                antecessores.setdefault(sn, []).append(s)
+        reiniciar = set(removidos)
+        fila = list(removidos)
+        for sn in fila: #a lista cresce durante o ciclo (fila da procura em largura)
+            for s in antecessores.get(sn, []):
+                if s not in reiniciar:
+                    reiniciar.add(s)
+                    fila.append(s)
+        U_inicial = dict(utilidade)
+        for s in reiniciar:
+            U_inicial[s] = 0
+        return U_inicial, len(reiniciar)
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do cálculo da utilidade do último planeamento (EstatisticasUtil)
+        """
+        return self.__estatisticas
 
     #propriedades getter para os fator de desconto e limiar de convergência
     @property
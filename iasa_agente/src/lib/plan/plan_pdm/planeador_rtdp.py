@@ -0,0 +1,139 @@
+import math
+
+from pdm.mec_rtdp import MecRTDP
+from plan.plan_pdm.modelo.modelo_pdm_plan import ModeloPDMPlan
+from plan.plan_pdm.modelo.modelo_pdm_plan_estoc import ModeloPDMPlanEstoc
+from plan.plan_pdm.modelo.transicoes_plan import TransicoesPlan
+from plan.plan_pdm.plano_rtdp import PlanoRTDP
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.planeador import Planeador
+
+class PlaneadorRTDP(Planeador):
+    """
+    Planeador baseado em Processos de Decisão de Markov (PDM) que calcula a utilidade e a
+    política apenas nos estados alcançáveis a partir do estado do agente, por Programação
+    Dinâmica em Tempo Real com etiquetagem (LRTDP, ver MecRTDP)
+
+    Descrição:
+    - Ao contrário de PlaneadorPDM, que calcula a utilidade de todos os estados do modelo antes
+    de o agente se deslocar, este planeador realiza simulações a partir do estado do agente,
+    com as utilidades dos estados não visitados estimadas a partir da distância aos objetivos
+    (heurística admissível, ver __heuristica), e devolve um plano parcial (PlanoRTDP) que é
+    refinado a partir do estado atual em cada obtenção de uma ação, com um orçamento limitado
+    de tempo ou de atualizações
+    - O modelo do PDM é o de PlaneadorPDM (ModeloPDMPlan ou, com deslize, ModeloPDMPlanEstoc),
+    sendo a tabela de transições reutilizada enquanto os estados válidos não mudarem
+
+    Fundamentação teórica:
+    - 15-pds.pdf, página 35: atualização de Bellman da utilidade
+    - 16-plan-pdm.pdf, página 3: o planeador utiliza um modelo interno de PDM com estados,
+    operadores, transições e recompensas
+    - 14-plan-pee.pdf, página 5: utilização de uma heurística para orientar o planeamento
+    - Bonet e Geffner (2003), "Labeled RTDP: Improving the Convergence of Real-Time Dynamic
+    Programming"
+    """
+    def __init__(self, gama = 0.95, epsilon = 1e-3, tempo_max = 0.05, actualizacoes_max = None,
+                 rmax = 1000.0, passo = 1, deslize = None, semente = None):
+        """
+        Inicializa o planeador
+
+        Parâmetros:
+        - gama: float, fator de desconto para recompensas futuras (γ ∈ [0,1[). Valor padrão: 0.95
+        - epsilon: float, resíduo de Bellman máximo dos estados resolvidos. Valor padrão: 1e-3
+        - tempo_max: float, tempo máximo (segundos) de cálculo em cada obtenção de uma ação,
+        ou None (sem limite). Valor padrão: 0.05
+        - actualizacoes_max: int, número máximo de atualizações de Bellman em cada obtenção de
+        uma ação, ou None (sem limite). Valor padrão: None
+        - rmax: float, recompensa ao alcançar um objetivo. Valor padrão: 1000.0
+        - passo: distância máxima percorrida numa transição, usada na heurística. Valor padrão: 1
+        - deslize: tuplo (p, q, r) com as probabilidades de deslize (ver ModeloPDMPlanEstoc), ou
+        None para transições deterministas. Valor padrão: None
+        - semente: semente da amostragem dos sucessores nas simulações. Valor padrão: None
+        """
+        self.__gama = gama
+        self.__epsilon = epsilon
+        self.__tempo_max = tempo_max
+        self.__actualizacoes_max = actualizacoes_max
+        self.__rmax = rmax
+        self.__passo = passo
+        self.__deslize = deslize
+        self.__semente = semente
+        self.__transicoes = None #tabela de transições do último modelo de planeamento (TransicoesPlan)
+        self.__anterior = None #último planeamento: (objetivos, MecRTDP)
+
+    def planear(self, modelo_plan, objectivos):
+        """
+        Gera um plano PDM parcial a partir do estado do agente
+
+        Parâmetros:
+        - modelo_plan: modelo de planeamento (ModeloPlan), com estados com posição
+        - objectivos: lista de estados objetivo
+
+        Retorno:
+        - PlanoRTDP: plano refinado em cada obtenção de uma ação
+
+        Funcionamento:
+        1. Constrói o modelo do PDM, reutilizando a tabela de transições se os estados válidos
+        não mudaram
+        2. Se a tabela foi reutilizada e apenas foram removidos objetivos (ex: alvo recolhido),
+        as utilidades do planeamento anterior continuam a não subestimar as utilidades ótimas
+        (remover objetivos não aumenta a utilidade de nenhum estado), sendo reutilizadas, exceto
+        as dos objetivos removidos (estados terminais, com utilidade 0, que passam a ter ações);
+        as etiquetas de estados resolvidos não são reutilizadas
+        3. Realiza as primeiras simulações a partir do estado do agente, dentro do orçamento
+        """
+        U_inicial = None
+        if self.__transicoes is None or not self.__transicoes.valida(modelo_plan):
+            self.__transicoes = TransicoesPlan(modelo_plan)
+        elif self.__anterior is not None:
+            objectivos_ant, mec_ant = self.__anterior
+            if set(objectivos) <= objectivos_ant:
+                removidos = objectivos_ant - set(objectivos)
+                U_inicial = {s: u for s, u in mec_ant.utilidade.items() if s not in removidos}
+        if self.__deslize is not None:
+            modelo_pdm = ModeloPDMPlanEstoc(modelo_plan, objectivos, *self.__deslize, rmax=self.__rmax,
+                                            transicoes=self.__transicoes)
+        else:
+            modelo_pdm = ModeloPDMPlan(modelo_plan, objectivos, self.__rmax, self.__transicoes)
+        mec_rtdp = MecRTDP(modelo_pdm, self.__gama, self.__heuristica(objectivos), self.__epsilon,
+                           self.__tempo_max, self.__actualizacoes_max, semente=self.__semente,
+                           U_inicial=U_inicial)
+        self.__anterior = (set(objectivos), mec_rtdp)
+        mec_rtdp.resolver(modelo_plan.obter_estado())
+        return PlanoRTDP(mec_rtdp)
+
+    def __heuristica(self, objectivos):
+        """
+        Heurística: limite superior da utilidade de cada estado, a partir da distância
+        euclidiana ao objetivo mais próximo (HeurDist)
+
+        Funcionamento:
+        - Cada transição percorre no máximo a distância `passo`, pelo que são necessárias pelo
+        menos k = ⌈d/passo⌉ transições para alcançar um objetivo à distância d; a recompensa
+        rmax é recebida na k-ésima transição e as restantes recompensas não são positivas, pelo
+        que U(s) ≤ γ^(k-1)·rmax (heurística admissível para a maximização da utilidade)
+        """
+        heuristicas = [HeurDist(objectivo) for objectivo in objectivos]
+        gama, rmax, passo = self.__gama, self.__rmax, self.__passo
+
+        def h(estado):
+            distancia = min(heuristica.h(estado) for heuristica in heuristicas)
+            k = max(1, math.ceil(distancia / passo - 1e-9))
+            return rmax * gama ** (k - 1)
+        return h
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do último cálculo de utilidades (EstatisticasUtil), ou None se ainda não
+        foi realizado nenhum planeamento
+        """
+        return self.__anterior[1].estatisticas if self.__anterior is not None else None
+
+    @property
+    def gama(self):
+        return self.__gama
+
+    @property
+    def epsilon(self):
+        return self.__epsilon
\ No newline at end of file
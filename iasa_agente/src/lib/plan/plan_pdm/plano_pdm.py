@@ -21,7 +21,7 @@ class PlanoPDM(Plano):
     - 16-plan-pdm.pdf, página 3: O plano é baseado em um modelo de PDM, que inclui estados,
     operadores, transições (T(s, a, s')) e recompensas (R(s, a, s'))
     """
-    def __init__(self, utilidade, politica):
+    def __init__(self, utilidade, politica, q = None):
         """
         Inicializa o plano PDM com a utilidade e a política fornecidas
 
@@ -29,6 +29,8 @@ class PlanoPDM(Plano):
         - utilidade: dicionário que associa cada estado ao seu valor de utilidade (U(s)),
         calculado pelo planeador PDM
         - politica: dicionário que associa cada estado à ação ótima (π(s)) a ser executada
+        - q: TabelaQ com os valores Q(s, a) a partir dos quais a política foi obtida, ou None;
+        permite consultar (ou mostrar) a utilidade de cada ação sem recalcular as utilidades
 
         Funcionamento:
         1. Armazena a `utilidade` e a `politica` como atributos privados para uso nos métodos
@@ -43,6 +45,7 @@ class PlanoPDM(Plano):
         """
         self.__utilidade = utilidade
         self.__politica = politica
+        self.__q = q
 
     def obter_accao(self, estado):
         """
@@ -87,4 +90,11 @@ class PlanoPDM(Plano):
     
     @property
     def politica(self):
-        return self.__politica
\ No newline at end of file
+        return self.__politica
+
+    @property
+    def q(self):
+        """
+        Valores Q(s, a) do plano (TabelaQ), ou None se o planeador não os indicou
+        """
+        return self.__q
\ No newline at end of file
@@ -0,0 +1,44 @@
+from plan.plan_pdm.plano_pdm import PlanoPDM
+
+class PlanoRTDP(PlanoPDM):
+    """
+    Plano PDM parcial, gerado por PlaneadorRTDP, que é refinado em cada consulta
+
+    A utilidade e a política são as do mecanismo de cálculo (MecRTDP), apenas nos estados
+    visitados pelas simulações. Em cada obtenção de uma ação, o mecanismo continua as simulações
+    a partir do estado atual do agente, dentro do orçamento definido (tempo ou número de
+    atualizações), antes de devolver a ação da política; o plano é assim refinado ao longo do
+    percurso, à medida que o agente se desloca, sem replaneamento
+
+    Fundamentação teórica:
+    - 13-arq-delib.pdf, páginas 14 e 15: os recursos computacionais disponíveis para o
+    raciocínio são limitados, num ambiente que pode mudar durante o raciocínio
+    - Barto, Bradtke e Singh (1995), "Learning to Act Using Real-Time Dynamic Programming":
+    a execução é intercalada com o cálculo da utilidade, a partir do estado atual
+    """
+    def __init__(self, mec_rtdp):
+        """
+        Inicializa o plano
+
+        Parâmetros:
+        - mec_rtdp: MecRTDP, cujas utilidades e política (atualizadas no local) são as do plano
+        """
+        super().__init__(mec_rtdp.utilidade, mec_rtdp.politica)
+        self.__mec_rtdp = mec_rtdp
+
+    def obter_accao(self, estado):
+        """
+        Obtém a ação a executar no estado, após refinar a política a partir desse estado
+
+        Retorno:
+        - Operador: ação da política no estado, ou None se o estado não tiver ações (objetivo)
+        """
+        self.__mec_rtdp.resolver(estado)
+        return super().obter_accao(estado)
+
+    @property
+    def estatisticas(self):
+        """
+        Estatísticas do último refinamento (EstatisticasUtil)
+        """
+        return self.__mec_rtdp.estatisticas
\ No newline at end of file
@@ -59,4 +59,18 @@ class HeurDist:
                 - Xobj, Yobj: coordenadas do estado objetivo
         """
         dist = math.dist(estado.posicao, self.__estado_final.posicao)
-        return dist
\ No newline at end of file
+        return dist
+
+    def inversa(self, estado_inicial):
+        """
+        Heurística de distância ao estado inicial, para a procura no sentido inverso
+        (ProcuraBidireccional); a distância euclidiana é simétrica, pelo que continua
+        admissível e consistente
+
+        Parâmetros:
+        - estado_inicial: estado que contém a posição inicial
+
+        Retorno:
+        - HeurDist: heurística de distância à posição inicial
+        """
+        return HeurDist(estado_inicial)
\ No newline at end of file
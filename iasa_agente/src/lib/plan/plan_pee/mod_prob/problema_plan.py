@@ -61,4 +61,12 @@ class ProblemaPlan(Problema):
         - 14-plan-pee.pdf, página 3: "A solução de um problema corresponde a [...] um percurso [...] que liga
           um estado inicial a um estado objetivo"
         """
-        return estado == self.__estado_final
\ No newline at end of file
+        return estado == self.__estado_final
+
+    @property
+    def estado_final(self):
+        """
+        Estado objetivo do problema, a partir do qual é realizada a procura
+        no sentido inverso, na procura bidirecional
+        """
+        return self.__estado_final
\ No newline at end of file
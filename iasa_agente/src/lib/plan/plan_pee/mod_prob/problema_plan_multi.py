@@ -0,0 +1,46 @@
+from mod.problema import Problema
+
+class ProblemaPlanMulti(Problema):
+    """
+    Problema de planeamento com vários estados objetivo, em que a solução é um percurso
+    do estado inicial até qualquer um deles
+
+    Com uma procura de custo uniforme, a primeira solução encontrada leva ao objetivo com
+    menor custo de percurso, e não ao objetivo mais próximo em linha reta
+
+    Atributos:
+    - __estados_finais: conjunto dos estados objetivo
+
+    Fundamentação teórica:
+    - 14-plan-pee.pdf, página 3: o problema de planeamento é definido pelo estado inicial,
+    pelos operadores e pelo objetivo, que pode ser um conjunto de estados
+    - 12-pee-3.pdf, página 19: a procura de custo uniforme expande os nós por ordem de custo,
+    pelo que o primeiro objetivo removido da fronteira é o de menor custo
+    """
+    def __init__(self, modelo_plan, estados_finais, estado_inicial = None):
+        """
+        Constrói o problema de planeamento
+
+        Parâmetros:
+        - modelo_plan: modelo de planeamento, que define os operadores
+        - estados_finais: estados objetivo
+        - estado_inicial: estado a partir do qual se planeia, por omissão o estado atual
+        do modelo (permite planear percursos entre objetivos)
+        """
+        if estado_inicial is None:
+            estado_inicial = modelo_plan.obter_estado()
+        super().__init__(estado_inicial, modelo_plan.obter_operadores())
+        self.__estados_finais = frozenset(estados_finais)
+
+    def objectivo(self, estado):
+        """
+        Determina se um estado é um dos estados objetivo do problema
+        """
+        return estado in self.__estados_finais
+
+    @property
+    def estados_finais(self):
+        """
+        Conjunto dos estados objetivo do problema
+        """
+        return self.__estados_finais
\ No newline at end of file
@@ -16,10 +16,14 @@ class PlaneadorPee(Planeador):
     é a mais eficiente para chegar a uma solução ótima
     - Todo o o código comportamental aqui implementado foi escrito com a ajuda do docente
     """
-    def __init__(self):
+    def __init__(self, mec_pee = None):
         """
         Inicializa o planeador com o mecanismo de procura A*
 
+        Parâmetros:
+        - mec_pee - mecanismo de procura informada a utilizar, por omissão ProcuraAA;
+        pode ser uma ProcuraBidireccional, visto que os operadores de movimento são reversíveis
+
         Atributos:
         - __mec_pee - mecanismo de procura A*
 
@@ -33,7 +37,7 @@ class PlaneadorPee(Planeador):
         PlaneadorPee precisa também de uma instância de ProcuraInformada, neste caso,
         ProcuraAA, que implementa o algoritmo A*
         """
-        self.__mec_pee = ProcuraAA()
+        self.__mec_pee = mec_pee if mec_pee is not None else ProcuraAA()
 
     def planear(self, modelo_plan, objetivos):
         """
@@ -50,7 +54,9 @@ class PlaneadorPee(Planeador):
         1. Obter o estado final a partir da lista de objetivos (primeiro estado objetivo)
         2. Criar um problema de planeamento com o modelo do mundo e o estado final
         3. Configurar heurística de distância para o estado objetivo
-        4. Utilizar o mecanismo de procura A* para encontrar a solução
+        4. Utilizar o mecanismo de procura A* para encontrar a solução; a procura
+        bidirecional obtém da heurística a distância ao estado inicial, para a procura
+        no sentido inverso
         5. Criar um plano a partir da solução encontrada
         6. Retornar o plano
 
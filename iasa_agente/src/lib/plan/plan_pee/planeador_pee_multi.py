@@ -0,0 +1,176 @@
+from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from plan.plan_pee.mod_prob.problema_plan_multi import ProblemaPlanMulti
+from plan.plan_pee.plano_pee import PlanoPEE
+from plan.planeador import Planeador
+
+class PlaneadorPeeMulti(Planeador):
+    """
+    Planeador que considera todos os objetivos numa única procura, em vez de planear
+    apenas para o primeiro objetivo da lista (objetivo mais próximo em linha reta), como
+    em PlaneadorPee
+
+    Tem dois modos de funcionamento:
+    - Por omissão, realiza uma procura de custo uniforme a partir do estado do agente,
+    que termina no primeiro objetivo alcançado, ou seja, no objetivo com menor custo de
+    percurso (ProblemaPlanMulti)
+    - Com ordenação de objetivos, calcula a tabela de custos dos percursos entre o agente
+    e todos os objetivos e entre cada par de objetivos (uma procura de custo uniforme a
+    partir de cada um, ver ProcuraCustoUnif.procurar_objectivos), e ordena os objetivos
+    com a heurística do vizinho mais próximo, melhorada com trocas 2-opt; o plano percorre
+    todos os objetivos por essa ordem
+
+    As procuras a partir de cada estado são guardadas enquanto os estados válidos do
+    modelo do mundo não mudarem, pelo que, após a recolha de um alvo, o replaneamento
+    reutiliza as procuras anteriores (o agente encontra-se no alvo recolhido, a partir
+    do qual já foi realizada uma procura)
+
+    Fundamentação teórica:
+    - 14-plan-pee.pdf, página 5: planeamento com base em procura em espaço de estados
+    - 12-pee-3.pdf, página 19: procura de custo uniforme
+    - Lin e Kernighan (1973), "An Effective Heuristic Algorithm for the Traveling-Salesman
+    Problem": heurística do vizinho mais próximo e melhoramento por trocas 2-opt
+    """
+    def __init__(self, ordenar_objectivos = False):
+        """
+        Inicializa o planeador
+
+        Parâmetros:
+        - ordenar_objectivos: se True, o plano percorre todos os objetivos, pela ordem
+        obtida com as heurísticas do vizinho mais próximo e 2-opt; caso contrário, o plano
+        leva apenas ao objetivo com menor custo de percurso
+
+        Atributos:
+        - __mec_pee: mecanismo de procura de custo uniforme
+        - __modelo_plan, __estados: modelo do mundo e estados válidos a que se referem as
+        procuras guardadas
+        - __procuras: para cada estado de origem, os objetivos procurados e as soluções
+        obtidas (ver __solucoes)
+        - __percurso: ordem dos objetivos do último plano
+        """
+        self.__mec_pee = ProcuraCustoUnif()
+        self.__ordenar_objectivos = ordenar_objectivos
+        self.__modelo_plan = None
+        self.__estados = None
+        self.__procuras = {}
+        self.__percurso = []
+
+    @property
+    def percurso(self):
+        """
+        Objetivos do último plano, pela ordem em que são alcançados
+        """
+        return self.__percurso
+
+    def planear(self, modelo_plan, objetivos):
+        """
+        Gera um plano a partir do estado do agente
+
+        Parâmetros:
+        - modelo_plan: modelo do mundo
+        - objetivos: estados objetivo
+
+        Retorno:
+        - PlanoPEE: plano até ao objetivo com menor custo de percurso ou, com ordenação de
+        objetivos, plano que percorre todos os objetivos alcançáveis; None se nenhum
+        objetivo for alcançável
+        """
+        if not self.__ordenar_objectivos:
+            solucao = self.__mec_pee.procurar(ProblemaPlanMulti(modelo_plan, objetivos))
+            if solucao is None:
+                self.__percurso = []
+                return None
+            self.__percurso = [solucao.estado_final]
+            return PlanoPEE(solucao)
+        estado = modelo_plan.obter_estado()
+        solucoes = self.__solucoes(modelo_plan, estado, objetivos)
+        objectivos = list(solucoes)
+        tabela = {objectivo: self.__solucoes(modelo_plan, objectivo, objectivos) for objectivo in objectivos}
+        tabela[estado] = solucoes
+        percurso = self.__ordenar(estado, objectivos, tabela)
+        self.__percurso = percurso[1:]
+        if not self.__percurso:
+            return None
+        passos = []
+        for origem, destino in zip(percurso, percurso[1:]):
+            passos.extend(tabela[origem][destino])
+        return PlanoPEE(passos)
+
+    def distancias(self, modelo_plan, objetivos):
+        """
+        Tabela de custos dos percursos ótimos do estado do agente até cada objetivo
+
+        Retorno:
+        - dict: custo do percurso para cada objetivo alcançável
+        """
+        solucoes = self.__solucoes(modelo_plan, modelo_plan.obter_estado(), objetivos)
+        return {objectivo: solucao.custo for objectivo, solucao in solucoes.items()}
+
+    def __solucoes(self, modelo_plan, origem, objectivos):
+        """
+        Soluções ótimas de um estado de origem para cada objetivo alcançável
+
+        Funcionamento:
+        - Se o modelo do mundo ou os seus estados válidos mudaram, as procuras guardadas
+        são descartadas
+        - Se já foi feita uma procura a partir da origem para um conjunto de objetivos que
+        contém os pedidos, as suas soluções são reutilizadas
+        - Caso contrário, é feita uma procura de custo uniforme a partir da origem até
+        todos os objetivos, que é guardada
+        """
+        estados = frozenset(modelo_plan.obter_estados())
+        if modelo_plan is not self.__modelo_plan or estados != self.__estados:
+            self.__modelo_plan = modelo_plan
+            self.__estados = estados
+            self.__procuras = {}
+        objectivos = set(objectivos)
+        procura = self.__procuras.get(origem)
+        if procura is None or not objectivos <= procura[0]:
+            problema = ProblemaPlanMulti(modelo_plan, objectivos, origem)
+            procura = (objectivos, self.__mec_pee.procurar_objectivos(problema, objectivos))
+            self.__procuras[origem] = procura
+        return {objectivo: solucao for objectivo, solucao in procura[1].items() if objectivo in objectivos}
+
+    def __ordenar(self, origem, objectivos, tabela):
+        """
+        Ordena os objetivos a percorrer a partir da origem, minimizando o custo total
+
+        Parâmetros:
+        - origem: estado inicial do percurso (fixo)
+        - objectivos: objetivos a percorrer
+        - tabela: soluções entre cada par de estados (tabela[a][b].custo)
+
+        Retorno:
+        - list: percurso, começando na origem
+
+        Funcionamento:
+        1. Vizinho mais próximo: a partir da origem, segue sempre para o objetivo por
+        visitar com menor custo
+        2. 2-opt: inverte um troço do percurso sempre que isso reduz o custo total, até
+        não haver melhoramentos; como os operadores são reversíveis e o custo de um
+        percurso é igual nos dois sentidos, só mudam os custos das ligações nos extremos
+        do troço (o percurso é aberto, sem regresso à origem)
+        """
+        def custo(a, b):
+            return tabela[a][b].custo
+
+        percurso = [origem]
+        por_visitar = set(objectivos)
+        while por_visitar:
+            seguinte = min(por_visitar, key=lambda objectivo: custo(percurso[-1], objectivo))
+            por_visitar.discard(seguinte)
+            percurso.append(seguinte)
+
+        melhorou = True
+        while melhorou:
+            melhorou = False
+            for i in range(1, len(percurso) - 1):
+                for j in range(i + 1, len(percurso)):
+                    anterior, inicio, fim = percurso[i - 1], percurso[i], percurso[j]
+                    variacao = custo(anterior, fim) - custo(anterior, inicio)
+                    if j + 1 < len(percurso):
+                        seguinte = percurso[j + 1]
+                        variacao += custo(inicio, seguinte) - custo(fim, seguinte)
+                    if variacao < -1e-9:
+                        percurso[i:j + 1] = percurso[i:j + 1][::-1]
+                        melhorou = True
+        return percurso
\ No newline at end of file
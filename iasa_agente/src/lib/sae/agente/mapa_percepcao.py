@@ -0,0 +1,101 @@
+"""
+Mapa do ambiente percebido
+"""
+
+from ..ambiente.elemento import Elemento
+
+#_______________________________________________________________________________
+
+class MapaPercepcao:
+    """
+    Vistas do ambiente percebido: posições sem obstáculo e
+    elementos relevantes (alvos e obstáculos)
+
+    O mapa é criado a partir de todos os elementos do ambiente
+    ou a partir do mapa anterior e das alterações entretanto
+    ocorridas; neste caso as vistas só são calculadas quando
+    consultadas, aplicando as alterações às vistas do mapa
+    anterior, em tempo proporcional ao número de alterações,
+    e as vistas que não mudam são partilhadas (o mesmo objecto)
+    """
+    RELEVANTES = (Elemento.ALVO, Elemento.OBSTACULO)
+
+    def __init__(self, elementos=None, anterior=None, alteracoes=None):
+        """
+        Criar mapa
+        @param elementos: dicionário <pos, elem> com todos os
+                          elementos do ambiente
+        @param anterior: mapa anterior (se elementos não for indicado)
+        @param alteracoes: dicionário <pos, elem> com as alterações
+                           ocorridas após o mapa anterior
+        """
+        self.__posicoes = None
+        self.__elementos = None
+        self.__anterior = None
+        self.__alteracoes = None
+        if elementos is not None:
+            self.__posicoes = [pos for pos, elem in elementos.items()
+                               if elem != Elemento.OBSTACULO]
+            self.__elementos = {pos: elem for pos, elem in elementos.items()
+                                if elem in self.RELEVANTES}
+        elif anterior.__anterior is not None:
+            # Mapa anterior não calculado: acumular as alterações
+            self.__anterior = anterior.__anterior
+            self.__alteracoes = {**anterior.__alteracoes, **alteracoes}
+        else:
+            self.__anterior = anterior
+            self.__alteracoes = alteracoes
+
+    @property
+    def posicoes(self):
+        """
+        Obter lista das posições sem obstáculo
+        """
+        self.__calcular()
+        return self.__posicoes
+
+    @property
+    def elementos(self):
+        """
+        Obter dicionário <pos, elem> com os alvos e obstáculos
+        """
+        self.__calcular()
+        return self.__elementos
+
+    def __calcular(self):
+        """
+        Calcular as vistas a partir das vistas do mapa anterior,
+        copiando-as apenas se as alterações as modificarem
+        """
+        if self.__anterior is None:
+            return
+        posicoes = self.__anterior.posicoes
+        elementos = self.__anterior.elementos
+        novos = {}
+        obstaculos = False
+        for pos, elem in self.__alteracoes.items():
+            antes = elementos.get(pos)
+            depois = elem if elem in self.RELEVANTES else None
+            if antes != depois:
+                novos[pos] = depois
+                obstaculos |= (antes == Elemento.OBSTACULO) != (depois == Elemento.OBSTACULO)
+        if novos:
+            elementos = dict(elementos)
+            for pos, elem in novos.items():
+                if elem is None:
+                    elementos.pop(pos, None)
+                else:
+                    elementos[pos] = elem
+        if obstaculos:
+            # Posições pela ordem das linhas do ambiente
+            livres = set(posicoes)
+            for pos, elem in novos.items():
+                if elem == Elemento.OBSTACULO:
+                    livres.discard(pos)
+                else:
+                    livres.add(pos)
+            posicoes = sorted(livres, key=lambda pos: (pos[1], pos[0]))
+        self.__posicoes = posicoes
+        self.__elementos = elementos
+        self.__anterior = None
+        self.__alteracoes = None
\ No newline at end of file
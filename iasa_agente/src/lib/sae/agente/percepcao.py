@@ -9,6 +9,7 @@ from ..ambiente.posicao import Posicao
 from ..ambiente.direccao import Direccao
 from ..ambiente.elemento import Elemento
 from .per_dir import PerDir
+from .mapa_percepcao import MapaPercepcao
 
 #_______________________________________________________________________________
 
@@ -21,14 +22,33 @@ class Percepcao:
     """Posição do agente"""
     direccao: Direccao
     """Direcção do agente"""
-    posicoes: list[Posicao]
-    """Posições do ambiente"""
-    elementos: dict[Posicao, Elemento]
-    """Elementos do ambiente"""
+    mapa: MapaPercepcao
+    """Mapa do ambiente percebido"""
     recolha: bool = False
     """Ocorreu uma recolha de alvo"""
     colisao: bool = False
     """Ocorreu colisão com obstáculo"""
+    versao: int = 0
+    """Versão dos elementos do ambiente percebidos"""
+    alteracoes: dict[Posicao, Elemento] | None = None
+    """Elementos das posições alteradas desde a percepção anterior,
+    None na primeira percepção (ou após o reinício do ambiente)"""
+
+    @property
+    def posicoes(self):
+        """
+        Posições do ambiente sem obstáculo
+        (partilhada entre percepções enquanto não mudar)
+        """
+        return self.mapa.posicoes
+
+    @property
+    def elementos(self):
+        """
+        Elementos do ambiente (alvos e obstáculos)
+        (partilhado entre percepções enquanto não mudar)
+        """
+        return self.mapa.elementos
         
     def __getitem__(self, direccao):
         """
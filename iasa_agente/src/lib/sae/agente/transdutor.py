@@ -5,7 +5,7 @@ Transdutor de percepção e actuação
 
 import math
 
-from ..ambiente.elemento import Elemento
+from .mapa_percepcao import MapaPercepcao
 from .percepcao import Percepcao
 
 #_______________________________________________________________________________
@@ -16,28 +16,38 @@ class Transdutor:
     """
     def iniciar(self, ambiente):
         self.__ambiente = ambiente
+        self.__versao = None
+        self.__mapa = None
 
     def percepcionar(self):
         """
         Percepcionar ambiente
+        O mapa percebido só é construído a partir de todos os
+        elementos do ambiente na primeira percepção (ou após
+        o reinício do ambiente); nas seguintes, é obtido a
+        partir do mapa anterior e das alterações do ambiente
+        desde a percepção anterior
         @return: percepção
         """
-        items_ambiente = self.__ambiente.elementos.items()
+        versao = self.__ambiente.versao
+        alteracoes = self.__ambiente.alteracoes(self.__versao)
 
-        posicoes = [pos for pos, elem in items_ambiente
-                    if elem != Elemento.OBSTACULO]
-
-        elementos = {pos: elem for pos, elem in items_ambiente
-                     if elem in [Elemento.ALVO, Elemento.OBSTACULO]}
+        if alteracoes is None:
+            self.__mapa = MapaPercepcao(self.__ambiente.elementos)
+        elif alteracoes:
+            self.__mapa = MapaPercepcao(anterior=self.__mapa,
+                                        alteracoes=alteracoes)
+        self.__versao = versao
 
         return Percepcao(
 					self.__ambiente.per_dir,
 					self.__ambiente.posicao_agente,
 					self.__ambiente.direccao_agente,
-					posicoes,
-					elementos,
+					self.__mapa,
 					self.__ambiente.recolha,
-					self.__ambiente.colisao
+					self.__ambiente.colisao,
+					versao,
+					alteracoes
 				)
 
     def actuar(self, accao):
@@ -4,9 +4,12 @@ Simulação de ambiente
 """
 
 import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
 
 from .direccao import Direccao
 from .elemento import Elemento
+from .grelha import Grelha
 
 #__________________________________________________
 
@@ -14,6 +17,10 @@ class Ambiente:
 	"""
 	Simulação do ambiente
 	"""	
+
+	# Número máximo de alterações registadas
+	MAX_REGISTO = 1024
+
 	def __init__(self, def_amb):
 		"""
 		Criar ambiente
@@ -29,13 +36,18 @@ class Ambiente:
 		self._colisao = False
 		self._recolha = False
 		self._per_dir = None
+		self._versao = 0
+		self._registo = None
+		self._ocupadas_linha = None
+		self._ocupadas_coluna = None
 		self.iniciar()
 		
 	@property
 	def elementos(self):
 		"""
 		Obter dicionário <pos, elem> com todos os 
-		elementos do ambiente
+		elementos do ambiente (vista só de leitura
+		da grelha do ambiente, Grelha)
 		"""
 		return self._elementos
 		
@@ -90,28 +102,59 @@ class Ambiente:
 		"""
 		return self._per_dir
 
+	@property
+	def versao(self):
+		"""
+		Obter versão dos elementos do ambiente,
+		incrementada em cada alteração de uma posição
+		"""
+		return self._versao
+
+	def alteracoes(self, versao):
+		"""
+		Obter alterações dos elementos do ambiente
+		posteriores a uma versão, em tempo proporcional
+		ao número de alterações
+		São registadas apenas as últimas MAX_REGISTO alterações
+		@param versao: versão de referência
+		@return: dicionário <pos, elem> com o elemento actual
+			     das posições alteradas, ou None se a versão
+			     for anterior ao último início do ambiente ou
+			     às alterações registadas
+		"""
+		if versao is None or not self._versao - len(self._registo) <= versao <= self._versao:
+			return None
+		return {self._registo[i]: self._elementos[self._registo[i]]
+				for i in range(versao - self._versao, 0)}
+
 	def iniciar(self):
 		"""
 		Iniciar elementos do ambiente
 		"""
-		self._elementos = {}
-		y = 0
-		for linha in self.__def_amb:
-			x = 0
-			for codigo_elem in linha:
-				elem = Elemento(codigo_elem)
-				posicao = (x, y)
-				self._elementos[posicao] = elem
-				if elem == Elemento.AGENTE:
-					self._posicao_agente = posicao
-					self._direccao_agente = Direccao.ESTE
-					self._colisao = False
-				x += 1
-			y += 1
+		self._elementos = Grelha(self.__def_amb)
+		agentes = self._elementos.posicoes(Elemento.AGENTE)
+		if agentes:
+			self._posicao_agente = agentes[-1]
+			self._direccao_agente = Direccao.ESTE
+			self._colisao = False
 		# Definir dimensões do ambiente
 		self._dim_x = len(self.__def_amb[0])
-		self._dim_y = y
+		self._dim_y = len(self.__def_amb)
 		self._dist_max = max(self._dim_x, self._dim_y)
+		# Nova versão, sem alterações registadas
+		self._versao += 1
+		self._registo = deque(maxlen=self.MAX_REGISTO)
+		# Índice das posições ocupadas (não vazias) por linha e coluna
+		# (as posições não definidas são obstáculos, ver elemento)
+		vazio = Grelha.CODIGOS[Elemento.VAZIO]
+		self._ocupadas_linha = []
+		self._ocupadas_coluna = [[] for _ in range(self._dim_x)]
+		for y_ocup in range(self._dim_y):
+			linha = self._elementos.linha(y_ocup)[:self._dim_x]
+			ocupadas = [x_ocup for x_ocup, codigo in enumerate(linha) if codigo != vazio]
+			self._ocupadas_linha.append(ocupadas)
+			for x_ocup in ocupadas:
+				self._ocupadas_coluna[x_ocup].append(y_ocup)
 		# Actualizar percepção direccional
 		self.detectar_dir()
 			   
@@ -120,9 +163,7 @@ class Ambiente:
 		Obter posições dos elementos do ambiente
 		@param tipo: tipo dos elementos a obter posição
 		"""
-		return [elem.posicao
-				for elem in self._elementos
-				if tipo is None or elem == tipo]
+		return self._elementos.posicoes(tipo)
 			   
 	def elemento(self, posicao):
 		"""
@@ -132,6 +173,40 @@ class Ambiente:
 		"""
 		return self._elementos.get(posicao, Elemento.OBSTACULO)
 	
+	def alterar_elemento(self, posicao, elem):
+		"""
+		Alterar elemento de uma posição, registando
+		a alteração numa nova versão
+		@param posicao: posição a alterar
+		@param elem: novo elemento
+		"""
+		self._elementos.alterar(posicao, elem)
+		self._registo.append(posicao)
+		self._versao += 1
+		self.actualizar_indice(posicao)
+
+	def actualizar_indice(self, posicao):
+		"""
+		Actualizar o índice das posições ocupadas (não vazias)
+		de cada linha e coluna, listas ordenadas de coordenadas
+		usadas na detecção direccional
+		@param posicao: posição cujo elemento foi alterado
+		"""
+		x, y = posicao
+		if not (0 <= x < self._dim_x and 0 <= y < self._dim_y):
+			return
+		linha = self._ocupadas_linha[y]
+		coluna = self._ocupadas_coluna[x]
+		i = bisect_left(linha, x)
+		indexada = i < len(linha) and linha[i] == x
+		ocupada = self.elemento(posicao) != Elemento.VAZIO
+		if ocupada and not indexada:
+			linha.insert(i, x)
+			insort(coluna, y)
+		elif indexada and not ocupada:
+			del linha[i]
+			del coluna[bisect_left(coluna, y)]
+
 	def limitar_coord(self, coord, coord_min, coord_max):
 		return min(coord_max, max(coord_min, coord))
 			
@@ -149,8 +224,8 @@ class Ambiente:
 		self._colisao = self.verificar_colisao(nova_posicao)
 		if not self._colisao:
 			self._recolha = self.verificar_recolha(nova_posicao)
-			self._elementos[self._posicao_agente] = Elemento.VAZIO
-			self._elementos[nova_posicao] = Elemento.AGENTE
+			self.alterar_elemento(self._posicao_agente, Elemento.VAZIO)
+			self.alterar_elemento(nova_posicao, Elemento.AGENTE)
 			self._posicao_agente = nova_posicao
 		else:
 			self._recolha = False
@@ -201,8 +276,39 @@ class Ambiente:
 		"""
 		Detectar elemento numa direcção de movimento
 		a partir da posição do agente
+		A posição ocupada mais próxima é obtida por procura
+		binária no índice de posições ocupadas da linha ou
+		coluna do agente, com o mesmo resultado de
+		detectar_percurso
+		@param direccao: direccão da detecção
+		@return: elemento, distância, posição
+		"""
+		x, y = self._posicao_agente
+		if not (0 <= x < self._dim_x and 0 <= y < self._dim_y):
+			return self.detectar_percurso(direccao)
+		dx = round(math.cos(direccao.value))
+		if dx != 0:
+			ocupadas, coord, limite, passo = self._ocupadas_linha[y], x, self._dim_x - 1, dx
+		else:
+			ocupadas, coord, limite, passo = self._ocupadas_coluna[x], y, self._dim_y - 1, -round(math.sin(direccao.value))
+		if passo > 0:
+			i = bisect_right(ocupadas, coord)
+			destino = ocupadas[i] if i < len(ocupadas) else limite
+		else:
+			i = bisect_left(ocupadas, coord)
+			destino = ocupadas[i - 1] if i > 0 else 0
+		if destino == coord: # Limite do ambiente
+			return None, 0, self._posicao_agente
+		posicao = (destino, y) if dx != 0 else (x, destino)
+		return self.elemento(posicao), abs(destino - coord), posicao
+
+	def detectar_percurso(self, direccao):
+		"""
+		Detectar elemento numa direcção de movimento
+		a partir da posição do agente, percorrendo as
+		posições uma a uma (referência para detectar)
 		@param direccao: direccão da detecção
-		@return: elemento, distância
+		@return: elemento, distância, posição
 		"""
 		posicao = self._posicao_agente
 		distancia = 0
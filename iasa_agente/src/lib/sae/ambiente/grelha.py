@@ -0,0 +1,190 @@
+"""
+Grelha de elementos do ambiente
+"""
+
+from collections.abc import ItemsView, Mapping, ValuesView
+
+from .elemento import Elemento
+
+#__________________________________________________
+
+class Grelha(Mapping):
+	"""
+	Elementos do ambiente guardados numa grelha compacta
+	(bytearray), com um código inteiro por posição, pela
+	ordem das linhas (índice y * largura + x)
+
+	A grelha é uma vista só de leitura compatível com o
+	dicionário <pos, elem> (Mapping), com as posições
+	definidas pela ordem das linhas; as posições não
+	definidas (linhas mais curtas que a maior linha) não
+	pertencem à grelha
+	"""
+	AUSENTE = 0
+	"""Código das posições não definidas"""
+	ELEMENTOS = (None,) + tuple(Elemento)
+	"""Elemento de cada código"""
+	CODIGOS = {elem: codigo for codigo, elem in enumerate(ELEMENTOS) if elem}
+	"""Código de cada elemento"""
+
+	def __init__(self, def_amb):
+		"""
+		Criar grelha
+		@param def_amb: definição do ambiente (lista de linhas
+		                com um carácter por elemento)
+		"""
+		self.__largura = max((len(linha) for linha in def_amb), default=0)
+		self.__altura = len(def_amb)
+		self.__celulas = bytearray(self.__largura * self.__altura)
+		tabela = bytearray(256)
+		for elem, codigo in self.CODIGOS.items():
+			tabela[ord(elem.value)] = codigo
+		for y, linha in enumerate(def_amb):
+			codigos = linha.encode("latin-1").translate(tabela)
+			if self.AUSENTE in codigos:
+				# Carácter inválido: mesmo erro de Elemento(carácter)
+				Elemento(linha[codigos.index(self.AUSENTE)])
+			inicio = y * self.__largura
+			self.__celulas[inicio:inicio + len(codigos)] = codigos
+
+	@property
+	def largura(self):
+		"""
+		Obter largura da grelha (maior linha)
+		"""
+		return self.__largura
+
+	@property
+	def altura(self):
+		"""
+		Obter altura da grelha (número de linhas)
+		"""
+		return self.__altura
+
+	def __indice(self, posicao):
+		"""
+		Índice de uma posição na grelha, ou None se
+		estiver fora dos limites da grelha
+		"""
+		x, y = posicao
+		if 0 <= x < self.__largura and 0 <= y < self.__altura:
+			return y * self.__largura + x
+		return None
+
+	def __getitem__(self, posicao):
+		indice = self.__indice(posicao)
+		if indice is None or not self.__celulas[indice]:
+			raise KeyError(posicao)
+		return self.ELEMENTOS[self.__celulas[indice]]
+
+	def get(self, posicao, omissao=None):
+		indice = self.__indice(posicao)
+		if indice is None or not self.__celulas[indice]:
+			return omissao
+		return self.ELEMENTOS[self.__celulas[indice]]
+
+	def __contains__(self, posicao):
+		indice = self.__indice(posicao)
+		return indice is not None and self.__celulas[indice] != self.AUSENTE
+
+	def __iter__(self):
+		largura = self.__largura
+		for indice, codigo in enumerate(self.__celulas):
+			if codigo:
+				yield divmod(indice, largura)[::-1]
+
+	def __len__(self):
+		return len(self.__celulas) - self.__celulas.count(self.AUSENTE)
+
+	def items(self):
+		return _ItensGrelha(self)
+
+	def values(self):
+		return _ValoresGrelha(self)
+
+	def itens(self):
+		"""
+		Iterar pares (pos, elem) pela ordem das linhas
+		"""
+		largura, elementos = self.__largura, self.ELEMENTOS
+		for indice, codigo in enumerate(self.__celulas):
+			if codigo:
+				y, x = divmod(indice, largura)
+				yield (x, y), elementos[codigo]
+
+	def contem_elemento(self, elem):
+		"""
+		Verificar se algum elemento da grelha é do tipo indicado
+		@param elem: tipo de elemento
+		"""
+		return self.CODIGOS[elem] in self.__celulas
+
+	def alterar(self, posicao, elem):
+		"""
+		Alterar elemento de uma posição
+		@param posicao: posição da grelha
+		@param elem: novo elemento
+		"""
+		indice = self.__indice(posicao)
+		if indice is None:
+			raise KeyError(posicao)
+		self.__celulas[indice] = self.CODIGOS[elem]
+
+	def posicoes(self, elem=None):
+		"""
+		Obter posições dos elementos de um tipo
+		@param elem: tipo de elemento (None: todas as posições)
+		@return: lista de posições, pela ordem das linhas
+		"""
+		if elem is None:
+			return list(self)
+		codigo = bytes([self.CODIGOS[elem]])
+		largura, celulas = self.__largura, self.__celulas
+		posicoes = []
+		indice = celulas.find(codigo)
+		while indice >= 0:
+			y, x = divmod(indice, largura)
+			posicoes.append((x, y))
+			indice = celulas.find(codigo, indice + 1)
+		return posicoes
+
+	def linha(self, y):
+		"""
+		Obter códigos dos elementos de uma linha
+		@param y: coordenada da linha
+		@return: bytes com um código por posição
+		"""
+		inicio = y * self.__largura
+		return bytes(self.__celulas[inicio:inicio + self.__largura])
+
+	def mascara_livres(self):
+		"""
+		Obter máscara das posições livres (definidas e
+		sem obstáculo), pela ordem das linhas
+		@return: bytearray com 1 nas posições livres e 0
+		         nas restantes
+		"""
+		tabela = bytearray(256)
+		for elem, codigo in self.CODIGOS.items():
+			tabela[codigo] = elem != Elemento.OBSTACULO
+		return self.__celulas.translate(tabela)
+
+#__________________________________________________
+
+class _ItensGrelha(ItemsView):
+	"""
+	Vista dos pares (pos, elem) da grelha
+	"""
+	def __iter__(self):
+		return self._mapping.itens()
+
+class _ValoresGrelha(ValuesView):
+	"""
+	Vista dos elementos da grelha
+	"""
+	def __iter__(self):
+		for _, elem in self._mapping.itens():
+			yield elem
+
+	def __contains__(self, elem):
+		return elem in Grelha.CODIGOS and self._mapping.contem_elemento(elem)
\ No newline at end of file
@@ -0,0 +1,824 @@
+import gc
+import random
+import time
+import tracemalloc
+
+from agente.controlo_delib.controlo_delib import ControloDelib
+from agente.controlo_delib.mec_delib import MecDelib
+from agente.controlo_delib.modelo.modelo_mundo import ModeloMundo
+from modelo.heuristica_contagem import HeuristicaContagem
+from modelo.problema_contagem import ProblemaContagem
+from pdm.actualizacao import Actualizacao
+from pdm.metodo_pdm import MetodoPDM
+from pdm.pdm import PDM
+from pdm.poda import Poda
+from pee.bidir.procura_bidir import ProcuraBidireccional
+from pee.larg.procura_larg import ProcuraLargura
+from pee.larg.procura_larg_compacta import ProcuraLarguraCompacta
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.procura_aa import ProcuraAA
+from pee.melhor_prim.procura_aa_compacta import ProcuraAACompacta
+from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.mem_lim.procura_idaa import ProcuraIDAA
+from pee.mem_lim.procura_smaa import ProcuraSMAA
+from pee.prof.procura_prof_iter import ProcuraProfIter
+from pee.prof.procura_prof_lim import ProcuraProfLim
+from plan.plan_incr.planeador_dlite import PlaneadorDLite
+from plan.plan_pdm.modelo.modelo_pdm_plan import ModeloPDMPlan
+from plan.plan_pdm.modelo.modelo_pdm_plan_estoc import ModeloPDMPlanEstoc
+from plan.plan_pdm.modelo.transicoes_plan import TransicoesPlan
+from plan.plan_pdm.planeador_pdm import PlaneadorPDM
+from plan.plan_pdm.planeador_rtdp import PlaneadorRTDP
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from plan.plan_pee.planeador_pee import PlaneadorPee
+from plan.plan_pee.planeador_pee_multi import PlaneadorPeeMulti
+from sae.agente.accao import Accao
+from sae.agente.mapa_percepcao import MapaPercepcao
+from sae.agente.transdutor import Transdutor
+from sae.ambiente.ambiente import Ambiente
+from sae.ambiente.direccao import Direccao
+from sae.ambiente.elemento import Elemento
+from sae.defamb import DEF_AMB
+
+# ---------------------------------------
+# Testes de desempenho dos mecanismos de procura
+#
+# Executar a partir de iasa_agente/src, com as pastas src, src/lib e
+# src/contagem no PYTHONPATH (tal como para contagem.py e teste_delib.py)
+#
+# Cada medição mostra o tempo de procura, a dimensão da solução e os
+# contadores de nós do mecanismo de procura
+# ---------------------------------------
+
+def medir(nome, mec_proc, problema, *args):
+    """
+    Executa uma procura e mostra o tempo e os contadores de nós
+
+    Parâmetros:
+    - nome: descrição da medição
+    - mec_proc: mecanismo de procura a utilizar
+    - problema: problema a resolver
+    - args: argumentos adicionais do método procurar (ex: heurística)
+
+    Retorno:
+    - Solucao: solução encontrada, ou None
+    """
+    inicio = time.perf_counter()
+    solucao = mec_proc.procurar(problema, *args)
+    tempo = time.perf_counter() - inicio
+    dimensao = solucao.dimensao if solucao else None
+    print(f"{nome:<40} tempo: {tempo * 1000:9.1f} ms | dimensão: {dimensao} | "
+          f"nós processados: {mec_proc.nos_processados} | "
+          f"nós expandidos: {mec_proc.estatisticas.nos_expandidos} | nós memória: {mec_proc.nos_memoria} | "
+          f"nós repetidos: {mec_proc.nos_repetidos}")
+    return solucao
+
+def verificar_nos_memoria(mec_proc, problema, *args):
+    """
+    Executa uma procura em grafo verificando, após cada expansão, que o número de nós em
+    memória é o número de nós distintos guardados na fronteira (incluindo as entradas
+    obsoletas) e no índice de explorados, sem contar duas vezes os nós abertos
+
+    Parâmetros:
+    - mec_proc: mecanismo de procura em grafo (ProcuraGrafo) com fronteira de prioridade
+    - problema: problema a resolver
+    - args: argumentos adicionais do método procurar (ex: heurística)
+    """
+    nos_em_memoria = mec_proc._nos_em_memoria
+    def verificar():
+        nos = nos_em_memoria()
+        distintos = {id(entrada[-1]) for entrada in mec_proc._fronteira._nos}
+        distintos.update(id(no) for no in mec_proc._explorados.values())
+        assert nos == len(distintos), f"{nos} nós em memória, {len(distintos)} nós distintos"
+        return nos
+    mec_proc._nos_em_memoria = verificar
+    try:
+        mec_proc.procurar(problema, *args)
+    finally:
+        del mec_proc._nos_em_memoria
+
+def medir_memoria(nome, mec_proc, problema, *args):
+    """
+    Executa uma procura e mostra o pico de memória alocada durante a procura,
+    obtido com o módulo tracemalloc
+
+    Parâmetros:
+    - nome: descrição da medição
+    - mec_proc: mecanismo de procura a utilizar
+    - problema: problema a resolver
+    - args: argumentos adicionais do método procurar (ex: heurística)
+
+    Retorno:
+    - int: pico de memória, em bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    solucao = mec_proc.procurar(problema, *args)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    dimensao = solucao.dimensao if solucao else None
+    print(f"{nome:<40} pico de memória: {pico / 1024:9.0f} KiB | dimensão: {dimensao} | "
+          f"nós processados: {mec_proc.nos_processados}")
+    return pico
+
+def obter_modelo_mundo(num_amb):
+    """
+    Cria um modelo do mundo atualizado com a perceção inicial de um ambiente
+    """
+    transdutor = Transdutor()
+    transdutor.iniciar(Ambiente(DEF_AMB[num_amb]))
+    modelo_mundo = ModeloMundo()
+    modelo_mundo.actualizar(transdutor.percepcionar())
+    return modelo_mundo
+
+def obter_estado_final(modelo_mundo, distancia):
+    """
+    Obtém um estado cujo percurso ótimo a partir do agente tem uma dada dimensão,
+    de modo a limitar a profundidade das procuras não informadas
+    """
+    x, y = modelo_mundo.obter_estado().posicao
+    for estado in modelo_mundo.obter_estados():
+        xe, ye = estado.posicao
+        if abs(xe - x) + abs(ye - y) == distancia:
+            solucao = ProcuraAA().procurar(ProblemaPlan(modelo_mundo, estado), HeurDist(estado))
+            if solucao and solucao.dimensao == distancia:
+                return estado
+
+def obter_estado_mais_afastado(modelo_mundo, alcancavel = False):
+    """
+    Obtém o estado com maior distância de Manhattan à posição do agente, considerando
+    opcionalmente apenas os estados alcançáveis a partir do estado do agente
+    """
+    estados = modelo_mundo.obter_estados()
+    if alcancavel:
+        estados = {modelo_mundo.obter_estado()}
+        por_visitar = list(estados)
+        while por_visitar:
+            estado = por_visitar.pop()
+            for operador in modelo_mundo.obter_operadores():
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is not None and estado_suc not in estados:
+                    estados.add(estado_suc)
+                    por_visitar.append(estado_suc)
+    x, y = modelo_mundo.obter_estado().posicao
+    return max(estados, key=lambda estado: abs(estado.posicao[0] - x) + abs(estado.posicao[1] - y))
+
+def testar_fronteiras():
+    """
+    Procuras em largura e em profundidade, cujo tempo é dominado pelas operações
+    de inserção e remoção das fronteiras FIFO e LIFO
+    """
+    print("--- Procura não informada: ProblemaContagem ---")
+    problema = ProblemaContagem(0, 60, [5, 1, 6, 9, 6])
+    medir("ProcuraLargura", ProcuraLargura(), problema)
+    medir("ProcuraProfLim (prof_max=7)", ProcuraProfLim(7), problema)
+    medir("ProcuraProfIter", ProcuraProfIter(), problema)
+
+    print("--- Procura não informada: DEF_AMB ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        estado_final = obter_estado_final(modelo_mundo, 5)
+        if estado_final is None:
+            continue
+        problema = ProblemaPlan(modelo_mundo, estado_final)
+        medir(f"ProcuraLargura (amb. {num_amb})", ProcuraLargura(), problema)
+        medir(f"ProcuraProfIter (amb. {num_amb})", ProcuraProfIter(), problema)
+
+def testar_procura_grafo():
+    """
+    Procuras melhor-primeiro, em que os nós obsoletos (substituídos na fronteira por
+    um nó de menor custo para o mesmo estado) são descartados sem serem expandidos,
+    sendo contabilizados nos nós repetidos; verificação de que os nós em memória são os nós
+    distintos guardados (ver verificar_nos_memoria)
+    """
+    print("--- Procura melhor-primeiro: ProblemaContagem ---")
+    problema = ProblemaContagem(0, 100, [5, 1, 6, 9, 6])
+    medir("ProcuraCustoUnif", ProcuraCustoUnif(), problema)
+    medir("ProcuraAA", ProcuraAA(), problema, HeuristicaContagem(100))
+    verificar_nos_memoria(ProcuraCustoUnif(), problema)
+    verificar_nos_memoria(ProcuraAA(), problema, HeuristicaContagem(100))
+
+    print("--- Procura melhor-primeiro: DEF_AMB ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        estado_final = obter_estado_final(modelo_mundo, 15)
+        if estado_final is None:
+            continue
+        problema = ProblemaPlan(modelo_mundo, estado_final)
+        medir(f"ProcuraCustoUnif (amb. {num_amb})", ProcuraCustoUnif(), problema)
+        medir(f"ProcuraAA (amb. {num_amb})", ProcuraAA(), problema, HeurDist(estado_final))
+        verificar_nos_memoria(ProcuraCustoUnif(), problema)
+        verificar_nos_memoria(ProcuraAA(), problema, HeurDist(estado_final))
+
+def testar_desempate():
+    """
+    Procura A* no ambiente 4 (30x30) com cada critério de desempate entre nós
+    com o mesmo f(n), para o estado mais afastado do agente
+    """
+    print("--- Desempate em A*: ambiente 4 ---")
+    modelo_mundo = obter_modelo_mundo(4)
+    estado_final = obter_estado_mais_afastado(modelo_mundo)
+    problema = ProblemaPlan(modelo_mundo, estado_final)
+    for desempate in Desempate:
+        medir(f"ProcuraAA ({desempate.name})", ProcuraAA(desempate), problema, HeurDist(estado_final))
+
+def testar_memoria():
+    """
+    Pico de memória das procuras em largura e A* com objetos No e com a reserva
+    compacta de nós (ReservaNos)
+    """
+    print("--- Memória: ProcuraLargura, ProblemaContagem ---")
+    problema = ProblemaContagem(0, 60, [5, 1, 6, 9, 6])
+    pico = medir_memoria("ProcuraLargura", ProcuraLargura(), problema)
+    pico_compacta = medir_memoria("ProcuraLarguraCompacta", ProcuraLarguraCompacta(), problema)
+    print(f"redução: {pico / pico_compacta:.1f}x")
+
+    print("--- Memória: ProcuraAA, ProblemaContagem ---")
+    problema = ProblemaContagem(0, 20000, [5, 1, 6, 9, 6])
+    pico = medir_memoria("ProcuraAA", ProcuraAA(), problema, HeuristicaContagem(20000))
+    pico_compacta = medir_memoria("ProcuraAACompacta", ProcuraAACompacta(), problema,
+                                  HeuristicaContagem(20000))
+    print(f"redução: {pico / pico_compacta:.1f}x")
+
+def testar_bidireccional():
+    """
+    Procuras unidirecionais e bidirecionais (custo uniforme e A*) nos ambientes
+    6 e 7, para o estado alcançável mais afastado do agente e para o estado mais
+    afastado (no ambiente 6 não é alcançável, o que a procura inversa deteta ao
+    esgotar a zona isolada em que se encontra)
+    """
+    for num_amb, alcancavel in ((6, True), (7, True), (6, False)):
+        print(f"--- Procura bidirecional: ambiente {num_amb} ---")
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        estado_final = obter_estado_mais_afastado(modelo_mundo, alcancavel)
+        problema = ProblemaPlan(modelo_mundo, estado_final)
+        heuristica = HeurDist(estado_final)
+        medir("ProcuraCustoUnif", ProcuraCustoUnif(), problema)
+        medir("ProcuraBidireccional (custo uniforme)", ProcuraBidireccional(), problema)
+        medir("ProcuraAA", ProcuraAA(), problema, heuristica)
+        medir("ProcuraBidireccional (A*)", ProcuraBidireccional(), problema, heuristica)
+
+def testar_memoria_limitada():
+    """
+    Procuras A*, IDA* e SMA* nos ambientes 2 e 3, para o estado alcançável mais
+    afastado do agente. O SMA* é executado com limites de nós em memória cada vez
+    menores, o que mostra o custo, em nós expandidos (regenerações incluídas), de
+    reduzir a memória abaixo da utilizada pelo A*
+    """
+    for num_amb in (2, 3):
+        print(f"--- Memória limitada: ambiente {num_amb} ---")
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        estado_final = obter_estado_mais_afastado(modelo_mundo, True)
+        problema = ProblemaPlan(modelo_mundo, estado_final)
+        heuristica = HeurDist(estado_final)
+        medir("ProcuraAA", ProcuraAA(), problema, heuristica)
+        medir("ProcuraIDAA", ProcuraIDAA(), problema, heuristica)
+        for limite_nos in (60, 40):
+            medir(f"ProcuraSMAA (limite_nos={limite_nos})", ProcuraSMAA(limite_nos), problema, heuristica)
+
+def testar_prof_iter():
+    """
+    Procura em profundidade iterativa com e sem procura incremental (retomada a partir
+    dos nós cortados na iteração anterior) e tabela de transposição, mostrando os nós
+    expandidos em cada iteração
+    """
+    modelo_mundo = obter_modelo_mundo(4)
+    problemas = (("ProblemaContagem", ProblemaContagem(0, 60, [5, 1, 6, 9, 6])),
+                 ("ambiente 4", ProblemaPlan(modelo_mundo, obter_estado_final(modelo_mundo, 8))))
+    for nome, problema in problemas:
+        print(f"--- Procura em profundidade iterativa: {nome} ---")
+        for incremental in (False, True):
+            for tabela_transp in (False, True):
+                mec_proc = ProcuraProfIter(incremental=incremental, tabela_transp=tabela_transp)
+                medir(f"ProcuraProfIter (inc.={incremental}, tabela={tabela_transp})", mec_proc, problema)
+                print("  nós expandidos por iteração:",
+                      [estatisticas.nos_expandidos for estatisticas in mec_proc.estatisticas_iteracoes])
+
+def testar_replaneamento(passos_max = 100):
+    """
+    Replaneamento em cada passo do agente nos ambientes 1 e 4, com PlaneadorPee (procura
+    A* desde o início em cada passo) e PlaneadorDLite (reparação incremental), até o agente
+    recolher todos os alvos ou executar passos_max passos, mostrando a latência de planeamento
+    """
+    for num_amb in (1, 4):
+        print(f"--- Replaneamento em cada passo: ambiente {num_amb} ---")
+        for planeador in (PlaneadorPee(), PlaneadorDLite()):
+            ambiente = Ambiente(DEF_AMB[num_amb])
+            transdutor = Transdutor()
+            transdutor.iniciar(ambiente)
+            modelo_mundo = ModeloMundo()
+            mec_delib = MecDelib(modelo_mundo)
+            tempos = []
+            while Elemento.ALVO in ambiente.elementos.values() and len(tempos) < passos_max:
+                modelo_mundo.actualizar(transdutor.percepcionar())
+                objectivos = mec_delib.deliberar()
+                inicio = time.perf_counter()
+                plano = planeador.planear(modelo_mundo, objectivos)
+                tempos.append(time.perf_counter() - inicio)
+                transdutor.actuar(plano.obter_accao(modelo_mundo.obter_estado()).accao)
+            tempos.sort()
+            print(f"{type(planeador).__name__:<40} passos: {len(tempos)} | tempo total: {sum(tempos):6.2f} s | "
+                  f"mediana: {tempos[len(tempos) // 2] * 1000:7.2f} ms | máximo: {tempos[-1] * 1000:7.1f} ms")
+
+class PlaneadorCronometrado:
+    """
+    Planeador que delega noutro planeador, registando o tempo de cada planeamento
+    """
+    def __init__(self, planeador):
+        self.planeador = planeador
+        self.tempos = []
+
+    def planear(self, modelo_plan, objetivos):
+        inicio = time.perf_counter()
+        plano = self.planeador.planear(modelo_plan, objetivos)
+        self.tempos.append(time.perf_counter() - inicio)
+        return plano
+
+def testar_multi_objectivo(passos_max = 1000):
+    """
+    Agente deliberativo (ControloDelib) nos ambientes 1 e 3 até recolher todos os alvos,
+    com PlaneadorPee (objetivo mais próximo em linha reta), PlaneadorPeeMulti (objetivo
+    com menor custo de percurso) e PlaneadorPeeMulti com ordenação de todos os objetivos,
+    mostrando o número de passos e o tempo de planeamento
+    """
+    for num_amb in (1, 3):
+        print(f"--- Planeamento com vários objetivos: ambiente {num_amb} ---")
+        for nome, planeador in (("PlaneadorPee", PlaneadorPee()),
+                                ("PlaneadorPeeMulti", PlaneadorPeeMulti()),
+                                ("PlaneadorPeeMulti (ordenar)", PlaneadorPeeMulti(ordenar_objectivos=True))):
+            ambiente = Ambiente(DEF_AMB[num_amb])
+            transdutor = Transdutor()
+            transdutor.iniciar(ambiente)
+            planeador = PlaneadorCronometrado(planeador)
+            controlo = ControloDelib(planeador)
+            passos = 0
+            while Elemento.ALVO in ambiente.elementos.values() and passos < passos_max:
+                transdutor.actuar(controlo.processar(transdutor.percepcionar()))
+                passos += 1
+            print(f"{nome:<40} passos: {passos} | planeamentos: {len(planeador.tempos)} | "
+                  f"tempo total: {sum(planeador.tempos):6.2f} s | primeiro: {planeador.tempos[0] * 1000:7.1f} ms")
+
+def testar_pdm(gama = 0.85, delta_max = 1.0):
+    """
+    Resolução do PDM do planeador (ModeloPDMPlan) em todos os ambientes, com o cálculo em
+    Python sobre o modelo (MecUtil) e com o modelo compilado (MecUtilVect), verificando que
+    as utilidades e as políticas são iguais; o tempo de construção do modelo é mostrado à parte
+    """
+    print("--- Resolução do PDM: MecUtil vs modelo compilado ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        inicio = time.perf_counter()
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, MecDelib(modelo_mundo).deliberar())
+        tempo_modelo = time.perf_counter() - inicio
+        resultados = []
+        for vectorizado in (False, True):
+            inicio = time.perf_counter()
+            resultados.extend(PDM(modelo_pdm, gama, delta_max, vectorizado).resolver())
+            resultados.append(time.perf_counter() - inicio)
+        utilidade, politica, tempo, utilidade_vect, politica_vect, tempo_vect = resultados
+        assert utilidade == utilidade_vect and politica == politica_vect, \
+            f"ambiente {num_amb}: resultados do modelo compilado diferentes"
+        print(f"ambiente {num_amb} | estados: {len(utilidade):5} | modelo: {tempo_modelo * 1000:7.1f} ms | "
+              f"MecUtil: {tempo * 1000:7.1f} ms | compilado: {tempo_vect * 1000:6.1f} ms")
+
+def testar_actualizacao(gama = 0.85, delta_max = 1.0):
+    """
+    Iteração de valor no PDM do planeador (ModeloPDMPlan) em todos os ambientes, com cada
+    esquema de atualização das utilidades (Actualizacao), mostrando o número de iterações,
+    de atualizações de Bellman e o tempo de convergência
+    """
+    print("--- Esquemas de atualização da iteração de valor ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, MecDelib(modelo_mundo).deliberar())
+        for actualizacao in Actualizacao:
+            pdm = PDM(modelo_pdm, gama, delta_max, actualizacao=actualizacao)
+            pdm.resolver()
+            estatisticas = pdm.estatisticas
+            print(f"ambiente {num_amb} | {actualizacao.name:<12} | iterações: {estatisticas.iteracoes:3} | "
+                  f"atualizações: {estatisticas.actualizacoes:6} | tempo: {estatisticas.tempo_total * 1000:7.1f} ms")
+
+def testar_iteracao_politica(gama = 0.85, delta_max = 1.0, avaliacoes = 5):
+    """
+    Resolução do PDM do planeador (ModeloPDMPlan) em todos os ambientes, com Iteração de Valor
+    (modelo compilado), Iteração de Política e Iteração de Política Modificada, mostrando o
+    número de iterações, o tempo de cálculo e a diferença máxima de utilidade em relação à
+    Iteração de Política (utilidades exatas)
+    """
+    print("--- Iteração de valor vs iteração de política ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, MecDelib(modelo_mundo).deliberar())
+        resultados = []
+        for metodo in (MetodoPDM.ITERACAO_POLITICA, MetodoPDM.ITERACAO_VALOR, MetodoPDM.ITERACAO_POLITICA_MOD):
+            pdm = PDM(modelo_pdm, gama, delta_max, True, metodo=metodo, avaliacoes=avaliacoes)
+            utilidade, _ = pdm.resolver()
+            resultados.append((metodo, utilidade, pdm.estatisticas))
+        utilidade_exata = resultados[0][1]
+        for metodo, utilidade, estatisticas in resultados:
+            erro = max(abs(utilidade[s] - utilidade_exata[s]) for s in utilidade)
+            print(f"ambiente {num_amb} | {metodo.name:<21} | iterações: {estatisticas.iteracoes:3} | "
+                  f"tempo: {estatisticas.tempo_total * 1000:7.1f} ms | erro máximo: {erro:6.3f}")
+
+def testar_transicoes_plan(gama = 0.85, delta_max = 1.0):
+    """
+    Construção da tabela de transições (TransicoesPlan) e planeamento com PlaneadorPDM em
+    todos os ambientes: verificação de que o sucessor de cada par (estado, operador) na tabela é
+    o estado obtido aplicando o operador, tempo de construção da tabela e tempo de cada
+    planeamento seguinte, em que a tabela é reutilizada (apenas mudam os objetivos)
+    """
+    print("--- Tabela de transições do PDM do planeador ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        inicio = time.perf_counter()
+        transicoes = TransicoesPlan(modelo_mundo)
+        tempo_tabela = time.perf_counter() - inicio
+        assert all(transicoes.sucessor(s, operador) == operador.aplicar(s)
+                   for s in modelo_mundo.obter_estados() for operador in modelo_mundo.obter_operadores()), \
+            f"ambiente {num_amb}: tabela de transições diferente dos operadores"
+        planeador = PlaneadorPDM(gama, delta_max)
+        planeador.planear(modelo_mundo, objectivos)
+        inicio = time.perf_counter()
+        planeador.planear(modelo_mundo, objectivos[1:] or objectivos)
+        tempo_plano = time.perf_counter() - inicio
+        print(f"ambiente {num_amb} | estados: {len(modelo_mundo.obter_estados()):5} | "
+              f"tabela: {tempo_tabela * 1000:6.1f} ms | planeamento com a tabela reutilizada: {tempo_plano * 1000:6.1f} ms")
+
+def testar_reutilizacao_pdm(passos_max = 1000):
+    """
+    Agente deliberativo (ControloDelib) com PlaneadorPDM nos ambientes 1 e 3 até recolher
+    todos os alvos, calculando a utilidade em cada replaneamento a partir de 0 ou a partir
+    das utilidades do planeamento anterior, com atualização síncrona (modelo compilado) e
+    por prioridades, mostrando as iterações, as atualizações e o tempo de cálculo da utilidade
+    nos replaneamentos (sem o primeiro planeamento)
+    """
+    print("--- PlaneadorPDM: utilidades nulas vs utilidades anteriores ---")
+    for num_amb in (1, 3):
+        for nome, opcoes in (("JACOBI (compilado)", {}),
+                             ("PRIORIDADE", {"actualizacao": Actualizacao.PRIORIDADE})):
+            for reutilizar in (False, True):
+                ambiente = Ambiente(DEF_AMB[num_amb])
+                transdutor = Transdutor()
+                transdutor.iniciar(ambiente)
+                planeador = PlaneadorPDM(reutilizar=reutilizar, **opcoes)
+                estatisticas = []
+                controlo = ControloDelib(planeador)
+                passos = 0
+                while Elemento.ALVO in ambiente.elementos.values() and passos < passos_max:
+                    transdutor.actuar(controlo.processar(transdutor.percepcionar()))
+                    if planeador.estatisticas is not None and (not estatisticas or planeador.estatisticas is not estatisticas[-1]):
+                        estatisticas.append(planeador.estatisticas)
+                    passos += 1
+                replaneamentos = estatisticas[1:]
+                print(f"ambiente {num_amb} | {nome:<18} | reutilizar: {reutilizar!s:<5} | passos: {passos} | "
+                      f"replaneamentos: {len(replaneamentos)} | "
+                      f"iterações: {sum(e.iteracoes for e in replaneamentos):4} | "
+                      f"atualizações: {sum(e.actualizacoes for e in replaneamentos):6} | "
+                      f"tempo: {sum(e.tempo_total for e in replaneamentos) * 1000:7.1f} ms")
+
+def testar_pdm_estocastico(gama = 0.95, delta_max = 0.01, deslize = (0.8, 0.1, 0.0), custo_passo = 1.0):
+    """
+    PDM com transições estocásticas (ModeloPDMPlanEstoc) em todos os ambientes: tempo de
+    construção do modelo e tempo de resolução com MecUtil, com o modelo compilado (MecUtilVect)
+    e por Iteração de Política (MecPol)
+    """
+    print(f"--- PDM estocástico (p, q, r) = {deslize}, custo por passo {custo_passo} ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        inicio = time.perf_counter()
+        modelo = ModeloPDMPlanEstoc(modelo_mundo, objectivos, *deslize, custo_passo=custo_passo)
+        tempo_modelo = time.perf_counter() - inicio
+        tempos = []
+        for opcoes in ({}, {"vectorizado": True}, {"metodo": MetodoPDM.ITERACAO_POLITICA}):
+            inicio = time.perf_counter()
+            PDM(modelo, gama, delta_max, **opcoes).resolver()
+            tempos.append(time.perf_counter() - inicio)
+        print(f"ambiente {num_amb} | estados: {len(modelo_mundo.obter_estados()):5} | "
+              f"modelo: {tempo_modelo * 1000:6.1f} ms | MecUtil: {tempos[0] * 1000:7.1f} ms | "
+              f"MecUtilVect: {tempos[1] * 1000:6.1f} ms | MecPol: {tempos[2] * 1000:6.1f} ms")
+
+def testar_rtdp(gama = 0.95):
+    """
+    Primeiro planeamento com PlaneadorPDM e com PlaneadorRTDP (sem limite de tempo, até o
+    estado do agente ficar resolvido) em todos os ambientes: tempo, número de estados com
+    utilidade calculada e utilidade do estado do agente
+    """
+    print("--- PlaneadorPDM vs PlaneadorRTDP (LRTDP) ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        estado = modelo_mundo.obter_estado()
+        resultados = []
+        for planeador in (PlaneadorPDM(gama), PlaneadorRTDP(gama, tempo_max=None, semente=0)):
+            inicio = time.perf_counter()
+            plano = planeador.planear(modelo_mundo, objectivos)
+            resultados.append((time.perf_counter() - inicio, len(plano.utilidade), plano.utilidade[estado]))
+        print(f"ambiente {num_amb} | " + " | ".join(
+            f"{nome}: {tempo * 1000:6.1f} ms, {estados:4} estados, U = {utilidade:7.2f}"
+            for nome, (tempo, estados, utilidade) in zip(("PDM", "RTDP"), resultados)))
+
+def testar_poda_pdm(gama = 0.85, delta_max = 1.0):
+    """
+    Resolução do PDM do planeador (MecUtil) sem poda e com cada uma das podas em todos os
+    ambientes: estados podados, tempo de resolução (incluindo a poda) e atualizações de Bellman
+    """
+    print("--- Poda dos estados do PDM (MecUtil) ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, objectivos)
+        for poda in Poda:
+            pdm = PDM(modelo_pdm, gama, delta_max, poda=poda)
+            inicio = time.perf_counter()
+            pdm.resolver(estado=modelo_mundo.obter_estado())
+            tempo = time.perf_counter() - inicio
+            print(f"ambiente {num_amb} | {poda.name:<22} | estados: {len(modelo_mundo.obter_estados()):5} | "
+                  f"podados: {pdm.estatisticas.estados_podados:4} | tempo: {tempo * 1000:7.1f} ms | "
+                  f"atualizações: {pdm.estatisticas.actualizacoes:6}")
+
+def testar_convergencia(gama = 0.95, delta_max = 0.01, tempo_max = 0.1, caminho = None):
+    """
+    Cálculo da utilidade com MecUtil em todos os ambientes, sem limite de tempo e limitado a
+    tempo_max (por omissão, a duração de um passo do simulador, TEMPO_PASSO): iterações, delta
+    da última iteração, convergência, tempo da utilidade e da política, e delta a cada 10
+    iterações sem limite de tempo; com caminho, o registo do último ambiente é exportado em CSV
+
+    Com limite, verificação de que o tempo total de resolver (utilidade e política) não excede
+    tempo_max mais a duração de uma iteração
+    """
+    print("--- Convergência da iteração de valor (MecUtil) ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, MecDelib(modelo_mundo).deliberar())
+        for limite in (None, tempo_max):
+            pdm = PDM(modelo_pdm, gama, delta_max)
+            inicio = time.perf_counter()
+            pdm.resolver(tempo_max=limite)
+            tempo = time.perf_counter() - inicio
+            estatisticas = pdm.estatisticas
+            if limite is not None:
+                tempos = [0] + [t for _, _, t in pdm.traco.iteracoes]
+                iteracao_max = max(fim - inicio for inicio, fim in zip(tempos, tempos[1:]))
+                assert tempo <= limite + iteracao_max, \
+                    f"ambiente {num_amb}: resolver excedeu o limite ({tempo * 1000:.1f} ms)"
+            print(f"ambiente {num_amb} | limite: {limite if limite is not None else '-':>4} | "
+                  f"iterações: {estatisticas.iteracoes:4} | delta: {pdm.traco.iteracoes[-1][1]:9.4f} | "
+                  f"convergiu: {estatisticas.convergiu!s:<5} | utilidade: {estatisticas.tempo_total * 1000:7.1f} ms | "
+                  f"política: {estatisticas.tempo_politica * 1000:5.1f} ms | total: {tempo * 1000:7.1f} ms")
+            if limite is None:
+                print("    delta: " + " ".join(f"{delta:.3g}" for _, delta, _ in pdm.traco.iteracoes[::10]))
+    if caminho is not None:
+        pdm.traco.exportar_csv(caminho)
+
+def testar_modelo_mundo(repeticoes = 3):
+    """
+    Consultas de pertença ao modelo do mundo (índice de posições livres) em todos os
+    ambientes: verificação de que o destino de todos os operadores em todos os estados pertence
+    ao modelo se e só se pertence à lista de estados, tempo dessa verificação com `in` sobre o
+    modelo e sobre a lista (procura linear, como antes do índice), e tempo de um planeamento com PlaneadorPee (melhor de `repeticoes`)
+    """
+    print("--- Pertença de estados ao modelo do mundo ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        estados = modelo_mundo.obter_estados()
+        destinos = [operador.destino(s) for s in estados for operador in modelo_mundo.obter_operadores()]
+        inicio = time.perf_counter()
+        validos = sum(1 for s in destinos if s in modelo_mundo)
+        tempo_indice = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        validos_lista = sum(1 for s in destinos if s in estados)
+        tempo_lista = time.perf_counter() - inicio
+        assert validos == validos_lista, f"ambiente {num_amb}: pertença ao modelo diferente da lista de estados"
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            PlaneadorPee().planear(modelo_mundo, objectivos)
+            tempos.append(time.perf_counter() - inicio)
+        print(f"ambiente {num_amb} | estados: {len(estados):5} | destinos válidos: {validos:5}/{len(destinos):5} | "
+              f"índice: {tempo_indice * 1000:6.1f} ms | lista: {tempo_lista * 1000:7.1f} ms | "
+              f"planeamento (PlaneadorPee): {min(tempos) * 1000:6.1f} ms")
+
+def testar_estados_partilhados(repeticoes = 5):
+    """
+    Estados do agente partilhados (uma instância de EstadoAgente por posição) em todos os
+    ambientes: verificação de que o modelo do mundo e os operadores devolvem os mesmos objetos,
+    e tempo (melhor de `repeticoes`) da construção da tabela de transições, de um planeamento
+    com PlaneadorPee e de um planeamento com PlaneadorPDM, dominados pela criação de estados e
+    por operações de hash e igualdade em dicionários e conjuntos
+    """
+    print("--- Estados do agente partilhados ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()
+        assert all(estado_suc is operador.destino(s)
+                   for s in modelo_mundo.obter_estados() for operador, estado_suc in modelo_mundo.vizinhos(s)), \
+            f"ambiente {num_amb}: estados do modelo e dos operadores não partilhados"
+        tempos = {}
+        for nome, funcao in (("tabela", lambda: TransicoesPlan(modelo_mundo)),
+                             ("PlaneadorPee", lambda: PlaneadorPee().planear(modelo_mundo, objectivos)),
+                             ("PlaneadorPDM", lambda: PlaneadorPDM().planear(modelo_mundo, objectivos))):
+            medicoes = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                funcao()
+                medicoes.append(time.perf_counter() - inicio)
+            tempos[nome] = min(medicoes)
+        print(f"ambiente {num_amb} | " +
+              " | ".join(f"{nome}: {tempo * 1000:6.1f} ms" for nome, tempo in tempos.items()))
+
+def testar_percepcao(passos = 1000, semente = 0, prob_aleatorio = 0.2):
+    """
+    Percepção com alterações (MapaPercepcao) em todos os ambientes, com o agente controlado
+    por ControloDelib (PlaneadorPee), que recolhe os alvos, e com movimentos aleatórios em
+    parte dos passos, sendo o ambiente reiniciado a meio: verificação, em cada passo, de que as vistas da percepção são iguais às construídas
+    a partir de todos os elementos do ambiente, tempo médio por passo da percepção e da
+    atualização do modelo do mundo, e tempo médio da construção das vistas completas (como
+    antes das alterações), que é proporcional à dimensão do ambiente
+    """
+    print("--- Percepção com alterações ---")
+    direccoes = list(Direccao)
+    aleatorio = random.Random(semente)
+    for num_amb in DEF_AMB:
+        ambiente = Ambiente(DEF_AMB[num_amb])
+        transdutor = Transdutor()
+        transdutor.iniciar(ambiente)
+        modelo_mundo = ModeloMundo()
+        percepcao = transdutor.percepcionar()
+        modelo_mundo.actualizar(percepcao)
+        controlo = ControloDelib(PlaneadorPee())
+        tempo, tempo_completo, alterados = 0, 0, 0
+        for passo in range(passos):
+            if passo == passos // 2:
+                ambiente.iniciar()
+            accao = controlo.processar(percepcao)
+            if accao is None or aleatorio.random() < prob_aleatorio:
+                accao = Accao(aleatorio.choice(direccoes))
+            transdutor.actuar(accao)
+            inicio = time.perf_counter()
+            percepcao = transdutor.percepcionar()
+            modelo_mundo.actualizar(percepcao)
+            tempo += time.perf_counter() - inicio
+            alterados += modelo_mundo.alterado
+            inicio = time.perf_counter()
+            completo = MapaPercepcao(ambiente.elementos)
+            completo.posicoes, completo.elementos
+            tempo_completo += time.perf_counter() - inicio
+            assert percepcao.posicoes == completo.posicoes
+            assert percepcao.elementos == completo.elementos
+        print(f"ambiente {num_amb} | posições: {len(ambiente.elementos):5} | modelo alterado: {alterados:3}/{passos} | "
+              f"percepção e atualização: {tempo / passos * 1e6:7.1f} µs/passo | "
+              f"vistas completas: {tempo_completo / passos * 1e6:7.1f} µs/passo")
+
+def testar_detectar(repeticoes = 3):
+    """
+    Deteção direcional do ambiente (Ambiente.detectar) em todos os ambientes, com o agente em
+    cada posição sem obstáculo: verificação de que o índice de posições ocupadas dá o mesmo
+    resultado do percurso posição a posição (detectar_percurso), e tempo médio por posição
+    (as quatro direções, melhor de `repeticoes`) de cada um
+    """
+    print("--- Deteção direcional do ambiente ---")
+    for num_amb in DEF_AMB:
+        ambiente = Ambiente(DEF_AMB[num_amb])
+        posicoes = [posicao for posicao, elemento in ambiente.elementos.items() if elemento != Elemento.OBSTACULO]
+        tempos = {}
+        for detectar in (ambiente.detectar, ambiente.detectar_percurso):
+            medicoes = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                for posicao in posicoes:
+                    ambiente._posicao_agente = posicao
+                    for direccao in Direccao:
+                        detectar(direccao)
+                medicoes.append(time.perf_counter() - inicio)
+            tempos[detectar.__name__] = min(medicoes) / len(posicoes)
+        for posicao in posicoes:
+            ambiente._posicao_agente = posicao
+            assert all(ambiente.detectar(direccao) == ambiente.detectar_percurso(direccao) for direccao in Direccao), \
+                f"ambiente {num_amb}: deteção diferente na posição {posicao}"
+        print(f"ambiente {num_amb} | posições: {len(posicoes):5} | " +
+              " | ".join(f"{nome}: {tempo * 1e6:6.1f} µs/posição" for nome, tempo in tempos.items()))
+
+def gerar_def_amb(dimensao, prob_obstaculo = 0.2, alvos = 10, semente = 0):
+    """
+    Gera a definição de um ambiente quadrado (lista de linhas, como em DEF_AMB), com
+    obstáculos aleatórios, o agente no canto superior esquerdo e alvos em posições aleatórias
+    """
+    aleatorio = random.Random(semente)
+    celulas = [[Elemento.OBSTACULO.value if aleatorio.random() < prob_obstaculo else Elemento.VAZIO.value
+                for _ in range(dimensao)] for _ in range(dimensao)]
+    for _ in range(alvos):
+        celulas[aleatorio.randrange(dimensao)][aleatorio.randrange(dimensao)] = Elemento.ALVO.value
+    celulas[0][0] = Elemento.AGENTE.value
+    return ["".join(linha) for linha in celulas]
+
+def testar_grelha(dimensoes = (100, 300, 1000), passos = 1000):
+    """
+    Grelha compacta do ambiente (Grelha) em ambientes gerados de dimensões crescentes: memória
+    e tempo de criação do ambiente, comparados com um dicionário <pos, elem> (como antes da
+    grelha), verificando que a grelha tem os mesmos pares pela mesma ordem, tempo de uma consulta de elemento, da máscara de posições livres e da primeira
+    perceção, e tempo médio por passo do agente (movimento, deteção direcional e perceção)
+    """
+    print("--- Grelha compacta do ambiente ---")
+    direccoes = list(Direccao)
+    for dimensao in dimensoes:
+        def_amb = gerar_def_amb(dimensao)
+        gc.collect()
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        dicionario = {(x, y): Elemento(codigo) for y, linha in enumerate(def_amb) for x, codigo in enumerate(linha)}
+        tempo_dicionario = time.perf_counter() - inicio
+        memoria_dicionario = tracemalloc.get_traced_memory()[0]
+        memoria_base = memoria_dicionario
+        inicio = time.perf_counter()
+        ambiente = Ambiente(def_amb)
+        tempo_ambiente = time.perf_counter() - inicio
+        memoria_grelha = tracemalloc.get_traced_memory()[0] - memoria_base
+        tracemalloc.stop()
+        assert list(ambiente.elementos.items()) == list(dicionario.items()), f"{dimensao}x{dimensao}: grelha diferente"
+        del dicionario
+        posicoes = list(ambiente.elementos)[::max(1, dimensao * dimensao // 10000)]
+        inicio = time.perf_counter()
+        for posicao in posicoes:
+            ambiente.elemento(posicao)
+        tempo_consulta = (time.perf_counter() - inicio) / len(posicoes)
+        inicio = time.perf_counter()
+        livres = sum(ambiente.elementos.mascara_livres())
+        tempo_mascara = time.perf_counter() - inicio
+        transdutor = Transdutor()
+        transdutor.iniciar(ambiente)
+        inicio = time.perf_counter()
+        transdutor.percepcionar().elementos
+        tempo_percepcao = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for passo in range(passos):
+            transdutor.actuar(Accao(direccoes[passo % len(direccoes)]))
+            transdutor.percepcionar().elementos
+        tempo_passo = (time.perf_counter() - inicio) / passos
+        print(f"{dimensao}x{dimensao} | dicionário: {memoria_dicionario / 2**20:7.1f} MiB, {tempo_dicionario * 1000:7.1f} ms | "
+              f"ambiente: {memoria_grelha / 2**20:6.1f} MiB, {tempo_ambiente * 1000:6.1f} ms | "
+              f"consulta: {tempo_consulta * 1e6:4.2f} µs | livres: {livres:7} em {tempo_mascara * 1000:5.1f} ms | "
+              f"1ª perceção: {tempo_percepcao * 1000:6.1f} ms | passo: {tempo_passo * 1e6:6.1f} µs")
+
+def testar_tabela_q(gama = 0.85, delta_max = 1.0):
+    """
+    Obtenção da política a partir da tabela Q da última iteração (PDM.resolver) e por recálculo
+    a partir das utilidades (PDM.politica), com MecUtil e MecUtilVect em todos os ambientes:
+    verificação de que as utilidades devolvidas são o máximo dos valores da tabela e de que a
+    política é a da tabela, número de estados em que a política recalculada é diferente (estados
+    cujos sucessores mudaram de utilidade na última iteração), tempo de cada uma e tempo de consultar a ação de maior valor
+    de todos os estados na tabela (ex: PlanoPDM.q)
+    """
+    print("--- Política a partir da tabela Q ---")
+    for num_amb in DEF_AMB:
+        modelo_mundo = obter_modelo_mundo(num_amb)
+        modelo_pdm = ModeloPDMPlan(modelo_mundo, MecDelib(modelo_mundo).deliberar())
+        for vectorizado in (False, True):
+            pdm = PDM(modelo_pdm, gama, delta_max, vectorizado)
+            utilidade, politica = pdm.resolver()
+            tempo_tabela = pdm.estatisticas.tempo_politica
+            tabela_q = pdm.tabela_q
+            assert tabela_q is pdm.tabela_q and politica == tabela_q.politica()
+            assert all(utilidade[s] == max(tabela_q.valores(s).values()) for s in politica), \
+                f"ambiente {num_amb}: utilidades diferentes do máximo da tabela Q"
+            inicio = time.perf_counter()
+            recalculada = pdm.politica(utilidade)
+            tempo_recalculo = time.perf_counter() - inicio
+            diferentes = sum(politica[s] != accao for s, accao in recalculada.items())
+            inicio = time.perf_counter()
+            for s in politica:
+                pdm.tabela_q.melhor_accao(s)
+            tempo_consulta = time.perf_counter() - inicio
+            print(f"ambiente {num_amb} | {'MecUtilVect' if vectorizado else 'MecUtil':<11} | "
+                  f"tabela Q: {tempo_tabela * 1000:6.1f} ms | recálculo: {tempo_recalculo * 1000:6.1f} ms | "
+                  f"diferentes: {diferentes:3} | "
+                  f"consulta: {tempo_consulta * 1000:6.1f} ms")
+
+if __name__ == "__main__":
+    testar_fronteiras()
+    testar_procura_grafo()
+    testar_desempate()
+    testar_memoria()
+    testar_bidireccional()
+    testar_memoria_limitada()
+    testar_prof_iter()
+    testar_replaneamento()
+    testar_multi_objectivo()
+    testar_pdm()
+    testar_actualizacao()
+    testar_iteracao_politica()
+    testar_transicoes_plan()
+    testar_reutilizacao_pdm()
+    testar_pdm_estocastico()
+    testar_rtdp()
+    testar_poda_pdm()
+    testar_convergencia()
+    testar_tabela_q()
+    testar_modelo_mundo()
+    testar_estados_partilhados()
+    testar_percepcao()
+    testar_detectar()
+    testar_grelha()
\ No newline at end of file